@@ -15,7 +15,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 # Import models and settings
 from app.core.config import settings
 from app.variables.database import Base
-from app.models import User, Room, Booking
+from app.models import User, Room, Booking, BookingConflict, BookingTombstone, BookingHold, EquipmentType, DataVersion
 
 # this is the Alembic Config object
 config = context.config
@@ -0,0 +1,58 @@
+"""PostgreSQL slot range - tsrange column and approved-overlap exclusion constraint
+
+Revision ID: 002_booking_slot_range
+Revises: 001_initial
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '002_booking_slot_range'
+down_revision = '001_initial'
+branch_labels = None
+depends_on = None
+
+
+def _approved_label(bind) -> str:
+    # 001_initial labels bookingstatusenum by value ('Approved'), while
+    # create_all uses member names ('APPROVED'); match this database's type
+    label = bind.execute(sa.text(
+        "SELECT e.enumlabel FROM pg_enum e JOIN pg_type t ON t.oid = e.enumtypid "
+        "WHERE t.typname = 'bookingstatusenum' AND e.enumlabel IN ('APPROVED', 'Approved')"
+    )).scalar()
+    return label or 'APPROVED'
+
+
+def upgrade() -> None:
+    # PostgreSQL only - other dialects keep the portable overlap query
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql':
+        return
+
+    # btree_gist lets the exclusion constraint compare room_id with =
+    op.execute('CREATE EXTENSION IF NOT EXISTS btree_gist')
+
+    op.execute(
+        "ALTER TABLE bookings ADD COLUMN IF NOT EXISTS slot tsrange "
+        "GENERATED ALWAYS AS (tsrange(date + start_time, date + end_time, '[)')) STORED"
+    )
+
+    # Backed by a partial GiST index on (room_id, slot) that also serves && lookups.
+    # Deferred so conflicts can be cancelled and the override approved in one transaction.
+    # Fails if approved overlaps already exist; resolve them before upgrading.
+    op.execute(
+        "ALTER TABLE bookings ADD CONSTRAINT excl_booking_approved_overlap "
+        "EXCLUDE USING gist (room_id WITH =, slot WITH &&) "
+        f"WHERE (status = '{_approved_label(bind)}') "
+        "DEFERRABLE INITIALLY DEFERRED"
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute('ALTER TABLE bookings DROP CONSTRAINT IF EXISTS excl_booking_approved_overlap')
+    op.execute('ALTER TABLE bookings DROP COLUMN IF EXISTS slot')
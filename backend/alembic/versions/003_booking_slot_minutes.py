@@ -0,0 +1,115 @@
+"""Integer minute-of-day slot columns and covering index for approved bookings
+
+Revision ID: 003_booking_slot_minutes
+Revises: 002_booking_slot_range
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '003_booking_slot_minutes'
+down_revision = '002_booking_slot_range'
+branch_labels = None
+depends_on = None
+
+BACKFILL_BATCH_SIZE = 1000
+
+
+def _approved_label(bind) -> str:
+    # Same lookup as 002: 001_initial labels bookingstatusenum by value
+    # ('Approved'), create_all by member name ('APPROVED')
+    label = bind.execute(sa.text(
+        "SELECT e.enumlabel FROM pg_enum e JOIN pg_type t ON t.oid = e.enumtypid "
+        "WHERE t.typname = 'bookingstatusenum' AND e.enumlabel IN ('APPROVED', 'Approved')"
+    )).scalar()
+    return label or 'APPROVED'
+
+
+def _to_minutes(value) -> int:
+    # SQLite hands TIME columns back as 'HH:MM:SS' strings, MySQL as timedelta
+    if isinstance(value, str):
+        hours, minutes = value.split(':')[:2]
+        return int(hours) * 60 + int(minutes)
+    if hasattr(value, 'total_seconds'):
+        return int(value.total_seconds()) // 60
+    return value.hour * 60 + value.minute
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+
+    op.add_column('bookings', sa.Column('start_min', sa.SmallInteger(), nullable=True))
+    op.add_column('bookings', sa.Column('end_min', sa.SmallInteger(), nullable=True))
+
+    # Backfill in batches from the existing time columns, paging by id so
+    # only one batch is held in memory
+    bookings = sa.table(
+        'bookings',
+        sa.column('id', sa.String),
+        sa.column('start_time', sa.Time),
+        sa.column('end_time', sa.Time),
+        sa.column('start_min', sa.SmallInteger),
+        sa.column('end_min', sa.SmallInteger),
+    )
+    page = sa.text(
+        'SELECT id, start_time, end_time FROM bookings WHERE id > :last ORDER BY id LIMIT :n'
+    )
+    last_id = ''
+    while True:
+        batch = bind.execute(page, {'last': last_id, 'n': BACKFILL_BATCH_SIZE}).fetchall()
+        if not batch:
+            break
+        bind.execute(
+            bookings.update()
+            .where(bookings.c.id == sa.bindparam('b_id'))
+            .values(start_min=sa.bindparam('b_start_min'), end_min=sa.bindparam('b_end_min')),
+            [
+                {
+                    'b_id': row.id,
+                    'b_start_min': _to_minutes(row.start_time),
+                    'b_end_min': _to_minutes(row.end_time),
+                }
+                for row in batch
+            ]
+        )
+        last_id = batch[-1].id
+
+    with op.batch_alter_table('bookings') as batch_op:
+        batch_op.alter_column('start_min', existing_type=sa.SmallInteger(), nullable=False)
+        batch_op.alter_column('end_min', existing_type=sa.SmallInteger(), nullable=False)
+
+    if bind.dialect.name == 'mysql':
+        # No partial indexes; InnoDB appends the primary key, keeping it covering
+        op.create_index(
+            'idx_booking_slot_status',
+            'bookings',
+            ['room_id', 'date', 'status', 'start_min', 'end_min']
+        )
+    elif bind.dialect.name == 'postgresql':
+        op.create_index(
+            'idx_booking_slot_approved',
+            'bookings',
+            ['room_id', 'date', 'start_min', 'end_min', 'id', 'status'],
+            postgresql_where=sa.text(f"status = '{_approved_label(bind)}'")
+        )
+    else:
+        # SQLite stores the enum as VARCHAR holding the member names the ORM writes
+        op.create_index(
+            'idx_booking_slot_approved',
+            'bookings',
+            ['room_id', 'date', 'start_min', 'end_min', 'id', 'status'],
+            sqlite_where=sa.text("status = 'APPROVED'")
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == 'mysql':
+        op.drop_index('idx_booking_slot_status', table_name='bookings')
+    else:
+        op.drop_index('idx_booking_slot_approved', table_name='bookings')
+
+    with op.batch_alter_table('bookings') as batch_op:
+        batch_op.drop_column('end_min')
+        batch_op.drop_column('start_min')
@@ -0,0 +1,40 @@
+"""Booking holds table for short-lived slot reservations shared across workers
+
+Revision ID: 004_booking_holds
+Revises: 003_booking_slot_minutes
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '004_booking_holds'
+down_revision = '003_booking_slot_minutes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'booking_holds',
+        sa.Column('id', sa.String(length=36), nullable=False),
+        sa.Column('user_id', sa.String(length=36), nullable=False),
+        sa.Column('room_id', sa.String(length=36), nullable=False),
+        sa.Column('date', sa.Date(), nullable=False),
+        sa.Column('start_min', sa.SmallInteger(), nullable=False),
+        sa.Column('end_min', sa.SmallInteger(), nullable=False),
+        sa.Column('expires_at', sa.DateTime(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['room_id'], ['rooms.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_booking_holds_user_id'), 'booking_holds', ['user_id'], unique=False)
+    op.create_index('idx_hold_room_day', 'booking_holds', ['room_id', 'date', 'expires_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_hold_room_day', table_name='booking_holds')
+    op.drop_index(op.f('ix_booking_holds_user_id'), table_name='booking_holds')
+    op.drop_table('booking_holds')
@@ -0,0 +1,46 @@
+"""Maintained conflict counters on bookings and the booking_conflicts side table
+
+Revision ID: 005_booking_conflict_counts
+Revises: 004_booking_holds
+Create Date: 2026-10-17 00:00:00.000000
+
+Existing rows start at 0; run `python -m scripts.rebuild_conflict_counts`
+after upgrading to populate them.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '005_booking_conflict_counts'
+down_revision = '004_booking_holds'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'bookings',
+        sa.Column('conflict_count', sa.Integer(), nullable=False, server_default='0')
+    )
+    op.create_index('idx_booking_status_conflicts', 'bookings', ['status', 'conflict_count'], unique=False)
+
+    op.create_table(
+        'booking_conflicts',
+        sa.Column('booking_id', sa.String(length=50), nullable=False),
+        sa.Column('conflict_id', sa.String(length=50), nullable=False),
+        sa.Column('room_id', sa.String(length=36), nullable=False),
+        sa.Column('date', sa.Date(), nullable=False),
+        sa.ForeignKeyConstraint(['booking_id'], ['bookings.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['conflict_id'], ['bookings.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('booking_id', 'conflict_id')
+    )
+    op.create_index(op.f('ix_booking_conflicts_conflict_id'), 'booking_conflicts', ['conflict_id'], unique=False)
+    op.create_index('idx_booking_conflicts_room_day', 'booking_conflicts', ['room_id', 'date'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_booking_conflicts_room_day', table_name='booking_conflicts')
+    op.drop_index(op.f('ix_booking_conflicts_conflict_id'), table_name='booking_conflicts')
+    op.drop_table('booking_conflicts')
+    op.drop_index('idx_booking_status_conflicts', table_name='bookings')
+    op.drop_column('bookings', 'conflict_count')
@@ -0,0 +1,34 @@
+"""Equipment inventory for availability checks
+
+Revision ID: 006_equipment_types
+Revises: 005_booking_conflict_counts
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '006_equipment_types'
+down_revision = '005_booking_conflict_counts'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'equipment_types',
+        sa.Column('id', sa.String(length=36), nullable=False),
+        sa.Column('name', sa.String(length=100), nullable=False),
+        sa.Column('quantity', sa.Integer(), nullable=False),
+        sa.Column('description', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_equipment_types_name'), 'equipment_types', ['name'], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_equipment_types_name'), table_name='equipment_types')
+    op.drop_table('equipment_types')
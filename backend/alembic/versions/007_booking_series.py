@@ -0,0 +1,25 @@
+"""Series ID on bookings for recurring series
+
+Revision ID: 007_booking_series
+Revises: 006_equipment_types
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '007_booking_series'
+down_revision = '006_equipment_types'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('bookings', sa.Column('series_id', sa.String(length=36), nullable=True))
+    op.create_index(op.f('ix_bookings_series_id'), 'bookings', ['series_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_bookings_series_id'), table_name='bookings')
+    op.drop_column('bookings', 'series_id')
@@ -0,0 +1,22 @@
+"""Composite index for keyset pagination of bookings
+
+Revision ID: 008_booking_keyset_index
+Revises: 007_booking_series
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '008_booking_keyset_index'
+down_revision = '007_booking_series'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('idx_booking_date_start_id', 'bookings', ['date', 'start_time', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_booking_date_start_id', table_name='bookings')
@@ -0,0 +1,28 @@
+"""Version counters for conditional GETs
+
+Revision ID: 009_data_versions
+Revises: 008_booking_keyset_index
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '009_data_versions'
+down_revision = '008_booking_keyset_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'data_versions',
+        sa.Column('scope', sa.String(length=100), nullable=False),
+        sa.Column('version', sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint('scope')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('data_versions')
@@ -0,0 +1,36 @@
+"""updated_at index and booking_tombstones for delta sync
+
+Revision ID: 010_booking_changes
+Revises: 009_data_versions
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '010_booking_changes'
+down_revision = '009_data_versions'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('idx_booking_updated_at', 'bookings', ['updated_at'], unique=False)
+
+    op.create_table(
+        'booking_tombstones',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('booking_id', sa.String(length=50), nullable=False),
+        sa.Column('room_id', sa.String(length=36), nullable=False),
+        sa.Column('date', sa.Date(), nullable=False),
+        sa.Column('deleted_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_booking_tombstones_deleted_at'), 'booking_tombstones', ['deleted_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_booking_tombstones_deleted_at'), table_name='booking_tombstones')
+    op.drop_table('booking_tombstones')
+    op.drop_index('idx_booking_updated_at', table_name='bookings')
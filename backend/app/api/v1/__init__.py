@@ -1,6 +1,6 @@
 from fastapi import APIRouter
 
-from app.api.v1 import auth, users, rooms, bookings, admin
+from app.api.v1 import auth, users, rooms, bookings, admin, equipment, schedule
 
 api_router = APIRouter()
 
@@ -9,4 +9,6 @@ api_router.include_router(auth.router)
 api_router.include_router(users.router)
 api_router.include_router(rooms.router)
 api_router.include_router(bookings.router)
-api_router.include_router(admin.router)
\ No newline at end of file
+api_router.include_router(admin.router)
+api_router.include_router(equipment.router)
+api_router.include_router(schedule.router)
\ No newline at end of file
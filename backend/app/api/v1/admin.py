@@ -1,12 +1,28 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, status, Query
 from sqlalchemy.orm import Session
-from typing import Dict
+from sqlalchemy.exc import IntegrityError
+from typing import Dict, Optional
+from datetime import date, timedelta
 
 from app.variables.database import get_db
 from app.api.deps import get_current_admin_user
 from app.models.user import User
 from app.services.cleanup_service import CleanupService
 from app.services.scheduler_service import SchedulerService
+from app.services.conflict_index import ConflictIndex
+from app.services.schedule_cache import ScheduleCache
+from app.services.conflict_service import ConflictService
+from app.services.approval_service import ApprovalService
+from app.services.booking_service import BookingService
+from app.schemas.booking import (
+    ConflictGraphResponse,
+    ApprovalPlanResponse,
+    ApprovalPlanApply,
+    ApprovalApplyResponse,
+    ConflictCountVerifyResponse,
+    ConflictCountRebuildResponse
+)
+from app.utils.exceptions import BadRequestException, ConflictException
 from app.core.config import settings
 
 router = APIRouter(prefix="/admin", tags=["Admin"])
@@ -63,3 +79,183 @@ def run_cleanup_now(
         "message": "Cleanup executed",
         "result": result
     }
+
+
+@router.get("/conflict-index/status", status_code=status.HTTP_200_OK)
+def get_conflict_index_status(
+    current_user: User = Depends(get_current_admin_user)
+) -> Dict:
+    """
+    Get in-memory conflict index size and hit counters (Admin only).
+    """
+    return ConflictIndex.stats()
+
+
+@router.post("/conflict-index/toggle", status_code=status.HTTP_200_OK)
+def toggle_conflict_index(
+    enabled: bool,
+    current_user: User = Depends(get_current_admin_user)
+) -> Dict:
+    """
+    Enable or disable the in-memory conflict index (Admin only).
+    
+    Args:
+        enabled: True to enable, False to disable and fall back to SQL
+    """
+    ConflictIndex.set_enabled(enabled)
+    
+    return {
+        "message": f"Conflict index {'enabled' if enabled else 'disabled'}",
+        "enabled": enabled
+    }
+
+
+@router.post("/conflict-index/verify", status_code=status.HTTP_200_OK)
+def verify_conflict_index(
+    repair: bool = False,
+    current_user: User = Depends(get_current_admin_user),
+    db: Session = Depends(get_db)
+) -> Dict:
+    """
+    Check the in-memory conflict index against the database (Admin only).
+    
+    Args:
+        repair: Drop drifted room-days so they reload on next lookup
+    """
+    return ConflictIndex.verify(db, repair=repair)
+
+
+@router.get("/schedule-cache/status", status_code=status.HTTP_200_OK)
+def get_schedule_cache_status(
+    current_user: User = Depends(get_current_admin_user)
+) -> Dict:
+    """
+    Get approved-schedule cache size and hit/miss counters (Admin only).
+    """
+    return ScheduleCache.stats()
+
+
+@router.post("/schedule-cache/toggle", status_code=status.HTTP_200_OK)
+def toggle_schedule_cache(
+    enabled: bool,
+    current_user: User = Depends(get_current_admin_user)
+) -> Dict:
+    """
+    Enable or disable the approved-schedule cache (Admin only).
+    
+    Args:
+        enabled: True to enable, False to disable and query on every request
+    """
+    ScheduleCache.set_enabled(enabled)
+    
+    return {
+        "message": f"Schedule cache {'enabled' if enabled else 'disabled'}",
+        "enabled": enabled
+    }
+
+
+@router.post("/conflict-counts/verify", response_model=ConflictCountVerifyResponse, status_code=status.HTTP_200_OK)
+def verify_conflict_counts(
+    repair: bool = False,
+    current_user: User = Depends(get_current_admin_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Check maintained conflict counters against a recomputation (Admin only).
+    
+    Args:
+        repair: Rebuild the room-days that drifted
+    """
+    return ConflictService.verify_conflict_counts(db, repair=repair)
+
+
+@router.post("/conflict-counts/rebuild", response_model=ConflictCountRebuildResponse, status_code=status.HTTP_200_OK)
+def rebuild_conflict_counts(
+    current_user: User = Depends(get_current_admin_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Recompute conflict counters for every booking (Admin only).
+    
+    Use after bulk imports or restores; scripts/rebuild_conflict_counts.py
+    does the same from the command line.
+    """
+    return ConflictService.rebuild_conflict_counts(db)
+
+
+@router.get("/conflicts/graph", response_model=ConflictGraphResponse, status_code=status.HTTP_200_OK)
+def get_conflict_graph(
+    date_from: date = Query(..., description="First day (inclusive)"),
+    date_to: date = Query(..., description="Last day (inclusive)"),
+    room_id: Optional[str] = Query(None, description="Restrict to one room"),
+    current_user: User = Depends(get_current_admin_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Get the conflict graph of pending bookings for a date range (Admin only).
+    
+    Pending requests are linked to the approved bookings and other pending
+    requests they overlap. A pending node with no neighbours is clean.
+    """
+    if date_to < date_from:
+        raise BadRequestException("date_to must not be before date_from")
+    
+    if date_to - date_from >= timedelta(days=settings.MAX_CONFLICT_GRAPH_DAYS):
+        raise BadRequestException(f"Date range cannot exceed {settings.MAX_CONFLICT_GRAPH_DAYS} days")
+    
+    return ConflictService.build_conflict_graph(db, date_from, date_to, room_id=room_id)
+
+
+@router.post("/approvals/plan", response_model=ApprovalPlanResponse, status_code=status.HTTP_200_OK)
+def plan_bulk_approval(
+    date_from: date = Query(..., description="First day (inclusive)"),
+    date_to: date = Query(..., description="Last day (inclusive)"),
+    room_id: Optional[str] = Query(None, description="Restrict to one room"),
+    current_user: User = Depends(get_current_admin_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Compute an approve/reject plan for the pending queue (Admin only).
+    
+    Dry run: nothing is written. Per room-day, pending requests overlapping
+    an approved booking are rejected and the rest are chosen by weighted
+    interval scheduling (priority, then age and attendee count).
+    """
+    if date_to < date_from:
+        raise BadRequestException("date_to must not be before date_from")
+    
+    if date_to - date_from >= timedelta(days=settings.MAX_CONFLICT_GRAPH_DAYS):
+        raise BadRequestException(f"Date range cannot exceed {settings.MAX_CONFLICT_GRAPH_DAYS} days")
+    
+    return ApprovalService.plan(db, date_from, date_to, room_id=room_id)
+
+
+@router.post("/approvals/apply", response_model=ApprovalApplyResponse, status_code=status.HTTP_200_OK)
+def apply_bulk_approval(
+    plan: ApprovalPlanApply,
+    current_user: User = Depends(get_current_admin_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Apply an approve/reject plan in a single transaction (Admin only).
+    
+    The plan is re-checked first, under the room-day locks single approvals
+    take: every booking must still be pending and the approvals must not
+    overlap each other or any approved booking.
+    """
+    room_days = ApprovalService.room_days(db, plan.approve + plan.reject)
+    
+    with ApprovalService.room_day_locks(db, room_days):
+        problems = ApprovalService.validate_plan(db, plan.approve, plan.reject)
+        
+        if problems:
+            db.rollback()
+            raise ConflictException(f"Plan is out of date: {'; '.join(problems)}")
+        
+        try:
+            return ApprovalService.apply_plan(db, plan.approve, plan.reject, notes=plan.notes)
+        except IntegrityError as error:
+            db.rollback()
+            if BookingService.is_overlap_violation(error):
+                raise ConflictException("Plan overlaps an existing approved booking")
+            raise
@@ -1,21 +1,47 @@
-from fastapi import APIRouter, Depends, status, Query
+from fastapi import APIRouter, Depends, status, Query, Response, Header
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from sqlalchemy.exc import IntegrityError
+from typing import Any, Dict, List, Literal, Optional
 from datetime import date
+from contextlib import contextmanager
 
 from app.variables.database import get_db
 from app.schemas.booking import (
+    BookingBase,
     BookingCreate,
     BookingUpdate,
     BookingStatusUpdate,
     BookingResponse,
-    BookingStatusEnum
+    BookingStatusEnum,
+    BatchConflictRequest,
+    BatchConflictResponse,
+    HoldCreate,
+    HoldResponse,
+    BookingSeriesCreate,
+    BookingSeriesResponse,
+    BookingSeriesCancelResponse,
+    BookingChangesResponse
 )
 from app.services.booking_service import BookingService
+from app.services.approval_service import ApprovalService
+from app.services.conflict_service import ConflictService
+from app.services.hold_service import HoldService, Hold
+from app.services.equipment_service import EquipmentService
+from app.services.series_service import SeriesService
 from app.services.room_service import RoomService
+from app.services.version_service import VersionService
+from app.services.schedule_cache import ScheduleCache
+from app.services.change_service import ChangeService
 from app.api.deps import get_current_active_user, get_current_admin_user
 from app.models.user import User
 from app.models.booking import Booking
+from app.utils.intervals import from_minutes
+from app.utils.pagination import encode_cursor, decode_cursor
+from app.utils.export import csv_chunks, ndjson_chunks
+from app.utils.etag import make_etag, etag_matches
+from app.utils.fields import parse_fields
+from app.utils.serialization import rows_response
 from app.utils.exceptions import (
     NotFoundException,
     BadRequestException,
@@ -27,9 +53,33 @@ from app.core.config import settings
 router = APIRouter(prefix="/bookings", tags=["Bookings"])
 
 
-def _to_booking_response(booking: Booking) -> BookingResponse:
-    """Convert Booking model to BookingResponse schema."""
-    return BookingResponse(
+def _held_message(holds: List[Hold]) -> str:
+    """Describe blocking holds without revealing who holds them."""
+    until = max(hold.expires_at for hold in holds)
+    return f"Slot is temporarily held by another user until {until.isoformat(timespec='seconds')}Z"
+
+
+def _equipment_message(shortages: List[dict]) -> str:
+    """Describe overcommitted equipment for a 409 response."""
+    details = ", ".join(
+        f"{item['name']} ({item['in_use']} of {item['quantity']} in use at {item['at'].strftime('%H:%M')}, "
+        f"{item['requested']} requested)"
+        for item in shortages
+    )
+    return f"Equipment unavailable: {details}"
+
+
+# Key order of serialized BookingResponse objects
+BOOKING_RESPONSE_FIELDS = list(BookingResponse.model_fields)
+
+
+def _to_booking_response(booking: Booking) -> Dict[str, Any]:
+    """
+    BookingResponse-shaped dict for a Booking model.
+
+    Left unvalidated: the endpoint's response_model validates it once.
+    """
+    return dict(
         id=booking.id,
         user_id=booking.user_id,
         room_id=booking.room_id,
@@ -43,6 +93,8 @@ def _to_booking_response(booking: Booking) -> BookingResponse:
         equipment=booking.equipment,
         status=booking.status,
         notes=booking.notes,
+        conflict_count=booking.conflict_count,
+        series_id=booking.series_id,
         created_at=booking.created_at,
         updated_at=booking.updated_at,
         user_name=booking.user.name if booking.user else "Unknown",
@@ -50,15 +102,50 @@ def _to_booking_response(booking: Booking) -> BookingResponse:
     )
 
 
+@contextmanager
+def _approved_overlap_guard(db: Session):
+    """Translate the PostgreSQL approved-overlap exclusion violation into a 409."""
+    try:
+        yield
+    except IntegrityError as error:
+        db.rollback()
+        if BookingService.is_overlap_violation(error):
+            raise ConflictException("Booking overlaps an existing approved booking in this room")
+        raise
+
+
+def _approval_conflict(conflicts: List[Booking], hint: str) -> ConflictException:
+    """409 listing the approved bookings that block an approval."""
+    conflict_details = [
+        {
+            "id": c.id,
+            "user_name": c.user.name,
+            "time": f"{c.start_time} - {c.end_time}"
+        }
+        for c in conflicts
+    ]
+    return ConflictException(
+        f"Booking conflicts with {len(conflicts)} existing approved booking(s). "
+        f"{hint} Conflicts: {conflict_details}"
+    )
+
+
 @router.get("", response_model=List[BookingResponse], status_code=status.HTTP_200_OK)
 def get_all_bookings(
+    response: Response,
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(settings.DEFAULT_PAGE_SIZE, ge=1, le=settings.MAX_PAGE_SIZE, description="Number of records to return"),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor of the previous page; replaces skip"),
+    include_total: bool = Query(False, description="Send X-Total-Count (cached or estimated)"),
     user_id: Optional[str] = Query(None, description="Filter by user ID"),
     room_id: Optional[str] = Query(None, description="Filter by room ID"),
     status: Optional[BookingStatusEnum] = Query(None, description="Filter by status"),
     date_from: Optional[date] = Query(None, description="Filter by start date (inclusive)"),
     date_to: Optional[date] = Query(None, description="Filter by end date (inclusive)"),
+    contested: Optional[bool] = Query(None, description="Pending requests with (true) or without (false) conflicts"),
+    series_id: Optional[str] = Query(None, description="Filter by recurring series"),
+    fields: Optional[str] = Query(None, description="Comma-separated BookingResponse fields to return (id is always included)"),
+    if_none_match: Optional[str] = Header(None),
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
@@ -68,33 +155,378 @@ def get_all_bookings(
     - Regular users can see all approved bookings (for global schedule)
     - Regular users can see their own bookings regardless of status
     - Admins can see all bookings and apply filters
+    - **contested**: Split the pending queue by maintained conflict_count
+      (most contested first when true)
+    - **cursor**: Keyset pagination; a full page returns X-Next-Cursor
+      for the next one. Pages cost the same at any depth and stay stable
+      while bookings are added. Not available with contested=true.
+    - **include_total**: Adds X-Total-Count, which may lag recent writes
+      by up to BOOKING_COUNT_CACHE_SECONDS
+    - **fields**: Sparse fieldset, e.g. `id,room_id,date,start_time,end_time,title`
+      for calendar views; only those columns are selected and returned
+    
+    Responses carry an ETag built from data version counters; send it back
+    in If-None-Match to get 304 Not Modified without a bookings query.
+    A room_id with a short date range only changes with that room's days.
+    Regular users' schedule pages are shared through ScheduleCache.
     
     Requires authentication.
     """
     # Regular users can see all approved bookings or their own bookings
     # This allows them to see the global schedule
+    schedule_view = False
     if current_user.role.value != "ADMIN":
         # If no specific user_id filter provided, only show approved bookings for schedule view
         if user_id is None:
             status = BookingStatusEnum.APPROVED
+            schedule_view = True
         else:
             # If filtering by user_id, verify it's their own ID
             if user_id != current_user.id:
                 user_id = current_user.id
     
-    bookings = BookingService.get_all(
+    try:
+        selected = parse_fields(fields, BookingResponse)
+    except ValueError as error:
+        raise BadRequestException(str(error))
+    
+    after = None
+    if cursor:
+        if contested:
+            raise BadRequestException("cursor cannot be combined with contested=true")
+        try:
+            after = decode_cursor(cursor)
+        except ValueError:
+            raise BadRequestException("Invalid cursor")
+    
+    filters = dict(
+        user_id=user_id,
+        room_id=room_id,
+        status=status,
+        date_from=date_from,
+        date_to=date_to,
+        contested=contested,
+        series_id=series_id
+    )
+    versions = VersionService.current(db, VersionService.booking_scopes(room_id, date_from, date_to))
+    etag = make_etag(
+        versions, skip=skip, limit=limit, cursor=cursor, include_total=include_total, fields=selected, **filters
+    )
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "private, no-cache"
+    
+    # Read-only listing: column projection with user_name/room_name joined in
+    def load():
+        return BookingService.get_all_rows(db, skip=skip, limit=limit, cursor=after, fields=selected, **filters)
+    
+    if schedule_view:
+        # Every regular user shares the approved schedule: one query per page and data version
+        key = ScheduleCache.make_key(
+            skip=skip, limit=limit, cursor=cursor, fields=tuple(selected) if selected else None, **filters
+        )
+        bookings = ScheduleCache.get_or_load(key, versions, load)
+    else:
+        bookings = load()
+    
+    if len(bookings) == limit and not contested:
+        last = bookings[-1]
+        response.headers["X-Next-Cursor"] = encode_cursor(last["date"], last["start_time"], last["id"])
+    if include_total:
+        response.headers["X-Total-Count"] = str(BookingService.count(db, **filters))
+    
+    # Trusted projection rows go straight to JSON; response_model documents the shape
+    return rows_response(
+        bookings,
+        selected or BOOKING_RESPONSE_FIELDS,
+        normalizers={"equipment": BookingBase.normalize_equipment},
+        headers=response.headers
+    )
+
+
+@router.get("/changes", response_model=BookingChangesResponse, status_code=status.HTTP_200_OK)
+def get_booking_changes(
+    since: Optional[str] = Query(None, description="watermark from the previous call; omit to start"),
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Bookings created, updated or deleted since a watermark.
+    
+    Start by calling without `since`, load the list with GET /bookings,
+    then poll with the returned watermark. Apply `changed` as upserts by id
+    (rows near the watermark may be sent twice) and drop the `deleted` IDs.
+    When `reset` is true, reload the list instead and continue from the
+    new watermark.
+    
+    Regular users see the same bookings as in GET /bookings: approved ones
+    and their own.
+    
+    Requires authentication.
+    """
+    try:
+        return ChangeService.get_changes(
+            db,
+            since,
+            viewer_id=current_user.id,
+            is_admin=current_user.role.value == "ADMIN"
+        )
+    except ValueError:
+        raise BadRequestException("Invalid watermark")
+
+
+@router.get("/export", status_code=status.HTTP_200_OK)
+def export_bookings(
+    format: Literal["csv", "ndjson"] = Query("csv", description="csv or ndjson"),
+    user_id: Optional[str] = Query(None, description="Filter by user ID"),
+    room_id: Optional[str] = Query(None, description="Filter by room ID"),
+    status: Optional[BookingStatusEnum] = Query(None, description="Filter by status"),
+    date_from: Optional[date] = Query(None, description="Filter by start date (inclusive)"),
+    date_to: Optional[date] = Query(None, description="Filter by end date (inclusive)"),
+    contested: Optional[bool] = Query(None, description="Pending requests with (true) or without (false) conflicts"),
+    series_id: Optional[str] = Query(None, description="Filter by recurring series"),
+    current_user: User = Depends(get_current_admin_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Export every booking matching the GET /bookings filters (Admin only).
+    
+    - **format**: csv (header row, equipment joined with "; ") or ndjson
+      (one JSON object per line)
+    
+    The response is streamed: rows are read through a server-side cursor
+    in EXPORT_BATCH_SIZE batches and sent as they arrive, so exports of
+    any size start immediately and use constant memory.
+    
+    Requires admin authentication.
+    """
+    # get_db closes the session only after the response has been sent
+    rows = BookingService.stream_rows(
         db,
-        skip=skip,
-        limit=limit,
         user_id=user_id,
         room_id=room_id,
         status=status,
         date_from=date_from,
-        date_to=date_to
+        date_to=date_to,
+        contested=contested,
+        series_id=series_id,
+        batch_size=settings.EXPORT_BATCH_SIZE
+    )
+    
+    if format == "csv":
+        chunks, media_type = csv_chunks(rows), "text/csv; charset=utf-8"
+    else:
+        chunks, media_type = ndjson_chunks(rows), "application/x-ndjson"
+    
+    filename = f"bookings-{date.today().strftime('%Y%m%d')}.{format}"
+    return StreamingResponse(
+        chunks,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
+
+@router.post("/conflicts:batch", response_model=BatchConflictResponse, status_code=status.HTTP_200_OK)
+def check_conflicts_batch(
+    request: BatchConflictRequest,
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Check many candidate slots for conflicts with approved bookings.
+    
+    - **candidates**: Up to MAX_BATCH_CONFLICT_CANDIDATES (room_id, date, start_time, end_time) slots
+    
+    Returns the conflicting booking IDs for each candidate, in request order.
+    
+    Requires authentication.
+    """
+    room_days, conflicts = ConflictService.check_candidates(db, request.candidates)
+    
+    return {
+        "room_days": room_days,
+        "results": [
+            {"index": index, "conflict_ids": conflict_ids}
+            for index, conflict_ids in enumerate(conflicts)
+        ]
+    }
+
+
+@router.post("/holds", response_model=HoldResponse, status_code=status.HTTP_201_CREATED)
+def create_hold(
+    hold_data: HoldCreate,
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Hold a slot for a short time while the booking form is filled in.
+    
+    - **room_id**, **date**, **start_time**, **end_time**: The slot to hold
+    - **seconds**: Hold duration (default HOLD_DEFAULT_SECONDS, max HOLD_MAX_SECONDS)
+    
+    Other users cannot request an overlapping slot until the hold expires or
+    is released; creating the booking releases it. Returns 409 if the slot
+    is already held or booked.
+    
+    Requires authentication.
+    """
+    room = RoomService.get_by_id(db, hold_data.room_id)
+    if not room or not room.is_active:
+        raise NotFoundException("Room not found or inactive")
+    
+    if HoldService.count_for_user(db, current_user.id) >= settings.MAX_HOLDS_PER_USER:
+        raise BadRequestException(f"At most {settings.MAX_HOLDS_PER_USER} active holds per user")
+    
+    conflicts = BookingService.get_conflicting_bookings(
+        db,
+        hold_data.room_id,
+        hold_data.date,
+        hold_data.start_time,
+        hold_data.end_time
+    )
+    if conflicts:
+        raise ConflictException("Slot overlaps an approved booking")
+    
+    hold, blocking = HoldService.place(
+        db,
+        current_user.id,
+        hold_data.room_id,
+        hold_data.date,
+        hold_data.start_time,
+        hold_data.end_time,
+        hold_data.seconds
     )
+    if not hold:
+        raise ConflictException(_held_message(blocking))
+    
+    return HoldResponse(
+        id=hold.id,
+        room_id=hold.room_id,
+        date=hold.date,
+        start_time=from_minutes(hold.start_min),
+        end_time=from_minutes(hold.end_min),
+        expires_at=hold.expires_at
+    )
+
+
+@router.delete("/holds/{hold_id}", status_code=status.HTTP_204_NO_CONTENT)
+def release_hold(
+    hold_id: str,
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Release one of your holds before it expires.
+    
+    Requires authentication.
+    """
+    if not HoldService.release(db, hold_id, current_user.id):
+        raise NotFoundException("Hold not found or expired")
+    
+    return None
+
+
+@router.post("/series", response_model=BookingSeriesResponse, status_code=status.HTTP_201_CREATED)
+def create_booking_series(
+    series_data: BookingSeriesCreate,
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Create a recurring series of bookings.
+    
+    - **date**: First occurrence
+    - **recurrence**: frequency (Daily/Weekly), interval, by_weekday
+      (0 = Monday, weekly only) and exactly one of until or count
+    - **skip_conflicts**: Leave out dates that collide with approved bookings
+      instead of requesting them as overrides
+    
+    Every occurrence is a PENDING booking sharing the returned series_id.
+    Returns 409 if another user holds the slot or requested equipment is
+    fully in use on any date.
+    
+    Requires authentication.
+    """
+    room = RoomService.get_by_id(db, series_data.room_id)
+    if not room or not room.is_active:
+        raise NotFoundException("Room not found or inactive")
+    
+    if series_data.attendees > room.capacity:
+        raise BadRequestException(
+            f"Attendees ({series_data.attendees}) exceed room capacity ({room.capacity})"
+        )
+    
+    dates = SeriesService.expand(series_data.date, series_data.recurrence, settings.MAX_SERIES_OCCURRENCES)
+    if not dates:
+        raise BadRequestException("Recurrence produces no occurrences")
+    if len(dates) > settings.MAX_SERIES_OCCURRENCES:
+        raise BadRequestException(f"A series can have at most {settings.MAX_SERIES_OCCURRENCES} occurrences")
+    
+    held = HoldService.blocked_dates(
+        db,
+        series_data.room_id,
+        dates,
+        series_data.start_time,
+        series_data.end_time,
+        current_user.id
+    )
+    if held:
+        raise ConflictException(
+            f"Slot is temporarily held by another user on {', '.join(day.isoformat() for day in held)}"
+        )
+    
+    shortages = EquipmentService.check_availability_many(
+        db,
+        dates,
+        series_data.start_time,
+        series_data.end_time,
+        series_data.equipment
+    )
+    if shortages:
+        first_date = min(shortages)
+        raise ConflictException(f"{_equipment_message(shortages[first_date])} on {first_date.isoformat()}")
+    
+    series_id, bookings, skipped = SeriesService.create(db, current_user.id, series_data, dates)
+    if not series_id:
+        if skipped:
+            raise ConflictException("Every occurrence conflicts with an approved booking")
+        raise ConflictException("Could not allocate booking IDs for the series, please retry")
+    
+    return {
+        "series_id": series_id,
+        "bookings": [_to_booking_response(booking) for booking in bookings],
+        "skipped": skipped
+    }
+
+
+@router.patch("/series/{series_id}/cancel", response_model=BookingSeriesCancelResponse, status_code=status.HTTP_200_OK)
+def cancel_booking_series(
+    series_id: str,
+    from_date: Optional[date] = Query(None, description="Cancel occurrences on or after this date (default today)"),
+    notes: Optional[str] = Query(None, description="Cancellation reason"),
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Cancel the remaining pending and approved occurrences of a series.
+    
+    - Users can cancel their own series
+    - Admins can cancel any series
+    
+    Requires authentication.
+    """
+    owner_id = SeriesService.get_owner_id(db, series_id)
+    
+    if not owner_id:
+        raise NotFoundException("Series not found")
+    
+    if owner_id != current_user.id and current_user.role.value != "ADMIN":
+        raise ForbiddenException("You can only cancel your own bookings")
+    
+    cancelled = SeriesService.cancel(db, series_id, from_date or date.today(), notes)
     
-    # Enrich with user_name and room_name
-    return [_to_booking_response(booking) for booking in bookings]
+    return {"series_id": series_id, "cancelled": cancelled}
 
 
 @router.get("/{booking_id}", response_model=BookingResponse, status_code=status.HTTP_200_OK)
@@ -134,6 +566,7 @@ def create_booking(
     
     - All bookings start with PENDING status
     - System checks for conflicts but doesn't auto-reject (admin decides)
+    - Returns 409 if requested inventory equipment is already fully in use
     
     Requires authentication.
     """
@@ -152,6 +585,29 @@ def create_booking(
     if booking_data.end_time <= booking_data.start_time:
         raise BadRequestException("End time must be after start time")
     
+    # Another user is filling in a booking for this slot
+    blocking = HoldService.blocking(
+        db,
+        booking_data.room_id,
+        booking_data.date,
+        booking_data.start_time,
+        booking_data.end_time,
+        current_user.id
+    )
+    if blocking:
+        raise ConflictException(_held_message(blocking))
+    
+    # Shared equipment cannot be overridden like a room slot
+    shortages = EquipmentService.check_availability(
+        db,
+        booking_data.date,
+        booking_data.start_time,
+        booking_data.end_time,
+        booking_data.equipment
+    )
+    if shortages:
+        raise ConflictException(_equipment_message(shortages))
+    
     # Check for conflicts with approved bookings (informational only)
     conflicts = BookingService.get_conflicting_bookings(
         db,
@@ -164,6 +620,14 @@ def create_booking(
     # Create booking as PENDING - admin will resolve conflicts
     # Note: conflicts are allowed so users can request priority overrides
     booking = BookingService.create(db, current_user.id, booking_data)
+    HoldService.release_overlapping(
+        db,
+        current_user.id,
+        booking_data.room_id,
+        booking_data.date,
+        booking_data.start_time,
+        booking_data.end_time
+    )
     
     # If there are conflicts, add a note for admin review
     if conflicts:
@@ -210,8 +674,23 @@ def update_booking(
         if not room or not room.is_active:
             raise NotFoundException("Room not found or inactive")
     
+    # Re-check equipment when the slot or the equipment list changes
+    changes = booking_data.model_dump(exclude_unset=True)
+    if changes.keys() & {"date", "start_time", "end_time", "equipment"}:
+        shortages = EquipmentService.check_availability(
+            db,
+            changes.get("date") or booking.date,
+            changes.get("start_time") or booking.start_time,
+            changes.get("end_time") or booking.end_time,
+            changes["equipment"] if "equipment" in changes else booking.equipment,
+            exclude_booking_id=booking.id
+        )
+        if shortages:
+            raise ConflictException(_equipment_message(shortages))
+    
     # Update booking
-    updated_booking = BookingService.update(db, booking_id, booking_data)
+    with _approved_overlap_guard(db):
+        updated_booking = BookingService.update(db, booking_id, booking_data)
     
     if not updated_booking:
         raise NotFoundException("Booking not found")
@@ -267,7 +746,8 @@ def update_booking_status(
     """
     Update booking status (Admin only).
     
-    - APPROVE: Change to APPROVED status
+    - APPROVE: Change a PENDING booking to APPROVED under the same lock as
+      /approve; returns 409 if it overlaps an approved booking
     - REJECT: Change to REJECTED status with optional reason
     
     Requires admin authentication.
@@ -281,8 +761,25 @@ def update_booking_status(
     if booking.status == status_data.status:
         raise BadRequestException(f"Booking is already {status_data.status.value}")
     
+    if status_data.status == BookingStatusEnum.APPROVED:
+        if booking.status != BookingStatusEnum.PENDING:
+            raise BadRequestException("Can only approve PENDING bookings")
+        
+        # Same locked check-and-approve as /approve, without overriding conflicts
+        with _approved_overlap_guard(db):
+            approved_booking, conflicts, _ = ApprovalService.approve_locked(db, booking_id, notes=status_data.notes)
+        
+        if conflicts:
+            raise _approval_conflict(conflicts, "Use /approve with cancel_conflicts=true to auto-cancel them.")
+        
+        if not approved_booking:
+            raise ConflictException("Booking was modified concurrently and is no longer pending")
+        
+        return _to_booking_response(approved_booking)
+    
     # Update status
-    updated_booking = BookingService.update_status(db, booking_id, status_data)
+    with _approved_overlap_guard(db):
+        updated_booking = BookingService.update_status(db, booking_id, status_data)
     
     return _to_booking_response(updated_booking)
 
@@ -311,34 +808,15 @@ def approve_booking(
     if booking.status != BookingStatusEnum.PENDING:
         raise BadRequestException("Can only approve PENDING bookings")
     
-    # Check for conflicts
-    conflicts = BookingService.get_conflicting_bookings(
-        db,
-        booking.room_id,
-        booking.date,
-        booking.start_time,
-        booking.end_time,
-        exclude_booking_id=booking_id
-    )
+    # Check, cancel and approve under a (room, date) lock so concurrent approvals cannot double-book
+    with _approved_overlap_guard(db):
+        approved_booking, conflicts, _ = ApprovalService.approve_locked(db, booking_id, cancel_conflicts)
     
-    if conflicts and not cancel_conflicts:
-        conflict_details = [
-            {
-                "id": c.id,
-                "user_name": c.user.name,
-                "time": f"{c.start_time} - {c.end_time}"
-            }
-            for c in conflicts
-        ]
-        raise ConflictException(
-            f"Booking conflicts with {len(conflicts)} existing approved booking(s). "
-            f"Set cancel_conflicts=true to auto-cancel them. Conflicts: {conflict_details}"
-        )
+    if conflicts:
+        raise _approval_conflict(conflicts, "Set cancel_conflicts=true to auto-cancel them.")
     
-    # Approve with conflict resolution
-    approved_booking, cancelled = BookingService.approve_with_conflict_resolution(
-        db, booking_id, cancel_conflicts
-    )
+    if not approved_booking:
+        raise ConflictException("Booking was modified concurrently and is no longer pending")
     
     return _to_booking_response(approved_booking)
 
@@ -390,14 +868,18 @@ def get_booking_conflicts(
     if not booking:
         raise NotFoundException("Booking not found")
     
-    conflicts = BookingService.get_conflicting_bookings(
-        db,
-        booking.room_id,
-        booking.date,
-        booking.start_time,
-        booking.end_time,
-        exclude_booking_id=booking_id
-    )
+    # Pending requests carry their conflicts in booking_conflicts
+    if booking.status == BookingStatusEnum.PENDING:
+        conflicts = ConflictService.get_recorded_conflicts(db, booking_id)
+    else:
+        conflicts = BookingService.get_conflicting_bookings(
+            db,
+            booking.room_id,
+            booking.date,
+            booking.start_time,
+            booking.end_time,
+            exclude_booking_id=booking_id
+        )
     
     return [_to_booking_response(conflict) for conflict in conflicts]
 
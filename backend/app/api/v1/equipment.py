@@ -0,0 +1,112 @@
+from fastapi import APIRouter, Depends, status, Query
+from sqlalchemy.orm import Session
+from typing import List
+from datetime import date
+
+from app.variables.database import get_db
+from app.schemas.equipment import (
+    EquipmentTypeCreate,
+    EquipmentTypeUpdate,
+    EquipmentTypeResponse,
+    EquipmentUtilizationResponse
+)
+from app.services.equipment_service import EquipmentService
+from app.api.deps import get_current_active_user, get_current_admin_user
+from app.models.user import User
+from app.utils.exceptions import NotFoundException, BadRequestException
+
+router = APIRouter(prefix="/equipment", tags=["Equipment"])
+
+
+@router.get("", response_model=List[EquipmentTypeResponse], status_code=status.HTTP_200_OK)
+def get_all_equipment(
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Get the equipment inventory.
+    
+    Requires authentication.
+    """
+    return EquipmentService.get_all(db)
+
+
+@router.get("/utilization", response_model=EquipmentUtilizationResponse, status_code=status.HTTP_200_OK)
+def get_equipment_utilization(
+    date: date = Query(..., description="Day to report"),
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Get peak concurrent use of each equipment type on a day.
+    
+    Counts approved bookings only. **overcommitted** flags types whose
+    peak exceeds the stock; **untracked** lists equipment that bookings
+    ask for but the inventory does not limit.
+    
+    Requires authentication.
+    """
+    return EquipmentService.get_utilization(db, date)
+
+
+@router.post("", response_model=EquipmentTypeResponse, status_code=status.HTTP_201_CREATED)
+def create_equipment(
+    equipment_data: EquipmentTypeCreate,
+    current_user: User = Depends(get_current_admin_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Add an equipment type to the inventory.
+    
+    - **name**: Matched case-insensitively against booking equipment
+    - **quantity**: Units that can be in use at the same time
+    - **description**: Optional notes
+    
+    Requires admin authentication.
+    """
+    if EquipmentService.get_by_name(db, equipment_data.name):
+        raise BadRequestException(f"Equipment {equipment_data.name} already exists")
+    
+    return EquipmentService.create(db, equipment_data)
+
+
+@router.put("/{equipment_id}", response_model=EquipmentTypeResponse, status_code=status.HTTP_200_OK)
+def update_equipment(
+    equipment_id: str,
+    equipment_data: EquipmentTypeUpdate,
+    current_user: User = Depends(get_current_admin_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Update an equipment type.
+    
+    Requires admin authentication.
+    """
+    if equipment_data.name:
+        existing = EquipmentService.get_by_name(db, equipment_data.name)
+        if existing and existing.id != equipment_id:
+            raise BadRequestException(f"Equipment {equipment_data.name} already exists")
+    
+    equipment = EquipmentService.update(db, equipment_id, equipment_data)
+    
+    if not equipment:
+        raise NotFoundException("Equipment not found")
+    
+    return equipment
+
+
+@router.delete("/{equipment_id}", status_code=status.HTTP_204_NO_CONTENT)
+def delete_equipment(
+    equipment_id: str,
+    current_user: User = Depends(get_current_admin_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Remove an equipment type from the inventory.
+    
+    Requires admin authentication.
+    """
+    if not EquipmentService.delete(db, equipment_id):
+        raise NotFoundException("Equipment not found")
+    
+    return None
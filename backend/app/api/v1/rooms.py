@@ -1,13 +1,21 @@
-from fastapi import APIRouter, Depends, status, Query
+from fastapi import APIRouter, Depends, status, Query, Response, Header
 from sqlalchemy.orm import Session
 from typing import List, Optional
+from datetime import date, datetime, time, timedelta
 
 from app.variables.database import get_db
-from app.schemas.room import RoomCreate, RoomUpdate, RoomResponse
+from app.schemas.room import RoomBase, RoomCreate, RoomUpdate, RoomResponse
+from app.schemas.availability import RoomAvailabilityResponse, MonthOccupancyResponse, EarliestSlotOption
 from app.services.room_service import RoomService
+from app.services.availability_service import AvailabilityService, OCCUPANCY_GRANULARITIES
+from app.services.scheduling_service import SchedulingService
+from app.services.version_service import VersionService, ROOMS
 from app.api.deps import get_current_active_user, get_current_admin_user
 from app.models.user import User
 from app.utils.exceptions import NotFoundException, BadRequestException
+from app.utils.etag import make_etag, etag_matches
+from app.utils.fields import parse_fields
+from app.utils.serialization import rows_response
 from app.core.config import settings
 
 router = APIRouter(prefix="/rooms", tags=["Rooms"])
@@ -15,9 +23,12 @@ router = APIRouter(prefix="/rooms", tags=["Rooms"])
 
 @router.get("", response_model=List[RoomResponse], status_code=status.HTTP_200_OK)
 def get_all_rooms(
+    response: Response,
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(settings.DEFAULT_PAGE_SIZE, ge=1, le=settings.MAX_PAGE_SIZE, description="Number of records to return"),
     active_only: bool = Query(True, description="Return only active rooms"),
+    fields: Optional[str] = Query(None, description="Comma-separated RoomResponse fields to return (id is always included)"),
+    if_none_match: Optional[str] = Header(None),
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
@@ -27,13 +38,144 @@ def get_all_rooms(
     - **skip**: Number of records to skip (for pagination)
     - **limit**: Maximum number of records to return
     - **active_only**: Filter to show only active rooms
+    - **fields**: Sparse fieldset, e.g. `id,name,capacity`; only those
+      columns are loaded and returned
+    
+    Answers If-None-Match with 304 when no room has changed since the ETag.
     
     Requires authentication.
     """
-    rooms = RoomService.get_all(db, skip=skip, limit=limit, active_only=active_only)
+    try:
+        selected = parse_fields(fields, RoomResponse)
+    except ValueError as error:
+        raise BadRequestException(str(error))
+    
+    etag = make_etag(
+        VersionService.current(db, [ROOMS]), skip=skip, limit=limit, active_only=active_only, fields=selected
+    )
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "private, no-cache"
+    
+    rooms = RoomService.get_all(db, skip=skip, limit=limit, active_only=active_only, fields=selected)
+    if selected:
+        return rows_response(
+            rooms, selected, normalizers={"features": RoomBase.normalize_features}, headers=response.headers
+        )
     return rooms
 
 
+@router.get("/search", response_model=List[RoomResponse], status_code=status.HTTP_200_OK)
+def search_available_rooms(
+    date: date = Query(..., description="Booking date"),
+    start_time: time = Query(..., description="Slot start"),
+    end_time: time = Query(..., description="Slot end"),
+    min_capacity: int = Query(1, ge=1, description="Minimum number of attendees"),
+    features: List[str] = Query([], description="Required features (repeat for several)"),
+    limit: int = Query(settings.DEFAULT_PAGE_SIZE, ge=1, le=settings.MAX_PAGE_SIZE, description="Number of records to return"),
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Find active rooms available for a time window.
+    
+    - **date**, **start_time**, **end_time**: The slot to book
+    - **min_capacity**: Rooms must hold at least this many people
+    - **features**: Rooms must have every listed feature
+    
+    Results are ranked by best capacity fit (smallest sufficient room first).
+    
+    Requires authentication.
+    """
+    if end_time <= start_time:
+        raise BadRequestException("End time must be after start time")
+    
+    return RoomService.find_available(
+        db,
+        date,
+        start_time,
+        end_time,
+        min_capacity=min_capacity,
+        features=features,
+        limit=limit,
+        viewer_id=current_user.id
+    )
+
+
+@router.get("/earliest-available", response_model=List[EarliestSlotOption], status_code=status.HTTP_200_OK)
+def find_earliest_available(
+    duration: int = Query(..., ge=1, le=24 * 60, description="Meeting length in minutes"),
+    min_capacity: int = Query(1, ge=1, description="Minimum number of attendees"),
+    features: List[str] = Query([], description="Required features (repeat for several)"),
+    date_from: Optional[date] = Query(None, alias="from", description="First day (inclusive), defaults to today"),
+    date_to: Optional[date] = Query(None, alias="to", description="Last day (inclusive), defaults to a week after 'from'"),
+    limit: int = Query(5, ge=1, le=50, description="Number of options to return"),
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Find the earliest slots, across all matching rooms, for a meeting.
+    
+    - **duration**: Meeting length in minutes
+    - **min_capacity** / **features**: Room requirements, as for /search
+    - **from** / **to**: Search window (at most MAX_AVAILABILITY_DAYS days)
+    
+    Options are ordered by start time (smaller rooms first on ties), within
+    business hours and never in the past. Each free gap gives one option.
+    
+    Requires authentication.
+    """
+    date_from = date_from or date.today()
+    date_to = date_to or date_from + timedelta(days=6)
+    
+    if date_to < date_from:
+        raise BadRequestException("'to' must not be before 'from'")
+    
+    if date_to - date_from >= timedelta(days=settings.MAX_AVAILABILITY_DAYS):
+        raise BadRequestException(f"Date range cannot exceed {settings.MAX_AVAILABILITY_DAYS} days")
+    
+    return SchedulingService.find_earliest(
+        db,
+        date_from,
+        date_to,
+        duration,
+        min_capacity=min_capacity,
+        features=features,
+        limit=limit,
+        not_before=datetime.now(),
+        viewer_id=current_user.id
+    )
+
+
+@router.get("/occupancy", response_model=MonthOccupancyResponse, status_code=status.HTTP_200_OK)
+def get_month_occupancy(
+    month: str = Query(..., pattern=r"^\d{4}-\d{2}$", description="Month as YYYY-MM"),
+    granularity: int = Query(15, description=f"Minutes per slot, one of {OCCUPANCY_GRANULARITIES}"),
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Get a month of occupancy for every active room as packed bitsets.
+    
+    - **month**: Month to return (YYYY-MM)
+    - **granularity**: Slot size in minutes (15 gives 96 slots per day)
+    
+    Each room's `occupancy` is base64 of `days * bytes_per_day` bytes; bit i
+    of a day (LSB first) is set when slot i overlaps an approved booking.
+    
+    Requires authentication.
+    """
+    year, month_number = (int(part) for part in month.split("-"))
+    if year < 1 or not 1 <= month_number <= 12:
+        raise BadRequestException("Month must be a valid YYYY-MM")
+    
+    if granularity not in OCCUPANCY_GRANULARITIES:
+        raise BadRequestException(f"Granularity must be one of {list(OCCUPANCY_GRANULARITIES)}")
+    
+    return AvailabilityService.get_month_occupancy(db, year, month_number, granularity)
+
+
 @router.get("/{room_id}", response_model=RoomResponse, status_code=status.HTTP_200_OK)
 def get_room(
     room_id: str,
@@ -53,6 +195,43 @@ def get_room(
     return room
 
 
+@router.get("/{room_id}/availability", response_model=RoomAvailabilityResponse, status_code=status.HTTP_200_OK)
+def get_room_availability(
+    room_id: str,
+    date_from: Optional[date] = Query(None, alias="from", description="First day (inclusive), defaults to today"),
+    date_to: Optional[date] = Query(None, alias="to", description="Last day (inclusive), defaults to 'from'"),
+    min_duration: int = Query(30, ge=1, le=24 * 60, description="Shortest free interval to return, in minutes"),
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Get free time intervals for a room, per day, within business hours.
+    
+    - **from** / **to**: Date range (at most MAX_AVAILABILITY_DAYS days)
+    - **min_duration**: Omit gaps shorter than this many minutes
+    
+    Free intervals are returned as compact ["HH:MM", "HH:MM"] pairs.
+    
+    Requires authentication.
+    """
+    room = RoomService.get_by_id(db, room_id)
+    if not room or not room.is_active:
+        raise NotFoundException("Room not found or inactive")
+    
+    date_from = date_from or date.today()
+    date_to = date_to or date_from
+    
+    if date_to < date_from:
+        raise BadRequestException("'to' must not be before 'from'")
+    
+    if date_to - date_from >= timedelta(days=settings.MAX_AVAILABILITY_DAYS):
+        raise BadRequestException(f"Date range cannot exceed {settings.MAX_AVAILABILITY_DAYS} days")
+    
+    return AvailabilityService.get_room_availability(
+        db, room_id, date_from, date_to, min_duration, viewer_id=current_user.id
+    )
+
+
 @router.post("", response_model=RoomResponse, status_code=status.HTTP_201_CREATED)
 def create_room(
     room_data: RoomCreate,
@@ -0,0 +1,43 @@
+from fastapi import APIRouter, Depends, status, Query, Response, Header
+from sqlalchemy.orm import Session
+from typing import Optional
+from datetime import date
+
+from app.variables.database import get_db
+from app.schemas.availability import ScheduleGridResponse
+from app.services.scheduling_service import SchedulingService
+from app.services.version_service import VersionService, BOOKINGS, ROOMS
+from app.api.deps import get_current_active_user
+from app.models.user import User
+from app.utils.etag import make_etag, etag_matches
+
+router = APIRouter(prefix="/schedule", tags=["Schedule"])
+
+
+@router.get("/grid", response_model=ScheduleGridResponse, status_code=status.HTTP_200_OK)
+def get_schedule_grid(
+    response: Response,
+    day: Optional[date] = Query(None, alias="date", description="Day to show (default today)"),
+    floor: Optional[str] = Query(None, description="Only rooms on this floor"),
+    if_none_match: Optional[str] = Header(None),
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Approved schedule of one day as a rooms x time grid.
+    
+    Each active room is a row with its approved bookings as
+    [start_min, end_min, booking_id, title] arrays (see `columns`), ready
+    to draw against day_start/day_end without reshaping BookingResponse
+    lists. Supports If-None-Match like GET /bookings.
+    
+    Requires authentication.
+    """
+    day = day or date.today()
+    etag = make_etag(VersionService.current(db, [BOOKINGS, ROOMS]), date=day, floor=floor)
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "private, no-cache"
+    
+    return SchedulingService.day_grid(db, day, floor=floor)
@@ -1,6 +1,6 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, status, Query
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 
 from app.variables.database import get_db
 from app.schemas.user import UserCreate, UserUpdate, UserResponse
@@ -8,6 +8,8 @@ from app.services.user_service import UserService
 from app.api.deps import get_current_active_user, get_current_admin_user
 from app.models.user import User
 from app.utils.exceptions import NotFoundException, BadRequestException, ForbiddenException
+from app.utils.fields import parse_fields
+from app.utils.serialization import rows_response
 
 router = APIRouter(prefix="/users", tags=["Users"])
 
@@ -79,15 +81,26 @@ def update_my_profile(
 def get_all_users(
     skip: int = 0,
     limit: int = 100,
+    fields: Optional[str] = Query(None, description="Comma-separated UserResponse fields to return (id is always included)"),
     current_user: User = Depends(get_current_admin_user),
     db: Session = Depends(get_db)
 ):
     """
     Get all users (Admin only).
     
+    - **fields**: Sparse fieldset, e.g. `id,name,email`; only those columns
+      are loaded and returned
+    
     Requires admin authentication.
     """
-    users = UserService.get_all(db, skip=skip, limit=limit)
+    try:
+        selected = parse_fields(fields, UserResponse)
+    except ValueError as error:
+        raise BadRequestException(str(error))
+    
+    users = UserService.get_all(db, skip=skip, limit=limit, fields=selected)
+    if selected:
+        return rows_response(users, selected)
     return users
 
 
@@ -31,6 +31,11 @@ class Settings(BaseSettings):
     # Pagination
     DEFAULT_PAGE_SIZE: int = 20
     MAX_PAGE_SIZE: int = 100
+    BOOKING_COUNT_CACHE_SECONDS: int = 30  # X-Total-Count cache lifetime for GET /bookings
+    EXPORT_BATCH_SIZE: int = 1000  # Rows fetched per server-side cursor batch in /bookings/export
+    MAX_SYNC_CHANGES: int = 1000  # Changed rows per /bookings/changes before the client must reload
+    SYNC_OVERLAP_SECONDS: int = 5  # Re-sent window covering transactions still committing at the watermark
+    TOMBSTONE_RETENTION_DAYS: int = 30  # Deleted-booking records kept for delta sync
 
     # Admin user defaults
     ADMIN_EMAIL: str = "admin.user@cygnet.one"
@@ -42,6 +47,31 @@ class Settings(BaseSettings):
     ENABLE_AUTO_CLEANUP: bool = True
     CLEANUP_HOUR: int = 2  # Run at 2:00 AM daily
 
+    # In-memory conflict index (process-local, see ConflictIndex)
+    ENABLE_CONFLICT_INDEX: bool = False
+    CONFLICT_INDEX_MAX_DAYS: int = 5000  # Room-days kept before LRU eviction
+
+    # Approved-schedule page cache for regular users (process-local, see ScheduleCache)
+    ENABLE_SCHEDULE_CACHE: bool = True
+    SCHEDULE_CACHE_MAX_ENTRIES: int = 512  # Pages kept before LRU eviction
+
+    # Availability
+    BUSINESS_HOURS_START: int = 8  # Free slots are reported from 8:00
+    BUSINESS_HOURS_END: int = 20  # ...until 20:00
+    MAX_AVAILABILITY_DAYS: int = 31  # Longest date range per availability query
+    MAX_BATCH_CONFLICT_CANDIDATES: int = 2000  # Slots per POST /bookings/conflicts:batch
+    MAX_CONFLICT_GRAPH_DAYS: int = 92  # Longest date range for the admin conflict graph
+    MAX_SERIES_OCCURRENCES: int = 104  # Occurrences per recurring series (two years weekly)
+
+    # Slot holds (see HoldService): "memory" is per process, "database" is shared by all workers
+    HOLD_BACKEND: str = "memory"
+    HOLD_DEFAULT_SECONDS: int = 120
+    HOLD_MAX_SECONDS: int = 600
+    MAX_HOLDS_PER_USER: int = 3
+
+    # PostgreSQL: query the generated `slot` tsrange column with && (migration 002)
+    POSTGRES_SLOT_RANGE: bool = False
+
     # Pydantic settings - use project root .env
     model_config = SettingsConfigDict(
         env_file=os.path.abspath(
@@ -1,12 +1,20 @@
 from app.models.user import User, RoleEnum
 from app.models.room import Room
-from app.models.booking import Booking, PriorityEnum, BookingStatusEnum
+from app.models.booking import Booking, BookingConflict, BookingTombstone, PriorityEnum, BookingStatusEnum
+from app.models.hold import BookingHold
+from app.models.equipment import EquipmentType
+from app.models.version import DataVersion
 
 __all__ = [
     "User",
     "RoleEnum",
     "Room",
     "Booking",
+    "BookingConflict",
+    "BookingTombstone",
     "PriorityEnum",
     "BookingStatusEnum",
+    "BookingHold",
+    "EquipmentType",
+    "DataVersion",
 ]
\ No newline at end of file
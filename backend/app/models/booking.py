@@ -1,10 +1,11 @@
-from sqlalchemy import Column, String, Integer, Date, Time, DateTime, Enum as SQLEnum, ForeignKey, Text, JSON, Index
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, String, Integer, SmallInteger, Date, Time, DateTime, Enum as SQLEnum, ForeignKey, Text, JSON, Index, DDL, event, literal, literal_column, text
+from sqlalchemy.orm import relationship, validates
 from sqlalchemy.sql import func
 import enum
-from datetime import datetime
+from datetime import datetime, date, time
 
 from app.variables.database import Base
+from app.utils.intervals import to_minutes
 
 
 class PriorityEnum(str, enum.Enum):
@@ -22,6 +23,12 @@ class BookingStatusEnum(str, enum.Enum):
     CANCELLED = "Cancelled"
 
 
+# Partial-index predicate; the ORM persists enum names, not values, which is
+# what create_all databases hold. Migrations 002/003 read the label from
+# pg_enum instead, since 001_initial created the PostgreSQL type from values.
+APPROVED_ONLY = f"status = '{BookingStatusEnum.APPROVED.name}'"
+
+
 class Booking(Base):
     """Booking model for room reservations."""
     
@@ -33,6 +40,9 @@ class Booking(Base):
     date = Column(Date, nullable=False, index=True)
     start_time = Column(Time, nullable=False)
     end_time = Column(Time, nullable=False)
+    # Minute-of-day copies of start_time/end_time, kept in sync by _sync_slot_minutes
+    start_min = Column(SmallInteger, nullable=False)
+    end_min = Column(SmallInteger, nullable=False)
     title = Column(String(255), nullable=False)
     attendees = Column(Integer, nullable=False)
     description = Column(Text, nullable=True)
@@ -40,6 +50,11 @@ class Booking(Base):
     status = Column(SQLEnum(BookingStatusEnum), nullable=False, default=BookingStatusEnum.PENDING, index=True)
     equipment = Column(JSON, nullable=True, default=list)  # Array of equipment strings
     notes = Column(Text, nullable=True)
+    # Shared by the occurrences of a recurring series (see SeriesService)
+    series_id = Column(String(36), nullable=True, index=True)
+    # APPROVED bookings overlapping this one while it is PENDING, 0 otherwise.
+    # Maintained by ConflictService.refresh_conflict_counts on every write path.
+    conflict_count = Column(Integer, nullable=False, default=0, server_default="0")
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
     
@@ -48,17 +63,138 @@ class Booking(Base):
     room = relationship("Room", back_populates="bookings")
     
     # Composite index for conflict detection
+    # idx_booking_slot_approved is partial and covering, so the overlap check
+    # is answered from the index alone; id and status trail the key because
+    # SQLite only reports a covering scan when every referenced column is in
+    # the index. MySQL has no partial indexes and gets status as a key column
+    # instead (InnoDB appends the primary key to secondary indexes).
     __table_args__ = (
         Index('idx_booking_conflict', 'room_id', 'date', 'status'),
+        Index(
+            'idx_booking_slot_approved', 'room_id', 'date', 'start_min', 'end_min', 'id', 'status',
+            postgresql_where=text(APPROVED_ONLY),
+            sqlite_where=text(APPROVED_ONLY)
+        ).ddl_if(dialect=('postgresql', 'sqlite')),
+        Index(
+            'idx_booking_slot_status', 'room_id', 'date', 'status', 'start_min', 'end_min'
+        ).ddl_if(dialect='mysql'),
+        # Admin queue: clean vs contested pending requests
+        Index('idx_booking_status_conflicts', 'status', 'conflict_count'),
+        # Keyset pagination of GET /bookings, newest first (scanned backwards)
+        Index('idx_booking_date_start_id', 'date', 'start_time', 'id'),
+        # Delta sync: rows changed since a watermark (GET /bookings/changes)
+        Index('idx_booking_updated_at', 'updated_at'),
     )
     
+    @validates("start_time", "end_time")
+    def _sync_slot_minutes(self, key, value):
+        """Keep start_min/end_min in step with the time columns."""
+        minutes = to_minutes(value) if value is not None else None
+        if key == "start_time":
+            self.start_min = minutes
+        else:
+            self.end_min = minutes
+        return value
+    
+    @staticmethod
+    def approved_only():
+        """
+        Inline `status = 'APPROVED'` predicate.
+
+        Rendered as a literal rather than a bound parameter so SQLite's planner
+        can match it against the partial idx_booking_slot_approved index.
+        """
+        return text(f"bookings.{APPROVED_ONLY}")
+    
     def __repr__(self):
         return f"<Booking(id={self.id}, user_id={self.user_id}, room_id={self.room_id}, status={self.status})>"
     
+    @staticmethod
+    def slot_overlaps(booking_date: date, start_time: time, end_time: time):
+        """
+        SQL expression testing the PostgreSQL `slot` range against a time slot.
+
+        Only valid on PostgreSQL, where `slot` is created by POSTGRES_SLOT_RANGE_DDL.
+        """
+        return literal_column("bookings.slot").op("&&")(
+            func.tsrange(
+                literal(datetime.combine(booking_date, start_time)),
+                literal(datetime.combine(booking_date, end_time)),
+                literal("[)")
+            )
+        )
+    
     @staticmethod
     def generate_booking_id() -> str:
         """Generate a unique booking ID in format BK-YYYY-NNNN."""
         from random import randint
         year = datetime.now().year
         random_num = randint(1000, 9999)
-        return f"BK-{year}-{random_num}"
\ No newline at end of file
+        return f"BK-{year}-{random_num}"
+
+
+class BookingConflict(Base):
+    """
+    Materialized (pending booking, overlapping approved booking) pair.
+
+    room_id and date repeat the pending booking's so a room-day can be
+    rebuilt with one delete even after its bookings are gone.
+    """
+    
+    __tablename__ = "booking_conflicts"
+    
+    booking_id = Column(String(50), ForeignKey("bookings.id", ondelete="CASCADE"), primary_key=True)
+    conflict_id = Column(String(50), ForeignKey("bookings.id", ondelete="CASCADE"), primary_key=True, index=True)
+    room_id = Column(String(36), nullable=False)
+    date = Column(Date, nullable=False)
+    
+    __table_args__ = (
+        Index('idx_booking_conflicts_room_day', 'room_id', 'date'),
+    )
+    
+    def __repr__(self):
+        return f"<BookingConflict(booking_id={self.booking_id}, conflict_id={self.conflict_id})>"
+
+
+class BookingTombstone(Base):
+    """
+    Record of a deleted booking, so delta-sync clients learn about deletions.
+
+    Booking IDs can be reused after a delete, so tombstones are not keyed by
+    them; ChangeService ignores a tombstone when the ID exists again.
+    """
+    
+    __tablename__ = "booking_tombstones"
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    booking_id = Column(String(50), nullable=False)
+    room_id = Column(String(36), nullable=False)
+    date = Column(Date, nullable=False)
+    deleted_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False, index=True)
+    
+    def __repr__(self):
+        return f"<BookingTombstone(booking_id={self.booking_id}, deleted_at={self.deleted_at})>"
+
+
+# PostgreSQL-only slot range: a generated tsrange column plus an exclusion
+# constraint so two APPROVED bookings can never overlap in the same room.
+# The constraint is backed by a partial GiST index on (room_id, slot), which
+# also serves the `&&` lookups in BookingService.get_conflicting_bookings.
+# It is deferred so a priority override can cancel conflicts and approve in
+# one transaction. Existing databases get the same objects via migration 002.
+POSTGRES_SLOT_RANGE_DDL = [
+    "CREATE EXTENSION IF NOT EXISTS btree_gist",
+    "ALTER TABLE bookings ADD COLUMN IF NOT EXISTS slot tsrange "
+    "GENERATED ALWAYS AS (tsrange(date + start_time, date + end_time, '[)')) STORED",
+    "ALTER TABLE bookings ADD CONSTRAINT excl_booking_approved_overlap "
+    "EXCLUDE USING gist (room_id WITH =, slot WITH &&) "
+    f"WHERE ({APPROVED_ONLY}) "
+    "DEFERRABLE INITIALLY DEFERRED",
+]
+
+for _statement in POSTGRES_SLOT_RANGE_DDL:
+    event.listen(
+        Booking.__table__,
+        "after_create",
+        DDL(_statement).execute_if(dialect="postgresql")
+    )
@@ -0,0 +1,22 @@
+from sqlalchemy import Column, String, Integer, Text, DateTime
+from sqlalchemy.sql import func
+import uuid
+
+from app.variables.database import Base
+
+
+class EquipmentType(Base):
+    """Shared equipment (projectors, video-conference kits) with a limited stock."""
+    
+    __tablename__ = "equipment_types"
+    
+    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    # Matched case-insensitively against the strings in Booking.equipment
+    name = Column(String(100), unique=True, nullable=False, index=True)
+    quantity = Column(Integer, nullable=False)
+    description = Column(Text, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+    
+    def __repr__(self):
+        return f"<EquipmentType(id={self.id}, name={self.name}, quantity={self.quantity})>"
@@ -0,0 +1,27 @@
+from sqlalchemy import Column, String, SmallInteger, Date, DateTime, ForeignKey, Index
+from sqlalchemy.sql import func
+import uuid
+
+from app.variables.database import Base
+
+
+class BookingHold(Base):
+    """Short-lived reservation of a slot while a booking form is filled in."""
+    
+    __tablename__ = "booking_holds"
+    
+    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    user_id = Column(String(36), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    room_id = Column(String(36), ForeignKey("rooms.id", ondelete="CASCADE"), nullable=False)
+    date = Column(Date, nullable=False)
+    start_min = Column(SmallInteger, nullable=False)  # Minutes since midnight
+    end_min = Column(SmallInteger, nullable=False)
+    expires_at = Column(DateTime, nullable=False)  # Naive UTC
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    
+    __table_args__ = (
+        Index('idx_hold_room_day', 'room_id', 'date', 'expires_at'),
+    )
+    
+    def __repr__(self):
+        return f"<BookingHold(id={self.id}, room_id={self.room_id}, date={self.date}, expires_at={self.expires_at})>"
@@ -0,0 +1,18 @@
+from sqlalchemy import Column, String, BigInteger
+
+from app.variables.database import Base
+
+
+class DataVersion(Base):
+    """
+    Monotonic change counter for a slice of data ("bookings", "rooms",
+    "users" or one room-day), bumped inside every write transaction.
+    """
+    
+    __tablename__ = "data_versions"
+    
+    scope = Column(String(100), primary_key=True)
+    version = Column(BigInteger, nullable=False, default=0)
+    
+    def __repr__(self):
+        return f"<DataVersion(scope={self.scope}, version={self.version})>"
@@ -15,12 +15,48 @@ from app.schemas.room import (
 from app.schemas.booking import (
     PriorityEnum,
     BookingStatusEnum,
+    RecurrenceFrequencyEnum,
     BookingBase,
     BookingCreate,
     BookingUpdate,
     BookingStatusUpdate,
     BookingResponse,
-    BookingWithDetails
+    BookingWithDetails,
+    ConflictCandidate,
+    BatchConflictRequest,
+    BatchConflictResult,
+    BatchConflictResponse,
+    ConflictGraphNode,
+    ConflictGraphResponse,
+    ApprovalPlanResponse,
+    ApprovalPlanApply,
+    ApprovalApplyResponse,
+    HoldCreate,
+    HoldResponse,
+    ConflictCountVerifyResponse,
+    ConflictCountRebuildResponse,
+    RecurrenceRule,
+    BookingSeriesCreate,
+    BookingSeriesResponse,
+    BookingSeriesCancelResponse,
+    BookingChangesResponse
+)
+from app.schemas.availability import (
+    DayAvailability,
+    RoomAvailabilityResponse,
+    EarliestSlotOption,
+    RoomOccupancy,
+    MonthOccupancyResponse,
+    ScheduleGridRoom,
+    ScheduleGridResponse
+)
+from app.schemas.equipment import (
+    EquipmentTypeBase,
+    EquipmentTypeCreate,
+    EquipmentTypeUpdate,
+    EquipmentTypeResponse,
+    EquipmentUsage,
+    EquipmentUtilizationResponse
 )
 from app.schemas.auth import (
     LoginRequest,
@@ -45,12 +81,46 @@ __all__ = [
     # Booking
     "PriorityEnum",
     "BookingStatusEnum",
+    "RecurrenceFrequencyEnum",
     "BookingBase",
     "BookingCreate",
     "BookingUpdate",
     "BookingStatusUpdate",
     "BookingResponse",
     "BookingWithDetails",
+    "ConflictCandidate",
+    "BatchConflictRequest",
+    "BatchConflictResult",
+    "BatchConflictResponse",
+    "ConflictGraphNode",
+    "ConflictGraphResponse",
+    "ApprovalPlanResponse",
+    "ApprovalPlanApply",
+    "ApprovalApplyResponse",
+    "HoldCreate",
+    "HoldResponse",
+    "ConflictCountVerifyResponse",
+    "ConflictCountRebuildResponse",
+    "RecurrenceRule",
+    "BookingSeriesCreate",
+    "BookingSeriesResponse",
+    "BookingSeriesCancelResponse",
+    "BookingChangesResponse",
+    # Availability
+    "DayAvailability",
+    "RoomAvailabilityResponse",
+    "EarliestSlotOption",
+    "RoomOccupancy",
+    "MonthOccupancyResponse",
+    "ScheduleGridRoom",
+    "ScheduleGridResponse",
+    # Equipment
+    "EquipmentTypeBase",
+    "EquipmentTypeCreate",
+    "EquipmentTypeUpdate",
+    "EquipmentTypeResponse",
+    "EquipmentUsage",
+    "EquipmentUtilizationResponse",
     # Auth
     "LoginRequest",
     "TokenResponse",
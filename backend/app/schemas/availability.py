@@ -0,0 +1,75 @@
+from pydantic import BaseModel
+from typing import List, Tuple
+from datetime import date, time
+
+
+class DayAvailability(BaseModel):
+    """Free intervals for one day as [start, end) "HH:MM" pairs."""
+    date: date
+    free: List[Tuple[str, str]]
+
+
+class RoomAvailabilityResponse(BaseModel):
+    """Schema for room availability over a date range."""
+    room_id: str
+    date_from: date
+    date_to: date
+    business_hours: Tuple[str, str]
+    min_duration: int  # Minutes
+    days: List[DayAvailability]
+
+
+class EarliestSlotOption(BaseModel):
+    """A bookable (room, start) option returned by the auto-scheduler."""
+    room_id: str
+    room_name: str
+    capacity: int
+    date: date
+    start_time: time
+    end_time: time
+
+
+class RoomOccupancy(BaseModel):
+    """Packed occupancy bitsets for one room, all days of the month back to back."""
+    room_id: str
+    occupancy: str  # Base64
+
+
+class MonthOccupancyResponse(BaseModel):
+    """
+    Schema for a month of per-room occupancy bitsets.
+
+    Each day is bytes_per_day bytes; bit i (little-endian, LSB first within
+    a byte) is set when slot i, covering [i * granularity, (i + 1) * granularity)
+    minutes after midnight, overlaps an approved booking.
+    """
+    month: str  # YYYY-MM
+    days: int
+    granularity: int  # Minutes per slot
+    slots_per_day: int
+    bytes_per_day: int
+    rooms: List[RoomOccupancy]
+
+
+class ScheduleGridRoom(BaseModel):
+    """One grid row: a room and its approved blocks in start order."""
+    id: str
+    name: str
+    floor: str
+    room_number: str
+    capacity: int
+    blocks: List[Tuple[int, int, str, str]]  # (start_min, end_min, booking_id, title)
+
+
+class ScheduleGridResponse(BaseModel):
+    """
+    Schema for the rooms x hours dashboard grid of one day.
+
+    Blocks are arrays in the order given by `columns`; minutes count from
+    midnight and day_start/day_end are the business hours to draw.
+    """
+    date: date
+    day_start: int
+    day_end: int
+    columns: Tuple[str, str, str, str]
+    rooms: List[ScheduleGridRoom]
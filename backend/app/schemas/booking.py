@@ -1,11 +1,12 @@
-from pydantic import BaseModel, Field, field_validator
-from typing import Optional, List, Any
+from pydantic import BaseModel, Field, field_validator, model_validator
+from typing import Optional, List, Dict, Any
 from datetime import datetime, date, time
 from enum import Enum
 
 # Import related schemas at module level, not inside class
 from app.schemas.user import UserResponse
 from app.schemas.room import RoomResponse
+from app.core.config import settings
 
 
 class PriorityEnum(str, Enum):
@@ -23,6 +24,12 @@ class BookingStatusEnum(str, Enum):
     CANCELLED = "Cancelled"
 
 
+class RecurrenceFrequencyEnum(str, Enum):
+    """Recurring series frequency."""
+    DAILY = "Daily"
+    WEEKLY = "Weekly"
+
+
 class BookingBase(BaseModel):
     """Base booking schema."""
     room_id: str
@@ -87,6 +94,8 @@ class BookingResponse(BookingBase):
     room_name: str  # Computed field
     status: BookingStatusEnum
     notes: Optional[str] = None
+    conflict_count: int = 0  # Overlapping approved bookings while pending
+    series_id: Optional[str] = None  # Set on occurrences of a recurring series
     created_at: datetime
     updated_at: datetime
 
@@ -99,3 +108,180 @@ class BookingWithDetails(BookingResponse):
     """Booking response with full user and room details."""
     user: UserResponse
     room: RoomResponse
+
+
+class ConflictCandidate(BaseModel):
+    """A (room, date, start, end) slot to test for conflicts."""
+    room_id: str
+    date: date
+    start_time: time
+    end_time: time
+
+    @field_validator('end_time')
+    @classmethod
+    def validate_end_time(cls, v, info):
+        """Validate that end_time is after start_time."""
+        if 'start_time' in info.data and v <= info.data['start_time']:
+            raise ValueError('end_time must be after start_time')
+        return v
+
+
+class BatchConflictRequest(BaseModel):
+    """Schema for checking many candidate slots at once."""
+    candidates: List[ConflictCandidate] = Field(
+        ..., min_length=1, max_length=settings.MAX_BATCH_CONFLICT_CANDIDATES
+    )
+
+
+class BatchConflictResult(BaseModel):
+    """Conflicting approved booking IDs for one candidate, by request position."""
+    index: int
+    conflict_ids: List[str]
+
+
+class BatchConflictResponse(BaseModel):
+    """Schema for batch conflict check response."""
+    room_days: int  # Distinct (room, date) keys loaded
+    results: List[BatchConflictResult]
+
+
+class ConflictGraphNode(BaseModel):
+    """A pending or approved booking in the conflict graph."""
+    id: str
+    status: BookingStatusEnum
+    priority: PriorityEnum
+    title: str
+    date: date
+    start_time: time
+    end_time: time
+    room_id: str
+    room_name: str
+    user_id: str
+    user_name: str
+
+
+class ConflictGraphResponse(BaseModel):
+    """
+    Schema for the pending-queue conflict graph.
+
+    Every pending booking in the range is a node; approved bookings appear
+    only when they collide with a pending one. Edges are undirected and
+    listed under both endpoints.
+    """
+    date_from: date
+    date_to: date
+    nodes: List[ConflictGraphNode]
+    adjacency: Dict[str, List[str]]
+
+
+class ApprovalPlanResponse(BaseModel):
+    """Schema for a bulk approval dry run."""
+    date_from: date
+    date_to: date
+    room_days: int
+    pending: int
+    approve: List[str]
+    reject: List[str]
+    total_weight: float
+
+
+class ApprovalPlanApply(BaseModel):
+    """Schema for applying a bulk approval plan."""
+    approve: List[str] = Field(default_factory=list)
+    reject: List[str] = Field(default_factory=list)
+    notes: Optional[str] = None  # Rejection note, defaults to a generic reason
+
+
+class ApprovalApplyResponse(BaseModel):
+    """Schema for bulk approval result."""
+    approved: int
+    rejected: int
+
+
+class HoldCreate(ConflictCandidate):
+    """Schema for holding a slot while the booking form is filled in."""
+    seconds: int = Field(settings.HOLD_DEFAULT_SECONDS, ge=1, le=settings.HOLD_MAX_SECONDS)
+
+
+class HoldResponse(BaseModel):
+    """Schema for an active slot hold."""
+    id: str
+    room_id: str
+    date: date
+    start_time: time
+    end_time: time
+    expires_at: datetime  # UTC
+
+
+class ConflictCountVerifyResponse(BaseModel):
+    """Schema for conflict counter drift check."""
+    room_days: int
+    checked: int
+    drifted: List[str]  # First 100 booking IDs
+    drift_count: int
+    repaired: int  # Room-days rebuilt
+
+
+class ConflictCountRebuildResponse(BaseModel):
+    """Schema for conflict counter rebuild."""
+    room_days: int
+    updated: int
+
+
+class RecurrenceRule(BaseModel):
+    """
+    RRULE-like recurrence starting on the booking date.
+
+    Repeats every `interval` days or weeks, on `by_weekday` (0 = Monday,
+    weekly only, defaults to the start date's weekday), until a date or
+    for a number of occurrences; exactly one of `until` and `count`.
+    """
+    frequency: RecurrenceFrequencyEnum
+    interval: int = Field(1, ge=1, le=52)
+    by_weekday: List[int] = Field(default_factory=list)
+    until: Optional[date] = None  # Inclusive
+    count: Optional[int] = Field(None, ge=1, le=settings.MAX_SERIES_OCCURRENCES)
+
+    @field_validator("by_weekday")
+    @classmethod
+    def validate_by_weekday(cls, value: List[int]) -> List[int]:
+        """Validate weekdays and drop duplicates."""
+        if any(day < 0 or day > 6 for day in value):
+            raise ValueError("by_weekday values must be 0 (Monday) to 6 (Sunday)")
+        return sorted(set(value))
+
+    @model_validator(mode="after")
+    def validate_end(self):
+        """Validate the series has exactly one end condition."""
+        if (self.until is None) == (self.count is None):
+            raise ValueError("Provide exactly one of until or count")
+        if self.by_weekday and self.frequency != RecurrenceFrequencyEnum.WEEKLY:
+            raise ValueError("by_weekday is only valid for weekly series")
+        return self
+
+
+class BookingSeriesCreate(BookingBase):
+    """Schema for creating a recurring series; `date` is the first occurrence."""
+    recurrence: RecurrenceRule
+    skip_conflicts: bool = False  # Leave out dates that collide with approved bookings
+
+
+class BookingSeriesResponse(BaseModel):
+    """Schema for a created recurring series."""
+    series_id: str
+    bookings: List[BookingResponse]
+    skipped: List[date]  # Dates left out because of conflicts
+
+
+class BookingSeriesCancelResponse(BaseModel):
+    """Schema for cancelling the rest of a recurring series."""
+    series_id: str
+    cancelled: int
+
+
+class BookingChangesResponse(BaseModel):
+    """Schema for delta sync of booking lists since a watermark."""
+    changed: List[BookingResponse]
+    deleted: List[str]
+    watermark: str
+    reset: bool
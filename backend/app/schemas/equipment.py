@@ -0,0 +1,50 @@
+from pydantic import BaseModel, Field
+from typing import Optional, List
+from datetime import date, datetime, time
+
+
+class EquipmentTypeBase(BaseModel):
+    """Base equipment type schema."""
+    name: str = Field(..., min_length=1, max_length=100)
+    quantity: int = Field(..., ge=0)
+    description: Optional[str] = None
+
+
+class EquipmentTypeCreate(EquipmentTypeBase):
+    """Schema for adding equipment to the inventory."""
+    pass
+
+
+class EquipmentTypeUpdate(BaseModel):
+    """Schema for updating an equipment type."""
+    name: Optional[str] = Field(None, min_length=1, max_length=100)
+    quantity: Optional[int] = Field(None, ge=0)
+    description: Optional[str] = None
+
+
+class EquipmentTypeResponse(EquipmentTypeBase):
+    """Schema for equipment type response."""
+    id: str
+    created_at: datetime
+    updated_at: datetime
+    
+    model_config = {"from_attributes": True}
+
+
+class EquipmentUsage(BaseModel):
+    """Peak concurrent use of one equipment type on a day."""
+    equipment_id: str
+    name: str
+    quantity: int
+    bookings: int  # Approved bookings using it
+    peak_in_use: int
+    peak_start: Optional[time] = None  # First stretch at the peak
+    peak_end: Optional[time] = None
+    overcommitted: bool
+
+
+class EquipmentUtilizationResponse(BaseModel):
+    """Schema for per-day equipment utilization."""
+    date: date
+    equipment: List[EquipmentUsage]
+    untracked: List[str]  # Requested by approved bookings but not in the inventory
@@ -0,0 +1,427 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import text
+from bisect import bisect_right
+from collections import defaultdict
+from contextlib import ExitStack, contextmanager
+from datetime import date, datetime, timezone
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple, Any
+import hashlib
+import threading
+
+from app.models.booking import Booking, BookingStatusEnum, PriorityEnum
+from app.models.user import User
+from app.services.conflict_index import ConflictIndex
+from app.services.conflict_service import ConflictService
+from app.services.version_service import VersionService
+from app.utils.intervals import IntervalSet
+
+# Weight of a pending request in the bulk approval optimizer
+PRIORITY_WEIGHTS = {
+    PriorityEnum.LOW: 100.0,
+    PriorityEnum.MEDIUM: 200.0,
+    PriorityEnum.HIGH: 400.0,
+}
+AGE_WEIGHT_PER_DAY = 5.0  # Older requests win ties
+MAX_AGE_DAYS = 30
+ATTENDEE_WEIGHT = 1.0  # Fuller meetings win ties
+
+# Keeps IN lists under every dialect's bound-parameter limit
+BULK_UPDATE_CHUNK_SIZE = 500
+
+DEFAULT_REJECT_NOTE = "Rejected by bulk approval: overlaps a higher-weighted or approved booking"
+
+# Process-local fallback for dialects without advisory locks (SQLite). A fixed
+# stripe of locks keeps memory bounded; unrelated room-days rarely share one.
+_LOCAL_LOCK_STRIPES = 256
+_local_locks = [threading.Lock() for _ in range(_LOCAL_LOCK_STRIPES)]
+MYSQL_LOCK_TIMEOUT_SECONDS = 10
+
+
+class ApprovalService:
+    """Service for approving many pending bookings at once."""
+
+    @staticmethod
+    def booking_weight(priority: PriorityEnum, attendees: int, created_at: Optional[datetime], now: datetime) -> float:
+        """Weight of a pending booking from its priority, age and attendee count."""
+        weight = PRIORITY_WEIGHTS[priority] + ATTENDEE_WEIGHT * attendees
+        if created_at is not None:
+            if created_at.tzinfo is None:
+                created_at = created_at.replace(tzinfo=timezone.utc)
+            age_days = max(0, (now - created_at).days)
+            weight += AGE_WEIGHT_PER_DAY * min(age_days, MAX_AGE_DAYS)
+        return weight
+
+    @staticmethod
+    def select_max_weight(intervals: List[Tuple[int, int, float, str]]) -> List[str]:
+        """
+        Weighted interval scheduling over (start, end, weight, id) tuples.
+
+        Classic O(n log n) dynamic programme: sort by end, binary-search the
+        last compatible interval, and keep the better of skip/take.
+
+        Returns:
+            IDs of a maximum-weight set of non-overlapping intervals
+        """
+        ordered = sorted(intervals, key=lambda item: (item[1], item[0]))
+        ends = [item[1] for item in ordered]
+        best = [0.0] * (len(ordered) + 1)
+        compatible = [0] * len(ordered)
+
+        for position, (start, _, weight, _) in enumerate(ordered):
+            # Intervals are half-open, so one ending exactly at `start` is compatible
+            compatible[position] = bisect_right(ends, start, 0, position)
+            best[position + 1] = max(best[position], best[compatible[position]] + weight)
+
+        chosen = []
+        position = len(ordered)
+        while position > 0:
+            weight, booking_id = ordered[position - 1][2], ordered[position - 1][3]
+            if best[compatible[position - 1]] + weight >= best[position - 1]:
+                chosen.append(booking_id)
+                position = compatible[position - 1]
+            else:
+                position -= 1
+        chosen.reverse()
+        return chosen
+
+    @staticmethod
+    def plan(
+        db: Session,
+        date_from: date,
+        date_to: date,
+        room_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Compute an approve/reject plan for all pending bookings in a range (dry run).
+
+        Pending requests that overlap an already approved booking are rejected;
+        the rest are resolved per room-day by weighted interval scheduling.
+
+        Returns:
+            Dictionary matching ApprovalPlanResponse
+        """
+        query = db.query(
+            Booking.id,
+            Booking.room_id,
+            Booking.date,
+            Booking.start_min,
+            Booking.end_min,
+            Booking.status,
+            Booking.priority,
+            Booking.attendees,
+            Booking.created_at
+        ).filter(
+            Booking.date >= date_from,
+            Booking.date <= date_to,
+            Booking.status.in_([BookingStatusEnum.PENDING, BookingStatusEnum.APPROVED])
+        )
+        if room_id:
+            query = query.filter(Booking.room_id == room_id)
+
+        now = datetime.now(timezone.utc)
+        approved: Dict[Tuple[str, date], List[Tuple[int, int, str]]] = defaultdict(list)
+        pending: Dict[Tuple[str, date], List[Tuple[int, int, float, str]]] = defaultdict(list)
+        for row in query.all():
+            key = (row.room_id, row.date)
+            if row.status == BookingStatusEnum.APPROVED:
+                approved[key].append((row.start_min, row.end_min, row.id))
+            else:
+                weight = ApprovalService.booking_weight(row.priority, row.attendees, row.created_at, now)
+                pending[key].append((row.start_min, row.end_min, weight, row.id))
+
+        to_approve: List[str] = []
+        to_reject: List[str] = []
+        total_weight = 0.0
+        for key, candidates in pending.items():
+            fixed = IntervalSet(approved.get(key, ()))
+            free = []
+            for candidate in candidates:
+                if fixed.overlapping(candidate[0], candidate[1]):
+                    to_reject.append(candidate[3])
+                else:
+                    free.append(candidate)
+
+            chosen = set(ApprovalService.select_max_weight(free))
+            for start, end, weight, booking_id in free:
+                if booking_id in chosen:
+                    to_approve.append(booking_id)
+                    total_weight += weight
+                else:
+                    to_reject.append(booking_id)
+
+        return {
+            "date_from": date_from,
+            "date_to": date_to,
+            "room_days": len(pending),
+            "pending": len(to_approve) + len(to_reject),
+            "approve": sorted(to_approve),
+            "reject": sorted(to_reject),
+            "total_weight": total_weight
+        }
+
+    @staticmethod
+    def validate_plan(db: Session, approve_ids: List[str], reject_ids: List[str]) -> List[str]:
+        """
+        Check a plan against the current database state.
+
+        Returns:
+            List of problems; empty when the plan can be applied
+        """
+        problems = []
+        overlap = set(approve_ids) & set(reject_ids)
+        if overlap:
+            problems.append(f"Bookings both approved and rejected: {sorted(overlap)}")
+
+        rows = []
+        all_ids = list(approve_ids) + list(reject_ids)
+        for offset in range(0, len(all_ids), BULK_UPDATE_CHUNK_SIZE):
+            rows.extend(
+                db.query(Booking.id, Booking.room_id, Booking.date, Booking.start_min, Booking.end_min, Booking.status)
+                .filter(Booking.id.in_(all_ids[offset:offset + BULK_UPDATE_CHUNK_SIZE]))
+                .all()
+            )
+        found = {row.id: row for row in rows}
+
+        missing = [booking_id for booking_id in all_ids if booking_id not in found]
+        if missing:
+            problems.append(f"Bookings not found: {sorted(missing)[:20]}")
+        not_pending = [row.id for row in rows if row.status != BookingStatusEnum.PENDING]
+        if not_pending:
+            problems.append(f"Bookings no longer pending: {sorted(not_pending)[:20]}")
+        if problems:
+            return problems
+
+        approving = [found[booking_id] for booking_id in approve_ids]
+        existing = ConflictService.load_approved_intervals(db, {(row.room_id, row.date) for row in approving})
+        planned: Dict[Tuple[str, date], IntervalSet] = defaultdict(IntervalSet)
+        clashes = []
+        for row in approving:
+            key = (row.room_id, row.date)
+            if (key in existing and existing[key].overlapping(row.start_min, row.end_min)) or \
+                    planned[key].overlapping(row.start_min, row.end_min):
+                clashes.append(row.id)
+            planned[key].add(row.start_min, row.end_min, row.id)
+        if clashes:
+            problems.append(f"Approvals would overlap: {sorted(clashes)[:20]}")
+        return problems
+
+    @staticmethod
+    def room_days(db: Session, booking_ids: List[str]) -> Set[Tuple[str, date]]:
+        """Distinct (room_id, date) of the given bookings."""
+        keys = set()
+        for offset in range(0, len(booking_ids), BULK_UPDATE_CHUNK_SIZE):
+            keys.update(
+                tuple(row) for row in db.query(Booking.room_id, Booking.date).filter(
+                    Booking.id.in_(booking_ids[offset:offset + BULK_UPDATE_CHUNK_SIZE])
+                ).distinct()
+            )
+        return keys
+
+    @staticmethod
+    def apply_plan(
+        db: Session,
+        approve_ids: List[str],
+        reject_ids: List[str],
+        notes: Optional[str] = None
+    ) -> Dict[str, int]:
+        """
+        Apply an approve/reject plan with bulk UPDATEs in a single transaction.
+
+        Only rows still PENDING are touched. Call validate_plan first in the
+        same transaction, both under room_day_locks for every room-day in the
+        plan.
+
+        Returns:
+            Dictionary with approved and rejected row counts
+        """
+        approved = 0
+        for offset in range(0, len(approve_ids), BULK_UPDATE_CHUNK_SIZE):
+            approved += db.query(Booking).filter(
+                Booking.id.in_(approve_ids[offset:offset + BULK_UPDATE_CHUNK_SIZE]),
+                Booking.status == BookingStatusEnum.PENDING
+            ).update({Booking.status: BookingStatusEnum.APPROVED}, synchronize_session=False)
+
+        rejected = 0
+        for offset in range(0, len(reject_ids), BULK_UPDATE_CHUNK_SIZE):
+            rejected += db.query(Booking).filter(
+                Booking.id.in_(reject_ids[offset:offset + BULK_UPDATE_CHUNK_SIZE]),
+                Booking.status == BookingStatusEnum.PENDING
+            ).update(
+                {Booking.status: BookingStatusEnum.REJECTED, Booking.notes: notes or DEFAULT_REJECT_NOTE},
+                synchronize_session=False
+            )
+
+        touched_days = ApprovalService.room_days(db, approve_ids + reject_ids)
+        ConflictService.refresh_conflict_counts(db, touched_days)
+        VersionService.bump(db, touched_days)
+        db.commit()
+        # Bulk UPDATEs bypass the ORM; newly approved room-days reload on demand
+        if approved:
+            ConflictIndex.invalidate()
+
+        return {"approved": approved, "rejected": rejected}
+
+    @staticmethod
+    def _room_day_lock_key(room_id: str, booking_date: date) -> bytes:
+        """Stable 8-byte digest of a (room_id, date) pair."""
+        return hashlib.blake2b(f"{room_id}|{booking_date.isoformat()}".encode(), digest_size=8).digest()
+
+    @staticmethod
+    @contextmanager
+    def room_day_lock(db: Session, room_id: str, booking_date: date) -> Iterator[None]:
+        """
+        Serialize approvals for one room-day until the block's transaction ends.
+
+        - PostgreSQL: pg_advisory_xact_lock on a 64-bit hash of the key, held by
+          the current transaction and released by its COMMIT/ROLLBACK.
+        - MySQL: GET_LOCK/RELEASE_LOCK on a named lock for the connection. The
+          open transaction is committed first: InnoDB's REPEATABLE READ fixes
+          its snapshot at the first read, so reads made before the lock would
+          otherwise hide rows committed while this session waited for it.
+        - SQLite and others: a striped threading.Lock. SQLite already serializes
+          writers, but the conflict SELECT and the UPDATEs are separate
+          statements, so this guards the gap between them. It only covers one
+          process; run a single worker when SQLite is the database.
+
+        Take the lock before writing anything, and commit or roll back before
+        the block exits. Reads inside the block must see data committed by
+        earlier lock holders: on PostgreSQL that needs READ COMMITTED (the
+        default); REPEATABLE READ and SERIALIZABLE are not supported.
+        """
+        with ApprovalService.room_day_locks(db, [(room_id, booking_date)]):
+            yield
+
+    @staticmethod
+    @contextmanager
+    def room_day_locks(db: Session, room_days: Iterable[Tuple[str, date]]) -> Iterator[None]:
+        """
+        Take room_day_lock for several room-days at once.
+
+        Locks are acquired in a fixed order (by key digest, or by stripe for
+        the in-process fallback) so concurrent callers cannot deadlock.
+        """
+        keys = sorted({ApprovalService._room_day_lock_key(room_id, booking_date) for room_id, booking_date in room_days})
+        dialect = db.get_bind().dialect.name
+
+        if dialect == "postgresql":
+            for key in keys:
+                db.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": int.from_bytes(key, "big", signed=True)})
+            yield
+            return
+
+        if dialect in ("mysql", "mariadb"):
+            # Start a fresh snapshot after the locks (see room_day_lock)
+            db.commit()
+            with ExitStack() as held:
+                for key in keys:
+                    name = f"room_day:{key.hex()}"
+                    acquired = db.execute(
+                        text("SELECT GET_LOCK(:name, :timeout)"),
+                        {"name": name, "timeout": MYSQL_LOCK_TIMEOUT_SECONDS}
+                    ).scalar()
+                    if acquired != 1:
+                        raise TimeoutError(f"Could not lock room-day {key.hex()}")
+                    held.callback(db.execute, text("SELECT RELEASE_LOCK(:name)"), {"name": name})
+                yield
+            return
+
+        stripes = sorted({int.from_bytes(key, "big") % _LOCAL_LOCK_STRIPES for key in keys})
+        with ExitStack() as held:
+            for stripe in stripes:
+                held.enter_context(_local_locks[stripe])
+            yield
+
+    @staticmethod
+    def approve_locked(
+        db: Session,
+        booking_id: str,
+        cancel_conflicts: bool = False,
+        notes: Optional[str] = None
+    ) -> Tuple[Optional[Booking], List[Booking], int]:
+        """
+        Approve a pending booking under a (room_id, date) lock.
+
+        The conflict check, the cancellation of conflicts and the approval all
+        run inside the same lock and transaction, so two admins approving
+        overlapping requests cannot both succeed, provided the isolation
+        requirement of room_day_lock holds. Conflicts are read from the
+        database (never the in-memory ConflictIndex) and cancelled with one
+        set-based UPDATE; the approval itself is guarded by status = PENDING
+        and by the slot that was checked, so a booking moved to another slot,
+        room or day meanwhile is not approved.
+
+        Returns:
+            tuple: (approved_booking, blocking_conflicts, cancelled_count).
+            approved_booking is None when the booking is missing, no longer
+            pending, moved while the lock was awaited, or blocked by conflicts
+            (listed when cancel_conflicts is False).
+        """
+        slot_query = db.query(Booking.room_id, Booking.date, Booking.start_min, Booking.end_min).filter(
+            Booking.id == booking_id
+        )
+        target = slot_query.first()
+        if not target:
+            return None, [], 0
+
+        cancelled = 0
+        with ApprovalService.room_day_lock(db, target.room_id, target.date):
+            try:
+                # The lock is keyed on the slot read above; give up if it moved since
+                current = slot_query.first()
+                if current is None or tuple(current) != tuple(target):
+                    db.rollback()
+                    return None, [], 0
+
+                conflict_ids = [row.id for row in db.query(Booking.id).filter(
+                    Booking.room_id == target.room_id,
+                    Booking.date == target.date,
+                    Booking.approved_only(),
+                    Booking.start_min < target.end_min,
+                    Booking.end_min > target.start_min,
+                    Booking.id != booking_id
+                )]
+
+                if conflict_ids and not cancel_conflicts:
+                    conflicts = db.query(Booking).filter(Booking.id.in_(conflict_ids)).order_by(Booking.start_time).all()
+                    db.rollback()
+                    return None, conflicts, 0
+
+                values = {Booking.status: BookingStatusEnum.APPROVED}
+                if notes:
+                    values[Booking.notes] = notes
+                approved = db.query(Booking).filter(
+                    Booking.id == booking_id,
+                    Booking.status == BookingStatusEnum.PENDING,
+                    Booking.room_id == target.room_id,
+                    Booking.date == target.date,
+                    Booking.start_min == target.start_min,
+                    Booking.end_min == target.end_min
+                ).update(values, synchronize_session=False)
+                if not approved:
+                    db.rollback()
+                    return None, [], 0
+
+                if conflict_ids:
+                    owner = db.query(User.name).join(Booking, Booking.user_id == User.id).filter(
+                        Booking.id == booking_id
+                    ).scalar()
+                    cancelled = db.query(Booking).filter(Booking.id.in_(conflict_ids)).filter(
+                        Booking.approved_only()
+                    ).update(
+                        {
+                            Booking.status: BookingStatusEnum.CANCELLED,
+                            Booking.notes: f"Revoked by Admin for Priority Override by {owner}"
+                        },
+                        synchronize_session=False
+                    )
+
+                ConflictService.refresh_conflict_counts(db, [(target.room_id, target.date)])
+                VersionService.bump(db, [(target.room_id, target.date)])
+                db.commit()
+            except BaseException:
+                db.rollback()
+                raise
+
+        # Set-based UPDATEs bypass the ORM hooks that keep the index in sync
+        ConflictIndex.invalidate(room_id=target.room_id, booking_date=target.date)
+        return db.query(Booking).filter(Booking.id == booking_id).first(), [], cancelled
@@ -0,0 +1,158 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import and_
+from collections import defaultdict
+from datetime import date, timedelta
+from typing import Dict, List, Optional, Tuple, Any
+import base64
+import calendar
+
+from app.models.booking import Booking
+from app.models.room import Room
+from app.core.config import settings
+from app.services.hold_service import HoldService
+from app.utils.intervals import free_gaps, format_minutes, MINUTES_PER_DAY
+
+# Slot sizes that divide a day evenly
+OCCUPANCY_GRANULARITIES = (5, 10, 15, 30, 60)
+
+
+class AvailabilityService:
+    """Service for free/busy queries over approved bookings."""
+
+    @staticmethod
+    def business_hours() -> Tuple[int, int]:
+        """Return the configured business day as (start_min, end_min)."""
+        return settings.BUSINESS_HOURS_START * 60, settings.BUSINESS_HOURS_END * 60
+
+    @staticmethod
+    def get_busy_intervals(
+        db: Session,
+        room_id: str,
+        date_from: date,
+        date_to: date
+    ) -> Dict[date, List[Tuple[int, int]]]:
+        """
+        Load approved intervals for a room and date range in one query.
+
+        Rows come back ordered by (date, start_min), which is the order of
+        idx_booking_slot_approved, so no sort is needed afterwards.
+        """
+        rows = db.query(Booking.date, Booking.start_min, Booking.end_min).filter(
+            Booking.room_id == room_id,
+            Booking.date >= date_from,
+            Booking.date <= date_to,
+            Booking.approved_only()
+        ).order_by(Booking.date, Booking.start_min).all()
+
+        busy: Dict[date, List[Tuple[int, int]]] = defaultdict(list)
+        for booking_date, start_min, end_min in rows:
+            busy[booking_date].append((start_min, end_min))
+        return busy
+
+    @staticmethod
+    def get_room_availability(
+        db: Session,
+        room_id: str,
+        date_from: date,
+        date_to: date,
+        min_duration: int,
+        viewer_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Compute free intervals per day for a room within business hours.
+
+        Slots held by other users (see HoldService) count as busy.
+
+        Args:
+            db: Database session
+            room_id: Room to check
+            date_from: First day (inclusive)
+            date_to: Last day (inclusive)
+            min_duration: Shortest free interval to report, in minutes
+            viewer_id: User whose own holds are not treated as busy
+
+        Returns:
+            Dictionary matching RoomAvailabilityResponse
+        """
+        day_start, day_end = AvailabilityService.business_hours()
+        busy = AvailabilityService.get_busy_intervals(db, room_id, date_from, date_to)
+        held = HoldService.busy_intervals(db, date_from, date_to, room_ids=[room_id], exclude_user_id=viewer_id)
+        for (_, held_date), intervals in held.items():
+            busy[held_date] = sorted(busy[held_date] + intervals)
+
+        days = []
+        current = date_from
+        while current <= date_to:
+            gaps = free_gaps(busy.get(current, ()), day_start, day_end, min_duration)
+            days.append({
+                "date": current,
+                "free": [(format_minutes(start), format_minutes(end)) for start, end in gaps]
+            })
+            current += timedelta(days=1)
+
+        return {
+            "room_id": room_id,
+            "date_from": date_from,
+            "date_to": date_to,
+            "business_hours": (format_minutes(day_start), format_minutes(day_end)),
+            "min_duration": min_duration,
+            "days": days
+        }
+
+    @staticmethod
+    def get_month_occupancy(db: Session, year: int, month: int, granularity: int = 15) -> Dict[str, Any]:
+        """
+        Build per-room, per-day occupancy bitsets for a month.
+
+        Rooms and their approved bookings for the month come from a single
+        outer-join query. Each booking sets its whole run of slot bits with
+        one shift-and-or on a per-day integer, so the cost is O(bookings),
+        not O(bookings * slots).
+
+        Args:
+            db: Database session
+            year: Calendar year
+            month: Calendar month (1-12)
+            granularity: Minutes per slot, one of OCCUPANCY_GRANULARITIES
+
+        Returns:
+            Dictionary matching MonthOccupancyResponse
+        """
+        days_in_month = calendar.monthrange(year, month)[1]
+        first_day = date(year, month, 1)
+        last_day = date(year, month, days_in_month)
+        slots_per_day = MINUTES_PER_DAY // granularity
+        bytes_per_day = (slots_per_day + 7) // 8
+
+        rows = db.query(Room.id, Booking.date, Booking.start_min, Booking.end_min).outerjoin(
+            Booking,
+            and_(
+                Booking.room_id == Room.id,
+                Booking.date >= first_day,
+                Booking.date <= last_day,
+                Booking.approved_only()
+            )
+        ).filter(Room.is_active == True).order_by(Room.name, Room.id).all()
+
+        day_bits: Dict[str, List[int]] = {}
+        for room_id, booking_date, start_min, end_min in rows:
+            bits = day_bits.setdefault(room_id, [0] * days_in_month)
+            if booking_date is None:
+                continue
+            first_slot = start_min // granularity
+            last_slot = -(-end_min // granularity)  # ceil
+            bits[booking_date.day - 1] |= ((1 << (last_slot - first_slot)) - 1) << first_slot
+
+        rooms = []
+        for room_id, bits in day_bits.items():
+            packed = b"".join(value.to_bytes(bytes_per_day, "little") for value in bits)
+            rooms.append({"room_id": room_id, "occupancy": base64.b64encode(packed).decode("ascii")})
+
+        return {
+            "month": f"{year:04d}-{month:02d}",
+            "days": days_in_month,
+            "granularity": granularity,
+            "slots_per_day": slots_per_day,
+            "bytes_per_day": bytes_per_day,
+            "rooms": rooms
+        }
@@ -1,10 +1,53 @@
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import and_, or_
-from typing import Optional, List
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy import func, literal, text, tuple_
+from typing import Any, Dict, Iterator, Optional, List, Tuple
 from datetime import datetime, date, time
+from time import monotonic
+import threading
 
-from app.models.booking import Booking, BookingStatusEnum
+from app.models.booking import Booking, BookingTombstone, BookingStatusEnum
+from app.models.user import User
+from app.models.room import Room
 from app.schemas.booking import BookingCreate, BookingUpdate, BookingStatusUpdate
+from app.services.conflict_index import ConflictIndex
+from app.services.conflict_service import ConflictService
+from app.services.version_service import VersionService
+from app.core.config import settings
+from app.utils.intervals import to_minutes
+from app.utils.pagination import BookingCursor
+
+# Filter sets kept by the X-Total-Count cache before expired entries are dropped
+COUNT_CACHE_MAX_ENTRIES = 1000
+
+# Everything BookingResponse needs, and nothing else, for the projection list path
+BOOKING_LIST_COLUMNS = (
+    Booking.id,
+    Booking.user_id,
+    Booking.room_id,
+    Booking.date,
+    Booking.start_time,
+    Booking.end_time,
+    Booking.title,
+    Booking.attendees,
+    Booking.description,
+    Booking.priority,
+    Booking.equipment,
+    Booking.status,
+    Booking.notes,
+    Booking.conflict_count,
+    Booking.series_id,
+    Booking.created_at,
+    Booking.updated_at,
+    func.coalesce(User.name, literal("Unknown")).label("user_name"),
+    func.coalesce(Room.name, literal("Unknown")).label("room_name"),
+)
+
+# Projection column per BookingResponse field, for sparse fieldsets
+BOOKING_FIELD_COLUMNS = {column.key: column for column in BOOKING_LIST_COLUMNS}
+
+# Always selected with sparse fieldsets: the page sort key, for X-Next-Cursor
+BOOKING_KEY_FIELDS = ("id", "date", "start_time")
 
 
 class BookingService:
@@ -18,23 +61,28 @@ class BookingService:
             .filter(Booking.id == booking_id)\
             .first()
     
+    # Cached COUNT(*) per filter set for X-Total-Count: (monotonic expiry, count)
+    _count_lock = threading.Lock()
+    _counts: Dict[Tuple[Any, ...], Tuple[float, int]] = {}
+    
+    @classmethod
+    def clear_count_cache(cls):
+        """Forget cached totals."""
+        with cls._count_lock:
+            cls._counts.clear()
+    
     @staticmethod
-    def get_all(
-        db: Session,
-        skip: int = 0,
-        limit: int = 100,
+    def _apply_filters(
+        query,
         user_id: Optional[str] = None,
         room_id: Optional[str] = None,
         status: Optional[BookingStatusEnum] = None,
         date_from: Optional[date] = None,
-        date_to: Optional[date] = None
-    ) -> List[Booking]:
-        """Get all bookings with optional filters and eagerly load relationships."""
-        query = db.query(Booking).options(
-            joinedload(Booking.user),
-            joinedload(Booking.room)
-        )
-        
+        date_to: Optional[date] = None,
+        contested: Optional[bool] = None,
+        series_id: Optional[str] = None
+    ):
+        """Apply the GET /bookings filters to a query."""
         if user_id:
             query = query.filter(Booking.user_id == user_id)
         
@@ -50,7 +98,191 @@ class BookingService:
         if date_to:
             query = query.filter(Booking.date <= date_to)
         
-        return query.order_by(Booking.date.desc(), Booking.start_time.desc()).offset(skip).limit(limit).all()
+        if series_id:
+            query = query.filter(Booking.series_id == series_id)
+        
+        if contested is not None:
+            query = query.filter(Booking.status == BookingStatusEnum.PENDING)
+            if contested:
+                query = query.filter(Booking.conflict_count > 0)
+            else:
+                query = query.filter(Booking.conflict_count == 0)
+        
+        return query
+    
+    @staticmethod
+    def _page(
+        query,
+        skip: int,
+        limit: int,
+        cursor: Optional[BookingCursor],
+        contested: Optional[bool]
+    ):
+        """Order a filtered GET /bookings query and cut one page from it."""
+        if contested:
+            query = query.order_by(Booking.conflict_count.desc())
+        
+        if cursor is not None:
+            query = query.filter(tuple_(Booking.date, Booking.start_time, Booking.id) < tuple_(*cursor))
+            skip = 0
+        
+        return query.order_by(
+            Booking.date.desc(),
+            Booking.start_time.desc(),
+            Booking.id.desc()
+        ).offset(skip).limit(limit)
+    
+    @staticmethod
+    def get_all(
+        db: Session,
+        skip: int = 0,
+        limit: int = 100,
+        user_id: Optional[str] = None,
+        room_id: Optional[str] = None,
+        status: Optional[BookingStatusEnum] = None,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        contested: Optional[bool] = None,
+        series_id: Optional[str] = None,
+        cursor: Optional[BookingCursor] = None
+    ) -> List[Booking]:
+        """
+        Get all bookings with optional filters and eagerly load relationships.
+        
+        contested narrows to PENDING bookings with (True) or without (False)
+        conflicts, read from the maintained conflict_count column.
+        
+        Rows are ordered newest first by (date, start_time, id). Passing the
+        last row's key as `cursor` continues after it with a range condition
+        on idx_booking_date_start_id instead of an offset, so every page
+        costs the same however deep it is and rows inserted meanwhile do
+        not shift later pages. `skip` is ignored with a cursor, and a cursor
+        cannot be combined with contested=True, which orders by conflicts.
+        """
+        query = db.query(Booking).options(
+            joinedload(Booking.user),
+            joinedload(Booking.room)
+        )
+        query = BookingService._apply_filters(
+            query, user_id, room_id, status, date_from, date_to, contested, series_id
+        )
+        return BookingService._page(query, skip, limit, cursor, contested).all()
+    
+    @staticmethod
+    def get_all_rows(
+        db: Session,
+        skip: int = 0,
+        limit: int = 100,
+        user_id: Optional[str] = None,
+        room_id: Optional[str] = None,
+        status: Optional[BookingStatusEnum] = None,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        contested: Optional[bool] = None,
+        series_id: Optional[str] = None,
+        cursor: Optional[BookingCursor] = None,
+        fields: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Same page as get_all, as plain BookingResponse-shaped dicts.
+        
+        Selects only the response columns, with the user and room names as
+        joined scalars, so no Booking/User/Room objects are built or put in
+        the identity map (and password hashes are never read). Use this for
+        read-only listings; use get_all when the bookings will be modified.
+        
+        `fields` narrows the SELECT to those BookingResponse fields plus the
+        sort key, and joins users/rooms only when their names are wanted.
+        """
+        if fields is None:
+            columns = BOOKING_LIST_COLUMNS
+        else:
+            wanted = set(fields).union(BOOKING_KEY_FIELDS)
+            columns = [column for name, column in BOOKING_FIELD_COLUMNS.items() if name in wanted]
+        
+        query = db.query(*columns)
+        if fields is None or "user_name" in fields:
+            query = query.outerjoin(User, Booking.user_id == User.id)
+        if fields is None or "room_name" in fields:
+            query = query.outerjoin(Room, Booking.room_id == Room.id)
+        query = BookingService._apply_filters(
+            query, user_id, room_id, status, date_from, date_to, contested, series_id
+        )
+        return [dict(row._mapping) for row in BookingService._page(query, skip, limit, cursor, contested)]
+    
+    @staticmethod
+    def stream_rows(
+        db: Session,
+        user_id: Optional[str] = None,
+        room_id: Optional[str] = None,
+        status: Optional[BookingStatusEnum] = None,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        contested: Optional[bool] = None,
+        series_id: Optional[str] = None,
+        batch_size: int = 1000
+    ) -> Iterator[Any]:
+        """
+        Every booking matching the GET /bookings filters, as projected rows.
+        
+        yield_per turns on stream_results, so PostgreSQL and MySQL read
+        through a server-side cursor and only `batch_size` rows are held at
+        a time; nothing is added to the session's identity map.
+        """
+        query = db.query(*BOOKING_LIST_COLUMNS).outerjoin(
+            User, Booking.user_id == User.id
+        ).outerjoin(
+            Room, Booking.room_id == Room.id
+        )
+        query = BookingService._apply_filters(
+            query, user_id, room_id, status, date_from, date_to, contested, series_id
+        )
+        yield from query.order_by(
+            Booking.date.desc(),
+            Booking.start_time.desc(),
+            Booking.id.desc()
+        ).yield_per(batch_size)
+    
+    @classmethod
+    def count(
+        cls,
+        db: Session,
+        user_id: Optional[str] = None,
+        room_id: Optional[str] = None,
+        status: Optional[BookingStatusEnum] = None,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        contested: Optional[bool] = None,
+        series_id: Optional[str] = None
+    ) -> int:
+        """
+        Number of bookings matching the GET /bookings filters, for X-Total-Count.
+        
+        Unfiltered counts on PostgreSQL use the planner's row estimate;
+        everything else is an exact COUNT(*) cached per filter set for
+        BOOKING_COUNT_CACHE_SECONDS, so totals may lag recent writes.
+        """
+        filters = (user_id, room_id, status, date_from, date_to, contested, series_id)
+        if db.get_bind().dialect.name == "postgresql" and not any(value is not None for value in filters):
+            estimate = db.execute(
+                text("SELECT reltuples::bigint FROM pg_class WHERE oid = 'bookings'::regclass")
+            ).scalar()
+            # -1 until the table has been analyzed
+            if estimate is not None and estimate >= 0:
+                return int(estimate)
+        
+        now = monotonic()
+        with cls._count_lock:
+            cached = cls._counts.get(filters)
+            if cached and cached[0] > now:
+                return cached[1]
+        
+        total = BookingService._apply_filters(db.query(func.count(Booking.id)), *filters).scalar()
+        with cls._count_lock:
+            if len(cls._counts) >= COUNT_CACHE_MAX_ENTRIES:
+                cls._counts = {key: value for key, value in cls._counts.items() if value[0] > now}
+            cls._counts[filters] = (now + settings.BOOKING_COUNT_CACHE_SECONDS, total)
+        return total
     
     @staticmethod
     def create(db: Session, user_id: str, booking_data: BookingCreate) -> Booking:
@@ -71,8 +303,11 @@ class BookingService:
         )
         
         db.add(booking)
+        ConflictService.refresh_conflict_counts(db, [(booking.room_id, booking.date)])
+        VersionService.bump(db, [(booking.room_id, booking.date)])
         db.commit()
         db.refresh(booking)
+        ConflictIndex.sync(booking)
         return booking
     
     @staticmethod
@@ -82,12 +317,16 @@ class BookingService:
         if not booking:
             return None
         
+        previous_key = (booking.room_id, booking.date)
         update_dict = booking_data.model_dump(exclude_unset=True)
         for field, value in update_dict.items():
             setattr(booking, field, value)
         
+        ConflictService.refresh_conflict_counts(db, [previous_key, (booking.room_id, booking.date)])
+        VersionService.bump(db, [previous_key, (booking.room_id, booking.date)])
         db.commit()
         db.refresh(booking)
+        ConflictIndex.sync(booking)
         return booking
     
     @staticmethod
@@ -101,8 +340,11 @@ class BookingService:
         if status_data.notes:
             booking.notes = status_data.notes
         
+        ConflictService.refresh_conflict_counts(db, [(booking.room_id, booking.date)])
+        VersionService.bump(db, [(booking.room_id, booking.date)])
         db.commit()
         db.refresh(booking)
+        ConflictIndex.sync(booking)
         return booking
     
     @staticmethod
@@ -116,8 +358,11 @@ class BookingService:
         if notes:
             booking.notes = notes
         
+        ConflictService.refresh_conflict_counts(db, [(booking.room_id, booking.date)])
+        VersionService.bump(db, [(booking.room_id, booking.date)])
         db.commit()
         db.refresh(booking)
+        ConflictIndex.sync(booking)
         return booking
     
     @staticmethod
@@ -127,8 +372,13 @@ class BookingService:
         if not booking:
             return False
         
+        key = (booking.room_id, booking.date)
+        db.add(BookingTombstone(booking_id=booking.id, room_id=booking.room_id, date=booking.date))
         db.delete(booking)
+        ConflictService.refresh_conflict_counts(db, [key])
+        VersionService.bump(db, [key])
         db.commit()
+        ConflictIndex.discard(booking_id)
         return True
     
     @staticmethod
@@ -143,76 +393,61 @@ class BookingService:
         """
         Get bookings that conflict with the given time slot.
         Only considers APPROVED bookings.
+
+        Served from the in-memory ConflictIndex when it is enabled; only the
+        conflicting rows themselves are then fetched, by primary key. On
+        PostgreSQL with POSTGRES_SLOT_RANGE the `slot && tsrange` test is
+        answered by the exclusion constraint's GiST index.
         """
-        query = db.query(Booking).filter(
-            and_(
+        conflict_ids = ConflictIndex.lookup(
+            db, room_id, date, start_time, end_time, exclude_booking_id=exclude_booking_id
+        )
+        if conflict_ids is not None:
+            return BookingService._load_approved(db, conflict_ids)
+        
+        if BookingService._uses_slot_range(db):
+            query = db.query(Booking).filter(
                 Booking.room_id == room_id,
-                Booking.date == date,
                 Booking.status == BookingStatusEnum.APPROVED,
-                or_(
-                    # New booking starts during existing booking
-                    and_(
-                        Booking.start_time <= start_time,
-                        Booking.end_time > start_time
-                    ),
-                    # New booking ends during existing booking
-                    and_(
-                        Booking.start_time < end_time,
-                        Booking.end_time >= end_time
-                    ),
-                    # New booking completely contains existing booking
-                    and_(
-                        Booking.start_time >= start_time,
-                        Booking.end_time <= end_time
-                    )
-                )
+                Booking.slot_overlaps(date, start_time, end_time)
             )
+            if exclude_booking_id:
+                query = query.filter(Booking.id != exclude_booking_id)
+            return query.all()
+        
+        # Two half-open intervals overlap iff each starts before the other ends.
+        # Only IDs are selected so the covering idx_booking_slot_approved index
+        # answers the check; full rows are loaded only when something conflicts.
+        query = db.query(Booking.id).filter(
+            Booking.room_id == room_id,
+            Booking.date == date,
+            Booking.approved_only(),
+            Booking.start_min < to_minutes(end_time),
+            Booking.end_min > to_minutes(start_time)
         )
         
         if exclude_booking_id:
             query = query.filter(Booking.id != exclude_booking_id)
         
-        return query.all()
+        return BookingService._load_approved(db, [row.id for row in query])
     
     @staticmethod
-    def approve_with_conflict_resolution(
-        db: Session,
-        booking_id: str,
-        cancel_conflicts: bool = False
-    ) -> tuple[Optional[Booking], List[Booking]]:
-        """
-        Approve a booking and optionally cancel conflicting bookings.
-        
-        Returns:
-            tuple: (approved_booking, list_of_cancelled_bookings)
-        """
-        booking = BookingService.get_by_id(db, booking_id)
-        if not booking:
-            return None, []
-        
-        # Find conflicting bookings
-        conflicts = BookingService.get_conflicting_bookings(
-            db,
-            booking.room_id,
-            booking.date,
-            booking.start_time,
-            booking.end_time,
-            exclude_booking_id=booking_id
-        )
-        
-        cancelled_bookings = []
-        
-        if cancel_conflicts and conflicts:
-            # Cancel all conflicting bookings
-            for conflict in conflicts:
-                conflict.status = BookingStatusEnum.CANCELLED
-                conflict.notes = f"Revoked by Admin for Priority Override by {booking.user.name}"
-                cancelled_bookings.append(conflict)
-        
-        # Approve the booking
-        booking.status = BookingStatusEnum.APPROVED
-        
-        db.commit()
-        db.refresh(booking)
-        
-        return booking, cancelled_bookings
\ No newline at end of file
+    def _load_approved(db: Session, booking_ids: List[str]) -> List[Booking]:
+        """Load APPROVED bookings by primary key, skipping the query when there are none."""
+        if not booking_ids:
+            return []
+        return db.query(Booking).filter(
+            Booking.id.in_(booking_ids),
+            Booking.status == BookingStatusEnum.APPROVED
+        ).order_by(Booking.start_time).all()
+    
+    @staticmethod
+    def _uses_slot_range(db: Session) -> bool:
+        """Check whether the PostgreSQL slot range column should be queried."""
+        return settings.POSTGRES_SLOT_RANGE and db.get_bind().dialect.name == "postgresql"
+    
+    @staticmethod
+    def is_overlap_violation(error: IntegrityError) -> bool:
+        """Check whether an IntegrityError came from the approved-overlap exclusion constraint."""
+        # 23P01 = exclusion_violation
+        return getattr(error.orig, "pgcode", None) == "23P01"
\ No newline at end of file
@@ -0,0 +1,128 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import func, insert, select
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+
+from app.models.booking import Booking, BookingTombstone, BookingStatusEnum
+from app.models.user import User
+from app.models.room import Room
+from app.core.config import settings
+from app.services.booking_service import BOOKING_LIST_COLUMNS
+from app.services.version_service import VersionService, ROOMS, USERS
+from app.utils.pagination import encode_watermark, decode_watermark
+
+
+class ChangeService:
+    """
+    Delta sync for booking lists: rows changed or deleted since a watermark.
+
+    Changes are found through idx_booking_updated_at and deletions through
+    booking_tombstones, written by every path that deletes bookings. A
+    watermark is the database clock at the previous sync; each sync re-reads
+    SYNC_OVERLAP_SECONDS before it so rows stamped by a transaction that was
+    still committing at that moment are not missed, which means clients
+    must apply changes idempotently (upsert by id).
+    """
+
+    @staticmethod
+    def record_deletions(db: Session, *criteria) -> int:
+        """
+        Write tombstones for the bookings matching `criteria`, before deleting them.
+
+        Runs as one INSERT ... SELECT in the caller's transaction.
+        """
+        result = db.execute(
+            insert(BookingTombstone).from_select(
+                ["booking_id", "room_id", "date"],
+                select(Booking.id, Booking.room_id, Booking.date).where(*criteria)
+            )
+        )
+        return result.rowcount
+
+    @staticmethod
+    def purge_tombstones(db: Session, older_than: datetime) -> int:
+        """Delete tombstones recorded before a cutoff; the caller commits."""
+        return db.query(BookingTombstone).filter(
+            BookingTombstone.deleted_at < older_than
+        ).delete(synchronize_session=False)
+
+    @staticmethod
+    def get_changes(
+        db: Session,
+        watermark: Optional[str],
+        viewer_id: str,
+        is_admin: bool
+    ) -> Dict[str, Any]:
+        """
+        Bookings changed and IDs deleted since a watermark.
+
+        Regular users receive approved bookings and their own; other
+        bookings that changed are reported as deleted, so a booking that
+        leaves the schedule (cancelled, rejected) disappears client-side.
+
+        `reset` asks the client to reload its list and continue from the
+        returned watermark. It is set when no watermark is given, when it
+        predates tombstone retention, when a room or user changed (their
+        names are denormalized into the rows), and when more than
+        MAX_SYNC_CHANGES rows changed.
+
+        Args:
+            db: Database session
+            watermark: Value returned by the previous call, if any
+            viewer_id: Requesting user's ID
+            is_admin: Whether the viewer may see every booking
+
+        Returns:
+            Dictionary with changed (BookingResponse-shaped dicts), deleted
+            (booking IDs), watermark and reset
+
+        Raises:
+            ValueError: If the watermark is malformed
+        """
+        previous = decode_watermark(watermark) if watermark else None
+
+        as_of = db.query(func.now()).scalar()
+        versions = VersionService.current(db, [ROOMS, USERS])
+        result = {
+            "changed": [],
+            "deleted": [],
+            "watermark": encode_watermark(as_of, versions[ROOMS], versions[USERS]),
+            "reset": True
+        }
+        if previous is None:
+            return result
+
+        since, rooms_version, users_version = previous
+        if (rooms_version, users_version) != (versions[ROOMS], versions[USERS]):
+            return result
+        if since < as_of - timedelta(days=settings.TOMBSTONE_RETENTION_DAYS):
+            return result
+        since -= timedelta(seconds=settings.SYNC_OVERLAP_SECONDS)
+
+        rows = db.query(*BOOKING_LIST_COLUMNS).outerjoin(
+            User, Booking.user_id == User.id
+        ).outerjoin(
+            Room, Booking.room_id == Room.id
+        ).filter(
+            Booking.updated_at > since
+        ).order_by(Booking.updated_at, Booking.id).limit(settings.MAX_SYNC_CHANGES + 1).all()
+        if len(rows) > settings.MAX_SYNC_CHANGES:
+            return result
+
+        changed, hidden = [], []
+        for row in rows:
+            if is_admin or row.status == BookingStatusEnum.APPROVED or row.user_id == viewer_id:
+                changed.append(dict(row._mapping))
+            else:
+                hidden.append(row.id)
+
+        # A tombstoned ID that exists again was reused by a newer booking
+        deleted = {
+            booking_id for (booking_id,) in db.query(BookingTombstone.booking_id).outerjoin(
+                Booking, Booking.id == BookingTombstone.booking_id
+            ).filter(BookingTombstone.deleted_at > since, Booking.id.is_(None))
+        }
+        deleted.update(hidden)
+
+        result.update(changed=changed, deleted=sorted(deleted), reset=False)
+        return result
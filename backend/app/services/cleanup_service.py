@@ -4,6 +4,11 @@ from typing import Dict
 import logging
 
 from app.models.booking import Booking, BookingStatusEnum
+from app.services.conflict_index import ConflictIndex
+from app.services.conflict_service import ConflictService
+from app.services.version_service import VersionService
+from app.services.change_service import ChangeService
+from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
@@ -43,12 +48,25 @@ class CleanupService:
         
         cutoff_date = datetime.utcnow() - timedelta(days=retention_days)
         
+        # Pending requests on these room-days lose conflicts when approved rows go
+        touched_days = [
+            tuple(row) for row in db.query(Booking.room_id, Booking.date).filter(
+                Booking.status == BookingStatusEnum.APPROVED,
+                Booking.created_at < cutoff_date
+            ).distinct()
+        ]
+        
         # Count and delete APPROVED bookings older than retention period
         approved_count = db.query(Booking).filter(
             Booking.status == BookingStatusEnum.APPROVED,
             Booking.created_at < cutoff_date
         ).count()
         
+        ChangeService.record_deletions(
+            db,
+            Booking.status == BookingStatusEnum.APPROVED,
+            Booking.created_at < cutoff_date
+        )
         db.query(Booking).filter(
             Booking.status == BookingStatusEnum.APPROVED,
             Booking.created_at < cutoff_date
@@ -60,6 +78,11 @@ class CleanupService:
             Booking.created_at < cutoff_date
         ).count()
         
+        ChangeService.record_deletions(
+            db,
+            Booking.status == BookingStatusEnum.REJECTED,
+            Booking.created_at < cutoff_date
+        )
         db.query(Booking).filter(
             Booking.status == BookingStatusEnum.REJECTED,
             Booking.created_at < cutoff_date
@@ -71,12 +94,22 @@ class CleanupService:
             Booking.created_at < cutoff_date
         ).count()
         
+        ChangeService.record_deletions(
+            db,
+            Booking.status == BookingStatusEnum.CANCELLED,
+            Booking.created_at < cutoff_date
+        )
         db.query(Booking).filter(
             Booking.status == BookingStatusEnum.CANCELLED,
             Booking.created_at < cutoff_date
         ).delete(synchronize_session=False)
         
+        ConflictService.refresh_conflict_counts(db, touched_days)
+        VersionService.bump(db, touched_days)
+        ChangeService.purge_tombstones(db, datetime.utcnow() - timedelta(days=settings.TOMBSTONE_RETENTION_DAYS))
         db.commit()
+        # Bulk deletes bypass the ORM, so drop any cached room-days
+        ConflictIndex.invalidate()
         
         total = approved_count + rejected_count + cancelled_count
         logger.info(
@@ -0,0 +1,223 @@
+from sqlalchemy.orm import Session
+from collections import OrderedDict
+from datetime import date, time
+from typing import Dict, List, Optional, Tuple, Any
+import logging
+import threading
+
+from app.models.booking import Booking, BookingStatusEnum
+from app.core.config import settings
+from app.utils.intervals import IntervalSet, to_minutes
+
+logger = logging.getLogger(__name__)
+
+DayKey = Tuple[str, date]
+
+
+class ConflictIndex:
+    """
+    Process-local interval index of APPROVED bookings per (room_id, date).
+
+    Room-days are loaded lazily from the database on first lookup and kept
+    current by the BookingService write paths. The index only knows about
+    writes made by this process, so enable it for single-worker deployments
+    or pair it with the verify self-check.
+    """
+
+    _enabled: bool = settings.ENABLE_CONFLICT_INDEX
+    _lock = threading.RLock()
+    _days: "OrderedDict[DayKey, IntervalSet]" = OrderedDict()
+    _booking_keys: Dict[str, DayKey] = {}
+    # Bumped on every mutation so a load racing a write is not cached
+    _epoch: int = 0
+    _hits: int = 0
+    _loads: int = 0
+
+    @classmethod
+    def set_enabled(cls, enabled: bool):
+        """Enable or disable the index. Disabling drops all cached room-days."""
+        with cls._lock:
+            cls._enabled = enabled
+            cls._clear_locked()
+        logger.info(f"Conflict index {'enabled' if enabled else 'disabled'}")
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        """Check if the index is enabled."""
+        return cls._enabled
+
+    @classmethod
+    def lookup(
+        cls,
+        db: Session,
+        room_id: str,
+        booking_date: date,
+        start_time: time,
+        end_time: time,
+        exclude_booking_id: Optional[str] = None
+    ) -> Optional[List[str]]:
+        """
+        Return IDs of APPROVED bookings overlapping the slot.
+
+        Returns None when the index is disabled so the caller can fall back
+        to the SQL path. Cold room-days are loaded with one narrow query.
+        """
+        if not cls._enabled:
+            return None
+
+        key = (room_id, booking_date)
+        with cls._lock:
+            intervals = cls._days.get(key)
+            if intervals is not None:
+                cls._days.move_to_end(key)
+                cls._hits += 1
+                ids = intervals.overlapping(to_minutes(start_time), to_minutes(end_time))
+                return [booking_id for booking_id in ids if booking_id != exclude_booking_id]
+            epoch = cls._epoch
+
+        intervals = cls._load_day(db, room_id, booking_date)
+
+        with cls._lock:
+            cls._loads += 1
+            if cls._enabled and epoch == cls._epoch:
+                cls._store_locked(key, intervals)
+
+        ids = intervals.overlapping(to_minutes(start_time), to_minutes(end_time))
+        return [booking_id for booking_id in ids if booking_id != exclude_booking_id]
+
+    @classmethod
+    def sync(cls, booking: Booking):
+        """Reflect a committed booking's current state in the index."""
+        with cls._lock:
+            cls._epoch += 1
+            cls._discard_locked(booking.id)
+            if booking.status != BookingStatusEnum.APPROVED:
+                return
+            key = (booking.room_id, booking.date)
+            intervals = cls._days.get(key)
+            # Cold room-days are loaded from the database on demand
+            if intervals is None:
+                return
+            intervals.add(booking.start_min, booking.end_min, booking.id)
+            cls._booking_keys[booking.id] = key
+
+    @classmethod
+    def discard(cls, booking_id: str):
+        """Drop a deleted booking from the index."""
+        with cls._lock:
+            cls._epoch += 1
+            cls._discard_locked(booking_id)
+
+    @classmethod
+    def invalidate(cls, room_id: Optional[str] = None, booking_date: Optional[date] = None):
+        """
+        Forget cached room-days after writes the index cannot follow
+        (bulk deletes, cascades). With no arguments everything is dropped.
+        """
+        with cls._lock:
+            cls._epoch += 1
+            if room_id is None and booking_date is None:
+                cls._clear_locked()
+                return
+            for key in [
+                key for key in cls._days
+                if (room_id is None or key[0] == room_id)
+                and (booking_date is None or key[1] == booking_date)
+            ]:
+                cls._drop_key_locked(key)
+
+    @classmethod
+    def stats(cls) -> Dict[str, Any]:
+        """Return index size and hit counters."""
+        with cls._lock:
+            return {
+                "enabled": cls._enabled,
+                "room_days": len(cls._days),
+                "bookings": len(cls._booking_keys),
+                "max_room_days": settings.CONFLICT_INDEX_MAX_DAYS,
+                "hits": cls._hits,
+                "loads": cls._loads,
+            }
+
+    @classmethod
+    def verify(cls, db: Session, repair: bool = False) -> Dict[str, Any]:
+        """
+        Compare every cached room-day against the database.
+
+        Args:
+            db: Database session
+            repair: Drop room-days that drifted so they reload on next lookup
+
+        Returns:
+            Dictionary with the number of room-days checked and any mismatches
+        """
+        with cls._lock:
+            snapshot = {key: set(intervals) for key, intervals in cls._days.items()}
+
+        mismatches = []
+        for (room_id, booking_date), cached in snapshot.items():
+            actual = set(cls._load_day(db, room_id, booking_date))
+            if cached == actual:
+                continue
+            mismatches.append({
+                "room_id": room_id,
+                "date": booking_date.isoformat(),
+                "missing": sorted(item[2] for item in actual - cached),
+                "stale": sorted(item[2] for item in cached - actual),
+            })
+
+        if repair and mismatches:
+            with cls._lock:
+                cls._epoch += 1
+                for mismatch in mismatches:
+                    cls._drop_key_locked((mismatch["room_id"], date.fromisoformat(mismatch["date"])))
+
+        if mismatches:
+            logger.warning(f"Conflict index drift in {len(mismatches)} room-day(s)")
+
+        return {
+            "checked": len(snapshot),
+            "consistent": not mismatches,
+            "repaired": repair and bool(mismatches),
+            "mismatches": mismatches,
+        }
+
+    @staticmethod
+    def _load_day(db: Session, room_id: str, booking_date: date) -> IntervalSet:
+        rows = db.query(Booking.id, Booking.start_min, Booking.end_min).filter(
+            Booking.room_id == room_id,
+            Booking.date == booking_date,
+            Booking.approved_only()
+        ).all()
+        return IntervalSet(
+            (start_min, end_min, booking_id)
+            for booking_id, start_min, end_min in rows
+        )
+
+    @classmethod
+    def _store_locked(cls, key: DayKey, intervals: IntervalSet):
+        cls._drop_key_locked(key)
+        cls._days[key] = intervals
+        for booking_id in intervals.keys():
+            cls._booking_keys[booking_id] = key
+        while len(cls._days) > settings.CONFLICT_INDEX_MAX_DAYS:
+            cls._drop_key_locked(next(iter(cls._days)))
+
+    @classmethod
+    def _drop_key_locked(cls, key: DayKey):
+        intervals = cls._days.pop(key, None)
+        if intervals is None:
+            return
+        for booking_id in intervals.keys():
+            cls._booking_keys.pop(booking_id, None)
+
+    @classmethod
+    def _discard_locked(cls, booking_id: str):
+        key = cls._booking_keys.pop(booking_id, None)
+        if key is not None and key in cls._days:
+            cls._days[key].remove(booking_id)
+
+    @classmethod
+    def _clear_locked(cls):
+        cls._days.clear()
+        cls._booking_keys.clear()
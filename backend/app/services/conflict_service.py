@@ -0,0 +1,319 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import tuple_, insert, update
+from collections import defaultdict
+from datetime import date
+from typing import Dict, List, Optional, Tuple, Iterable, Any
+import heapq
+
+from app.models.booking import Booking, BookingConflict, BookingStatusEnum
+from app.models.user import User
+from app.models.room import Room
+from app.schemas.booking import ConflictCandidate
+from app.services.version_service import VersionService
+from app.utils.intervals import IntervalSet, to_minutes
+
+DayKey = Tuple[str, date]
+
+# Room-days per query when maintaining conflict counters (two bound params each)
+COUNTER_KEY_CHUNK_SIZE = 500
+
+
+class ConflictService:
+    """Service for conflict detection across many bookings in one pass."""
+
+    @staticmethod
+    def load_approved_intervals(db: Session, keys: Iterable[DayKey]) -> Dict[DayKey, IntervalSet]:
+        """
+        Load approved bookings for a set of (room_id, date) keys in one query.
+
+        Returns:
+            IntervalSet of (start_min, end_min, booking_id) per key that has bookings
+        """
+        keys = list(set(keys))
+        if not keys:
+            return {}
+
+        rows = db.query(Booking.room_id, Booking.date, Booking.start_min, Booking.end_min, Booking.id).filter(
+            tuple_(Booking.room_id, Booking.date).in_(keys),
+            Booking.approved_only()
+        ).all()
+
+        grouped: Dict[DayKey, list] = defaultdict(list)
+        for room_id, booking_date, start_min, end_min, booking_id in rows:
+            grouped[(room_id, booking_date)].append((start_min, end_min, booking_id))
+        return {key: IntervalSet(items) for key, items in grouped.items()}
+
+    @staticmethod
+    def check_candidates(db: Session, candidates: List[ConflictCandidate]) -> Tuple[int, List[List[str]]]:
+        """
+        Find conflicting approved bookings for every candidate slot.
+
+        Approved bookings are loaded once for the union of (room, date) keys,
+        and each candidate is then answered in memory, so cost grows with the
+        number of distinct room-days rather than the number of candidates.
+
+        Returns:
+            tuple: (distinct_room_days, conflict_ids_per_candidate)
+        """
+        keys = {(candidate.room_id, candidate.date) for candidate in candidates}
+        intervals = ConflictService.load_approved_intervals(db, keys)
+
+        results = []
+        for candidate in candidates:
+            day = intervals.get((candidate.room_id, candidate.date))
+            if day is None:
+                results.append([])
+                continue
+            results.append(day.overlapping(to_minutes(candidate.start_time), to_minutes(candidate.end_time)))
+        return len(keys), results
+
+    @staticmethod
+    def build_conflict_graph(
+        db: Session,
+        date_from: date,
+        date_to: date,
+        room_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Build the conflict graph of pending bookings for a date range.
+
+        Pending and approved bookings are loaded in one query with user and
+        room names joined, ordered by (room, date, start). A sweep over each
+        room-day keeps a heap of still-open intervals, so every overlapping
+        pair is found without a per-booking query.
+
+        Returns:
+            Dictionary matching ConflictGraphResponse
+        """
+        query = db.query(
+            Booking.id,
+            Booking.status,
+            Booking.priority,
+            Booking.title,
+            Booking.date,
+            Booking.start_time,
+            Booking.end_time,
+            Booking.start_min,
+            Booking.end_min,
+            Booking.room_id,
+            Room.name.label("room_name"),
+            Booking.user_id,
+            User.name.label("user_name")
+        ).join(Room, Room.id == Booking.room_id).join(User, User.id == Booking.user_id).filter(
+            Booking.date >= date_from,
+            Booking.date <= date_to,
+            Booking.status.in_([BookingStatusEnum.PENDING, BookingStatusEnum.APPROVED])
+        )
+        if room_id:
+            query = query.filter(Booking.room_id == room_id)
+        rows = query.order_by(Booking.room_id, Booking.date, Booking.start_min).all()
+
+        adjacency: Dict[str, List[str]] = defaultdict(list)
+        current_key = None
+        open_intervals: List[Tuple[int, int, Any]] = []  # (end_min, position, row)
+        for position, row in enumerate(rows):
+            key = (row.room_id, row.date)
+            if key != current_key:
+                current_key = key
+                open_intervals = []
+            while open_intervals and open_intervals[0][0] <= row.start_min:
+                heapq.heappop(open_intervals)
+            for _, _, other in open_intervals:
+                # Only collisions involving a pending request matter to the queue
+                if BookingStatusEnum.PENDING in (row.status, other.status):
+                    adjacency[row.id].append(other.id)
+                    adjacency[other.id].append(row.id)
+            heapq.heappush(open_intervals, (row.end_min, position, row))
+
+        nodes = [
+            {
+                "id": row.id,
+                "status": row.status,
+                "priority": row.priority,
+                "title": row.title,
+                "date": row.date,
+                "start_time": row.start_time,
+                "end_time": row.end_time,
+                "room_id": row.room_id,
+                "room_name": row.room_name,
+                "user_id": row.user_id,
+                "user_name": row.user_name,
+            }
+            for row in rows
+            if row.status == BookingStatusEnum.PENDING or row.id in adjacency
+        ]
+
+        return {
+            "date_from": date_from,
+            "date_to": date_to,
+            "nodes": nodes,
+            "adjacency": {
+                node["id"]: sorted(adjacency.get(node["id"], ()))
+                for node in nodes
+            }
+        }
+
+    @staticmethod
+    def _expected_conflicts(db: Session, keys: List[DayKey]) -> Tuple[Dict[str, int], Dict[str, Tuple[DayKey, List[str]]]]:
+        """
+        Recompute conflicts for every booking on the given room-days.
+
+        Returns:
+            tuple: (stored conflict_count per booking,
+                    (room-day, expected conflicting IDs) per booking)
+        """
+        rows = db.query(
+            Booking.id,
+            Booking.room_id,
+            Booking.date,
+            Booking.start_min,
+            Booking.end_min,
+            Booking.status,
+            Booking.conflict_count
+        ).filter(tuple_(Booking.room_id, Booking.date).in_(keys)).all()
+
+        approved: Dict[DayKey, list] = defaultdict(list)
+        for row in rows:
+            if row.status == BookingStatusEnum.APPROVED:
+                approved[(row.room_id, row.date)].append((row.start_min, row.end_min, row.id))
+        intervals = {key: IntervalSet(items) for key, items in approved.items()}
+
+        stored: Dict[str, int] = {}
+        expected: Dict[str, Tuple[DayKey, List[str]]] = {}
+        for row in rows:
+            key = (row.room_id, row.date)
+            stored[row.id] = row.conflict_count
+            conflicts = []
+            if row.status == BookingStatusEnum.PENDING and key in intervals:
+                conflicts = sorted(intervals[key].overlapping(row.start_min, row.end_min))
+            expected[row.id] = (key, conflicts)
+        return stored, expected
+
+    @staticmethod
+    def refresh_conflict_counts(db: Session, keys: Iterable[DayKey]) -> int:
+        """
+        Bring conflict_count and booking_conflicts up to date for some room-days.
+
+        Called by every write path that changes an approved interval, inside
+        its transaction and before commit. Only the touched room-days are
+        recomputed (one narrow query each chunk); counts are written with a
+        bulk UPDATE by primary key for the rows that actually changed.
+
+        Returns:
+            Number of bookings whose conflict_count changed
+        """
+        keys = list(set(keys))
+        if not keys:
+            return 0
+
+        db.flush()
+        changed = 0
+        for offset in range(0, len(keys), COUNTER_KEY_CHUNK_SIZE):
+            chunk = keys[offset:offset + COUNTER_KEY_CHUNK_SIZE]
+            stored, expected = ConflictService._expected_conflicts(db, chunk)
+
+            db.query(BookingConflict).filter(
+                tuple_(BookingConflict.room_id, BookingConflict.date).in_(chunk)
+            ).delete(synchronize_session=False)
+            pairs = [
+                {"booking_id": booking_id, "conflict_id": conflict_id, "room_id": key[0], "date": key[1]}
+                for booking_id, (key, conflicts) in expected.items()
+                for conflict_id in conflicts
+            ]
+            if pairs:
+                db.execute(insert(BookingConflict), pairs)
+
+            counts = [
+                {"id": booking_id, "conflict_count": len(conflicts)}
+                for booking_id, (_, conflicts) in expected.items()
+                if stored[booking_id] != len(conflicts)
+            ]
+            if counts:
+                db.execute(update(Booking), counts)
+            changed += len(counts)
+        return changed
+
+    @staticmethod
+    def _all_room_days(db: Session) -> List[DayKey]:
+        """Every room-day with bookings or recorded conflicts, in order."""
+        keys = {tuple(row) for row in db.query(Booking.room_id, Booking.date).distinct()}
+        keys.update(tuple(row) for row in db.query(BookingConflict.room_id, BookingConflict.date).distinct())
+        return sorted(keys)
+
+    @staticmethod
+    def rebuild_conflict_counts(db: Session) -> Dict[str, int]:
+        """
+        Recompute conflict counters for the whole table, committing per chunk.
+
+        Returns:
+            Dictionary with room_days scanned and bookings updated
+        """
+        keys = ConflictService._all_room_days(db)
+        updated = 0
+        for offset in range(0, len(keys), COUNTER_KEY_CHUNK_SIZE):
+            chunk = keys[offset:offset + COUNTER_KEY_CHUNK_SIZE]
+            updated += ConflictService.refresh_conflict_counts(db, chunk)
+            VersionService.bump(db, chunk)
+            db.commit()
+        return {"room_days": len(keys), "updated": updated}
+
+    @staticmethod
+    def verify_conflict_counts(db: Session, repair: bool = False) -> Dict[str, Any]:
+        """
+        Compare stored counters and conflict pairs with a fresh recomputation.
+
+        Drift means a write bypassed the maintained paths (raw SQL, restores,
+        bulk imports). With repair, drifted room-days are rebuilt.
+
+        Returns:
+            Dictionary with room_days and bookings checked, drifted booking IDs
+            (first 100), drift_count and repaired
+        """
+        keys = ConflictService._all_room_days(db)
+        checked = 0
+        drifted: List[str] = []
+        drifted_keys = set()
+        for offset in range(0, len(keys), COUNTER_KEY_CHUNK_SIZE):
+            chunk = keys[offset:offset + COUNTER_KEY_CHUNK_SIZE]
+            stored, expected = ConflictService._expected_conflicts(db, chunk)
+
+            recorded: Dict[str, List[str]] = defaultdict(list)
+            orphaned = set()
+            for booking_id, conflict_id, room_id, booking_date in db.query(
+                BookingConflict.booking_id,
+                BookingConflict.conflict_id,
+                BookingConflict.room_id,
+                BookingConflict.date
+            ).filter(tuple_(BookingConflict.room_id, BookingConflict.date).in_(chunk)):
+                if booking_id not in expected:
+                    orphaned.add((room_id, booking_date))
+                recorded[booking_id].append(conflict_id)
+
+            checked += len(expected)
+            drifted_keys |= orphaned
+            for booking_id, (key, conflicts) in expected.items():
+                if stored[booking_id] != len(conflicts) or sorted(recorded.get(booking_id, ())) != conflicts:
+                    drifted.append(booking_id)
+                    drifted_keys.add(key)
+
+        repaired = 0
+        if repair and drifted_keys:
+            ConflictService.refresh_conflict_counts(db, drifted_keys)
+            VersionService.bump(db, drifted_keys)
+            db.commit()
+            repaired = len(drifted_keys)
+
+        return {
+            "room_days": len(keys),
+            "checked": checked,
+            "drifted": sorted(drifted)[:100],
+            "drift_count": len(drifted),
+            "repaired": repaired
+        }
+
+    @staticmethod
+    def get_recorded_conflicts(db: Session, booking_id: str) -> List[Booking]:
+        """Approved bookings recorded as conflicting with a pending booking."""
+        return db.query(Booking).join(BookingConflict, BookingConflict.conflict_id == Booking.id).filter(
+            BookingConflict.booking_id == booking_id
+        ).order_by(Booking.start_time).all()
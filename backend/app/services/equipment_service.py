@@ -0,0 +1,218 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import func
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Any
+from datetime import date, time
+
+from app.models.booking import Booking
+from app.models.equipment import EquipmentType
+from app.schemas.equipment import EquipmentTypeCreate, EquipmentTypeUpdate
+from app.utils.intervals import from_minutes, peak_overlap, to_minutes
+
+# (start_min, end_min, units) of one approved booking's use of an equipment type
+Usage = Tuple[int, int, int]
+
+
+class EquipmentService:
+    """Service for the equipment inventory and its availability."""
+    
+    @staticmethod
+    def normalize_name(name: Any) -> str:
+        """Key used to match booking equipment strings to inventory names."""
+        return str(name).strip().lower()
+    
+    @staticmethod
+    def requested_units(equipment: Optional[Iterable[Any]]) -> Dict[str, int]:
+        """Units per normalized name; listing an item twice requests two."""
+        return Counter(
+            EquipmentService.normalize_name(item)
+            for item in equipment or []
+            if str(item).strip()
+        )
+    
+    @staticmethod
+    def get_by_id(db: Session, equipment_id: str) -> Optional[EquipmentType]:
+        """Get equipment type by ID."""
+        return db.query(EquipmentType).filter(EquipmentType.id == equipment_id).first()
+    
+    @staticmethod
+    def get_by_name(db: Session, name: str) -> Optional[EquipmentType]:
+        """Get equipment type by name, ignoring case."""
+        return db.query(EquipmentType).filter(
+            func.lower(EquipmentType.name) == EquipmentService.normalize_name(name)
+        ).first()
+    
+    @staticmethod
+    def get_all(db: Session) -> List[EquipmentType]:
+        """Get the whole inventory ordered by name."""
+        return db.query(EquipmentType).order_by(EquipmentType.name).all()
+    
+    @staticmethod
+    def create(db: Session, equipment_data: EquipmentTypeCreate) -> EquipmentType:
+        """Create a new equipment type."""
+        equipment = EquipmentType(**equipment_data.model_dump())
+        db.add(equipment)
+        db.commit()
+        db.refresh(equipment)
+        return equipment
+    
+    @staticmethod
+    def update(db: Session, equipment_id: str, equipment_data: EquipmentTypeUpdate) -> Optional[EquipmentType]:
+        """Update an equipment type."""
+        equipment = EquipmentService.get_by_id(db, equipment_id)
+        if not equipment:
+            return None
+        
+        for field, value in equipment_data.model_dump(exclude_unset=True).items():
+            setattr(equipment, field, value)
+        
+        db.commit()
+        db.refresh(equipment)
+        return equipment
+    
+    @staticmethod
+    def delete(db: Session, equipment_id: str) -> bool:
+        """Delete an equipment type; bookings naming it are no longer limited."""
+        equipment = EquipmentService.get_by_id(db, equipment_id)
+        if not equipment:
+            return False
+        
+        db.delete(equipment)
+        db.commit()
+        return True
+    
+    @staticmethod
+    def _approved_usage(
+        db: Session,
+        booking_dates: Sequence[date],
+        start_min: Optional[int] = None,
+        end_min: Optional[int] = None,
+        exclude_booking_id: Optional[str] = None
+    ) -> Dict[date, Dict[str, List[Usage]]]:
+        """
+        Equipment use of approved bookings on some days, optionally only
+        those overlapping [start_min, end_min), keyed by date and normalized name.
+        
+        One query for all days; the JSON lists are unpacked here rather
+        than filtered in SQL, which keeps it portable across dialects.
+        """
+        query = db.query(Booking.date, Booking.start_min, Booking.end_min, Booking.equipment).filter(
+            Booking.date.in_(list(booking_dates)),
+            Booking.approved_only()
+        )
+        if start_min is not None:
+            query = query.filter(Booking.start_min < end_min, Booking.end_min > start_min)
+        if exclude_booking_id:
+            query = query.filter(Booking.id != exclude_booking_id)
+        
+        usage: Dict[date, Dict[str, List[Usage]]] = {}
+        for row_date, row_start, row_end, equipment in query:
+            for name, units in EquipmentService.requested_units(equipment).items():
+                usage.setdefault(row_date, {}).setdefault(name, []).append((row_start, row_end, units))
+        return usage
+    
+    @staticmethod
+    def check_availability(
+        db: Session,
+        booking_date: date,
+        start_time: time,
+        end_time: time,
+        equipment: Optional[List[str]],
+        exclude_booking_id: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Find requested inventory items that would be overcommitted by a booking.
+        
+        Returns:
+            Shortages as dicts with name, quantity, requested, in_use and
+            at (start of the busiest stretch); empty when everything fits
+        """
+        return EquipmentService.check_availability_many(
+            db, [booking_date], start_time, end_time, equipment, exclude_booking_id
+        ).get(booking_date, [])
+    
+    @staticmethod
+    def check_availability_many(
+        db: Session,
+        booking_dates: Sequence[date],
+        start_time: time,
+        end_time: time,
+        equipment: Optional[List[str]],
+        exclude_booking_id: Optional[str] = None
+    ) -> Dict[date, List[Dict[str, Any]]]:
+        """
+        Check the same slot and equipment on several days at once.
+        
+        Approved bookings overlapping the slot are loaded once for all days;
+        for each day and requested type a sweep line over their uses,
+        clipped to the slot, gives the peak number of units already out.
+        Equipment that is not in the inventory is not limited.
+        
+        Returns:
+            Shortages per day, only for days that have any
+        """
+        requested = EquipmentService.requested_units(equipment)
+        if not requested or not booking_dates:
+            return {}
+        
+        inventory = db.query(EquipmentType).filter(
+            func.lower(EquipmentType.name).in_(list(requested))
+        ).order_by(EquipmentType.name).all()
+        if not inventory:
+            return {}
+        
+        start_min, end_min = to_minutes(start_time), to_minutes(end_time)
+        usage = EquipmentService._approved_usage(db, booking_dates, start_min, end_min, exclude_booking_id)
+        
+        shortages: Dict[date, List[Dict[str, Any]]] = {}
+        for booking_date in booking_dates:
+            day = usage.get(booking_date, {})
+            for item in inventory:
+                key = EquipmentService.normalize_name(item.name)
+                in_use, peak_start, _ = peak_overlap(
+                    (max(use_start, start_min), min(use_end, end_min), units)
+                    for use_start, use_end, units in day.get(key, ())
+                )
+                if in_use + requested[key] > item.quantity:
+                    shortages.setdefault(booking_date, []).append({
+                        "name": item.name,
+                        "quantity": item.quantity,
+                        "requested": requested[key],
+                        "in_use": in_use,
+                        "at": from_minutes(peak_start) if peak_start is not None else start_time
+                    })
+        return shortages
+    
+    @staticmethod
+    def get_utilization(db: Session, booking_date: date) -> Dict[str, Any]:
+        """
+        Peak concurrent use of every inventory item on one day.
+        
+        Equipment named by approved bookings but missing from the inventory
+        is listed under `untracked`.
+        """
+        usage = EquipmentService._approved_usage(db, [booking_date]).get(booking_date, {})
+        
+        items = []
+        tracked = set()
+        for item in EquipmentService.get_all(db):
+            key = EquipmentService.normalize_name(item.name)
+            tracked.add(key)
+            uses = usage.get(key, [])
+            peak, peak_start, peak_end = peak_overlap(uses)
+            items.append({
+                "equipment_id": item.id,
+                "name": item.name,
+                "quantity": item.quantity,
+                "bookings": len(uses),
+                "peak_in_use": peak,
+                "peak_start": from_minutes(peak_start) if peak_start is not None else None,
+                "peak_end": from_minutes(peak_end) if peak_end is not None else None,
+                "overcommitted": peak > item.quantity
+            })
+        
+        return {
+            "date": booking_date,
+            "equipment": items,
+            "untracked": sorted(set(usage) - tracked)
+        }
@@ -0,0 +1,273 @@
+from sqlalchemy.orm import Session
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Set, Tuple
+import heapq
+import threading
+import uuid
+
+from app.models.hold import BookingHold
+from app.core.config import settings
+from app.services.approval_service import ApprovalService
+from app.utils.intervals import to_minutes
+
+DayKey = Tuple[str, date]
+
+
+class Hold(NamedTuple):
+    """An active hold on [start_min, end_min) of a room-day."""
+    id: str
+    user_id: str
+    room_id: str
+    date: date
+    start_min: int
+    end_min: int
+    expires_at: datetime  # Naive UTC
+
+
+class HoldService:
+    """
+    Short-lived slot holds (leases) taken while a booking form is filled in.
+
+    A hold blocks other users from requesting an overlapping slot until it
+    expires, so bursts for a popular room produce one PENDING row instead
+    of many. With HOLD_BACKEND="memory" holds live in this process only
+    (an expiry heap purged lazily on every call); use "database" to share
+    them through the booking_holds table when running several workers.
+    """
+
+    _lock = threading.RLock()
+    _holds: Dict[str, Hold] = {}
+    _by_day: Dict[DayKey, Dict[str, Hold]] = {}
+    _expiry: List[Tuple[datetime, str]] = []
+
+    @staticmethod
+    def _now() -> datetime:
+        return datetime.now(timezone.utc).replace(tzinfo=None)
+
+    @staticmethod
+    def _uses_database() -> bool:
+        return settings.HOLD_BACKEND == "database"
+
+    @staticmethod
+    def _from_row(row: BookingHold) -> Hold:
+        return Hold(row.id, row.user_id, row.room_id, row.date, row.start_min, row.end_min, row.expires_at)
+
+    @classmethod
+    def clear(cls):
+        """Drop all in-memory holds."""
+        with cls._lock:
+            cls._holds.clear()
+            cls._by_day.clear()
+            cls._expiry.clear()
+
+    @classmethod
+    def _purge_locked(cls, now: datetime):
+        while cls._expiry and cls._expiry[0][0] <= now:
+            _, hold_id = heapq.heappop(cls._expiry)
+            hold = cls._holds.get(hold_id)
+            # Skip heap entries for holds already released
+            if hold is not None and hold.expires_at <= now:
+                cls._drop_locked(hold)
+
+    @classmethod
+    def _drop_locked(cls, hold: Hold):
+        cls._holds.pop(hold.id, None)
+        key = (hold.room_id, hold.date)
+        day = cls._by_day.get(key)
+        if day is not None:
+            day.pop(hold.id, None)
+            if not day:
+                del cls._by_day[key]
+
+    @classmethod
+    def _active(
+        cls,
+        db: Session,
+        room_id: Optional[str] = None,
+        booking_date: Optional[date] = None,
+        user_id: Optional[str] = None
+    ) -> List[Hold]:
+        """Active holds, optionally narrowed to a room-day and/or a user."""
+        now = cls._now()
+        if cls._uses_database():
+            query = db.query(BookingHold).filter(BookingHold.expires_at > now)
+            if room_id is not None:
+                query = query.filter(BookingHold.room_id == room_id, BookingHold.date == booking_date)
+            if user_id is not None:
+                query = query.filter(BookingHold.user_id == user_id)
+            return [cls._from_row(row) for row in query]
+
+        with cls._lock:
+            cls._purge_locked(now)
+            if room_id is not None:
+                holds = list(cls._by_day.get((room_id, booking_date), {}).values())
+            else:
+                holds = list(cls._holds.values())
+        if user_id is not None:
+            holds = [hold for hold in holds if hold.user_id == user_id]
+        return holds
+
+    @classmethod
+    def count_for_user(cls, db: Session, user_id: str) -> int:
+        """Number of active holds owned by a user."""
+        return len(cls._active(db, user_id=user_id))
+
+    @classmethod
+    def blocking(
+        cls,
+        db: Session,
+        room_id: str,
+        booking_date: date,
+        start_time: time,
+        end_time: time,
+        user_id: str
+    ) -> List[Hold]:
+        """Other users' active holds overlapping the slot."""
+        start_min, end_min = to_minutes(start_time), to_minutes(end_time)
+        return [
+            hold for hold in cls._active(db, room_id, booking_date)
+            if hold.user_id != user_id and hold.start_min < end_min and hold.end_min > start_min
+        ]
+
+    @classmethod
+    def place(
+        cls,
+        db: Session,
+        user_id: str,
+        room_id: str,
+        booking_date: date,
+        start_time: time,
+        end_time: time,
+        seconds: int
+    ) -> Tuple[Optional[Hold], List[Hold]]:
+        """
+        Hold a slot for `seconds` unless another user already holds part of it.
+
+        The check and the insert are atomic: under the class lock in memory,
+        or under the (room_id, date) lock from ApprovalService in the database.
+
+        Returns:
+            tuple: (hold, blocking_holds); hold is None when blocked
+        """
+        hold = Hold(
+            str(uuid.uuid4()),
+            user_id,
+            room_id,
+            booking_date,
+            to_minutes(start_time),
+            to_minutes(end_time),
+            cls._now() + timedelta(seconds=seconds)
+        )
+
+        if cls._uses_database():
+            with ApprovalService.room_day_lock(db, room_id, booking_date):
+                try:
+                    blocking = cls.blocking(db, room_id, booking_date, start_time, end_time, user_id)
+                    if blocking:
+                        db.rollback()
+                        return None, blocking
+                    # Opportunistic cleanup keeps the table at roughly the live hold count
+                    db.query(BookingHold).filter(BookingHold.expires_at <= cls._now()).delete(synchronize_session=False)
+                    db.add(BookingHold(**hold._asdict()))
+                    db.commit()
+                except BaseException:
+                    db.rollback()
+                    raise
+            return hold, []
+
+        with cls._lock:
+            blocking = cls.blocking(db, room_id, booking_date, start_time, end_time, user_id)
+            if blocking:
+                return None, blocking
+            cls._holds[hold.id] = hold
+            cls._by_day.setdefault((room_id, booking_date), {})[hold.id] = hold
+            heapq.heappush(cls._expiry, (hold.expires_at, hold.id))
+        return hold, []
+
+    @classmethod
+    def release(cls, db: Session, hold_id: str, user_id: str) -> bool:
+        """Release a user's hold. Returns False if it is unknown or already expired."""
+        if cls._uses_database():
+            released = db.query(BookingHold).filter(
+                BookingHold.id == hold_id,
+                BookingHold.user_id == user_id,
+                BookingHold.expires_at > cls._now()
+            ).delete(synchronize_session=False)
+            db.commit()
+            return bool(released)
+
+        with cls._lock:
+            cls._purge_locked(cls._now())
+            hold = cls._holds.get(hold_id)
+            if hold is None or hold.user_id != user_id:
+                return False
+            cls._drop_locked(hold)
+            return True
+
+    @classmethod
+    def release_overlapping(
+        cls,
+        db: Session,
+        user_id: str,
+        room_id: str,
+        booking_date: date,
+        start_time: time,
+        end_time: time
+    ):
+        """Release a user's holds on a slot once their booking for it exists."""
+        start_min, end_min = to_minutes(start_time), to_minutes(end_time)
+        for hold in cls._active(db, room_id, booking_date, user_id=user_id):
+            if hold.start_min < end_min and hold.end_min > start_min:
+                cls.release(db, hold.id, user_id)
+
+    @classmethod
+    def busy_intervals(
+        cls,
+        db: Session,
+        date_from: date,
+        date_to: date,
+        room_ids: Optional[Iterable[str]] = None,
+        exclude_user_id: Optional[str] = None
+    ) -> Dict[DayKey, List[Tuple[int, int]]]:
+        """Held intervals per room-day in a date range, ignoring one user's own holds."""
+        if cls._uses_database():
+            query = db.query(BookingHold).filter(
+                BookingHold.expires_at > cls._now(),
+                BookingHold.date >= date_from,
+                BookingHold.date <= date_to
+            )
+            if room_ids is not None:
+                query = query.filter(BookingHold.room_id.in_(list(room_ids)))
+            holds = [cls._from_row(row) for row in query]
+        else:
+            wanted: Optional[Set[str]] = set(room_ids) if room_ids is not None else None
+            holds = [
+                hold for hold in cls._active(db)
+                if date_from <= hold.date <= date_to and (wanted is None or hold.room_id in wanted)
+            ]
+
+        busy: Dict[DayKey, List[Tuple[int, int]]] = {}
+        for hold in holds:
+            if hold.user_id != exclude_user_id:
+                busy.setdefault((hold.room_id, hold.date), []).append((hold.start_min, hold.end_min))
+        return busy
+
+    @classmethod
+    def blocked_dates(
+        cls,
+        db: Session,
+        room_id: str,
+        dates: Sequence[date],
+        start_time: time,
+        end_time: time,
+        user_id: str
+    ) -> List[date]:
+        """Dates on which other users hold part of the same slot, for recurring series."""
+        if not dates:
+            return []
+        start_min, end_min = to_minutes(start_time), to_minutes(end_time)
+        held = cls.busy_intervals(db, min(dates), max(dates), room_ids=[room_id], exclude_user_id=user_id)
+        return [
+            day for day in dates
+            if any(start < end_min and end > start_min for start, end in held.get((room_id, day), ()))
+        ]
@@ -1,9 +1,17 @@
-from sqlalchemy.orm import Session
-from typing import Optional, List
+from sqlalchemy.orm import Session, load_only
+from sqlalchemy import exists
+from typing import Optional, List, Set
+from datetime import date, time
 import uuid
 
 from app.models.room import Room
+from app.models.booking import Booking, BookingConflict
 from app.schemas.room import RoomCreate, RoomUpdate
+from app.services.conflict_index import ConflictIndex
+from app.services.hold_service import HoldService
+from app.services.version_service import VersionService, ROOMS
+from app.services.change_service import ChangeService
+from app.utils.intervals import to_minutes
 
 
 class RoomService:
@@ -20,15 +28,88 @@ class RoomService:
         return db.query(Room).filter(Room.room_number == room_number).first()
     
     @staticmethod
-    def get_all(db: Session, skip: int = 0, limit: int = 100, active_only: bool = True) -> List[Room]:
-        """Get all rooms with pagination."""
+    def get_all(
+        db: Session,
+        skip: int = 0,
+        limit: int = 100,
+        active_only: bool = True,
+        fields: Optional[List[str]] = None
+    ) -> List[Room]:
+        """Get all rooms with pagination; `fields` loads only those columns."""
         query = db.query(Room)
+        if fields is not None:
+            query = query.options(load_only(*(getattr(Room, name) for name in fields)))
         
         if active_only:
             query = query.filter(Room.is_active == True)
         
         return query.offset(skip).limit(limit).all()
     
+    @staticmethod
+    def normalize_features(features: Optional[List[str]]) -> Set[str]:
+        """Lower-case, trimmed set of requested features."""
+        return {feature.strip().lower() for feature in features or [] if feature.strip()}
+    
+    @staticmethod
+    def has_features(room_features: Optional[List[str]], required: Set[str]) -> bool:
+        """Check a room's feature list contains every normalized required feature."""
+        return required <= {str(feature).lower() for feature in room_features or []}
+    
+    @staticmethod
+    def find_available(
+        db: Session,
+        booking_date: date,
+        start_time: time,
+        end_time: time,
+        min_capacity: int = 1,
+        features: Optional[List[str]] = None,
+        limit: int = 100,
+        viewer_id: Optional[str] = None
+    ) -> List[Room]:
+        """
+        Find active rooms free for a time slot, smallest sufficient capacity first.
+        
+        Availability is a single anti-join (rooms minus rooms with an overlapping
+        approved booking), so this is one round trip regardless of room count.
+        Rooms with an overlapping hold by anyone but viewer_id are skipped.
+        Features are matched case-insensitively on the returned rows because
+        JSON containment differs per dialect.
+        """
+        start_min, end_min = to_minutes(start_time), to_minutes(end_time)
+        overlapping = exists().where(
+            Booking.room_id == Room.id,
+            Booking.date == booking_date,
+            Booking.approved_only(),
+            Booking.start_min < end_min,
+            Booking.end_min > start_min
+        )
+        
+        query = db.query(Room).filter(
+            Room.is_active == True,
+            Room.capacity >= min_capacity,
+            ~overlapping
+        ).order_by(Room.capacity, Room.name)
+        
+        held = HoldService.busy_intervals(db, booking_date, booking_date, exclude_user_id=viewer_id)
+        held_rooms = [
+            room_id for (room_id, _), intervals in held.items()
+            if any(start < end_min and end > start_min for start, end in intervals)
+        ]
+        if held_rooms:
+            query = query.filter(Room.id.notin_(held_rooms))
+        
+        required = RoomService.normalize_features(features)
+        if not required:
+            return query.limit(limit).all()
+        
+        matches = []
+        for room in query:
+            if RoomService.has_features(room.features, required):
+                matches.append(room)
+                if len(matches) >= limit:
+                    break
+        return matches
+    
     @staticmethod
     def create(db: Session, room_data: RoomCreate) -> Room:
         """Create a new room."""
@@ -44,6 +125,7 @@ class RoomService:
         )
         
         db.add(room)
+        VersionService.bump(db, scopes=[ROOMS])
         db.commit()
         db.refresh(room)
         return room
@@ -59,6 +141,7 @@ class RoomService:
         for field, value in update_dict.items():
             setattr(room, field, value)
         
+        VersionService.bump(db, scopes=[ROOMS])
         db.commit()
         db.refresh(room)
         return room
@@ -70,6 +153,14 @@ class RoomService:
         if not room:
             return False
         
+        touched_days = [
+            tuple(row) for row in db.query(Booking.room_id, Booking.date).filter(Booking.room_id == room_id).distinct()
+        ]
+        ChangeService.record_deletions(db, Booking.room_id == room_id)
         db.delete(room)
+        # Recorded pairs carry no foreign key to the room
+        db.query(BookingConflict).filter(BookingConflict.room_id == room_id).delete(synchronize_session=False)
+        VersionService.bump(db, touched_days, scopes=[ROOMS])
         db.commit()
+        ConflictIndex.invalidate(room_id=room_id)
         return True
\ No newline at end of file
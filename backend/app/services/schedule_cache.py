@@ -0,0 +1,145 @@
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+import threading
+
+from app.core.config import settings
+
+Versions = Tuple[Tuple[str, int], ...]
+
+
+class _Flight:
+    """A load in progress that concurrent misses for the same key wait on."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.rows: Optional[List[Dict[str, Any]]] = None
+        self.error: Optional[BaseException] = None
+
+
+class ScheduleCache:
+    """
+    Process-local LRU cache of approved-schedule pages for non-admin users.
+
+    Every regular user's GET /bookings without user_id is rewritten to
+    status=APPROVED, so the dashboard's morning rush is thousands of
+    identical queries. Entries are keyed by the normalized filters and
+    tagged with the data versions read for the request's ETag; an entry is
+    served only while those versions are unchanged. Booking writes bump the
+    room-day counters they touch (VersionService), so invalidation is
+    precise and also holds across workers. Concurrent misses for one key
+    share a single query (single-flight).
+    """
+
+    _enabled: bool = settings.ENABLE_SCHEDULE_CACHE
+    _lock = threading.Lock()
+    _entries: "OrderedDict[Hashable, Tuple[Versions, List[Dict[str, Any]]]]" = OrderedDict()
+    _flights: Dict[Tuple[Hashable, Versions], _Flight] = {}
+    _hits: int = 0
+    _misses: int = 0
+    _coalesced: int = 0
+    _evictions: int = 0
+
+    @staticmethod
+    def make_key(**filters: Any) -> Hashable:
+        """Normalized cache key; unset filters and argument order do not matter."""
+        return tuple(sorted((name, value) for name, value in filters.items() if value is not None))
+
+    @classmethod
+    def set_enabled(cls, enabled: bool):
+        """Enable or disable the cache. Disabling drops all entries."""
+        with cls._lock:
+            cls._enabled = enabled
+            cls._entries.clear()
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        """Check if the cache is enabled."""
+        return cls._enabled
+
+    @classmethod
+    def clear(cls):
+        """Drop all entries and reset the counters."""
+        with cls._lock:
+            cls._entries.clear()
+            cls._hits = cls._misses = cls._coalesced = cls._evictions = 0
+
+    @classmethod
+    def get_or_load(
+        cls,
+        key: Hashable,
+        versions: Dict[str, int],
+        load: Callable[[], List[Dict[str, Any]]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Return the cached rows for a key at the given versions, loading on a miss.
+
+        Callers read `versions` before loading, so a write racing the load
+        can only make the stored rows newer than their tag; the next reader
+        sees the bumped versions and reloads. Cached rows are shared between
+        requests and must not be mutated.
+        """
+        if not cls._enabled:
+            return load()
+
+        tag: Versions = tuple(sorted(versions.items()))
+        with cls._lock:
+            entry = cls._entries.get(key)
+            if entry is not None and entry[0] == tag:
+                cls._entries.move_to_end(key)
+                cls._hits += 1
+                return entry[1]
+            flight = cls._flights.get((key, tag))
+            leader = flight is None
+            if leader:
+                flight = cls._flights[(key, tag)] = _Flight()
+                cls._misses += 1
+            else:
+                cls._coalesced += 1
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.rows
+
+        try:
+            flight.rows = load()
+        except BaseException as error:
+            flight.error = error
+            raise
+        finally:
+            with cls._lock:
+                cls._flights.pop((key, tag), None)
+                if flight.error is None and cls._enabled:
+                    cls._store_locked(key, tag, flight.rows)
+            flight.done.set()
+        return flight.rows
+
+    @classmethod
+    def stats(cls) -> Dict[str, Any]:
+        """Return cache size and hit/miss counters."""
+        with cls._lock:
+            lookups = cls._hits + cls._misses + cls._coalesced
+            return {
+                "enabled": cls._enabled,
+                "entries": len(cls._entries),
+                "max_entries": settings.SCHEDULE_CACHE_MAX_ENTRIES,
+                "in_flight": len(cls._flights),
+                "hits": cls._hits,
+                "misses": cls._misses,
+                "coalesced": cls._coalesced,
+                "evictions": cls._evictions,
+                "hit_ratio": round((cls._hits + cls._coalesced) / lookups, 4) if lookups else None,
+            }
+
+    @classmethod
+    def _store_locked(cls, key: Hashable, tag: Versions, rows: List[Dict[str, Any]]):
+        current = cls._entries.get(key)
+        # A slower load for older versions must not replace a newer entry
+        if current is not None and current[0] > tag:
+            return
+        cls._entries[key] = (tag, rows)
+        cls._entries.move_to_end(key)
+        while len(cls._entries) > settings.SCHEDULE_CACHE_MAX_ENTRIES:
+            cls._entries.popitem(last=False)
+            cls._evictions += 1
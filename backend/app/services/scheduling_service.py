@@ -0,0 +1,198 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import and_
+from datetime import date, datetime, timedelta
+from itertools import groupby, islice
+from typing import Dict, Iterator, List, Optional, Tuple, Any
+import heapq
+
+from app.models.booking import Booking
+from app.models.room import Room
+from app.services.availability_service import AvailabilityService
+from app.services.hold_service import HoldService
+from app.services.room_service import RoomService
+from app.utils.intervals import free_gaps, from_minutes, to_minutes
+
+# (date, start_min, capacity, room_name, room_id, end_min)
+SlotOption = Tuple[date, int, int, str, str, int]
+
+
+class SchedulingService:
+    """Service for finding the earliest bookable slots across rooms."""
+
+    @staticmethod
+    def _room_options(
+        room: Tuple[str, str, int],
+        busy: Dict[date, List[Tuple[int, int]]],
+        date_from: date,
+        date_to: date,
+        duration: int,
+        not_before: Optional[datetime]
+    ) -> Iterator[SlotOption]:
+        """Yield a room's feasible starts (one per free gap) in time order."""
+        room_id, room_name, capacity = room
+        day_start, day_end = AvailabilityService.business_hours()
+        current = date_from
+        if not_before is not None:
+            current = max(current, not_before.date())
+        while current <= date_to:
+            start = day_start
+            if not_before is not None and current == not_before.date():
+                # Round up to the next whole minute
+                cutoff = to_minutes(not_before.time()) + (1 if not_before.second or not_before.microsecond else 0)
+                start = max(start, cutoff)
+            for gap_start, _ in free_gaps(busy.get(current, ()), start, day_end, duration):
+                yield current, gap_start, capacity, room_name, room_id, gap_start + duration
+            current += timedelta(days=1)
+
+    @staticmethod
+    def find_earliest(
+        db: Session,
+        date_from: date,
+        date_to: date,
+        duration: int,
+        min_capacity: int = 1,
+        features: Optional[List[str]] = None,
+        limit: int = 5,
+        not_before: Optional[datetime] = None,
+        viewer_id: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Find the earliest start times, across all matching rooms, for a meeting.
+
+        Candidate rooms and their approved bookings in the window come from
+        one outer-join query ordered by (room, date, start_min), so each
+        room's busy list is already sorted; other users' holds are merged in
+        afterwards. Every room then lazily yields its free-gap starts in time
+        order and heapq.merge pulls the first `limit` of them, so rooms with
+        late availability are never fully expanded.
+
+        Args:
+            db: Database session
+            date_from: First day to search (inclusive)
+            date_to: Last day to search (inclusive)
+            duration: Meeting length in minutes
+            min_capacity: Rooms must hold at least this many people
+            features: Rooms must have every listed feature
+            limit: Number of options to return
+            not_before: Ignore starts before this moment (e.g. now)
+            viewer_id: User whose own holds are not treated as busy
+
+        Returns:
+            Options ordered by (date, start, capacity), at most one per free gap
+        """
+        rows = db.query(
+            Room.id,
+            Room.name,
+            Room.capacity,
+            Room.features,
+            Booking.date,
+            Booking.start_min,
+            Booking.end_min
+        ).outerjoin(
+            Booking,
+            and_(
+                Booking.room_id == Room.id,
+                Booking.date >= date_from,
+                Booking.date <= date_to,
+                Booking.approved_only()
+            )
+        ).filter(
+            Room.is_active == True,
+            Room.capacity >= min_capacity
+        ).order_by(Room.id, Booking.date, Booking.start_min).all()
+
+        required = RoomService.normalize_features(features)
+        rooms: Dict[str, Tuple[str, str, int]] = {}
+        busy: Dict[str, Dict[date, List[Tuple[int, int]]]] = {}
+        for room_id, name, capacity, room_features, booking_date, start_min, end_min in rows:
+            if room_id not in busy:
+                busy[room_id] = {}
+                if not required or RoomService.has_features(room_features, required):
+                    rooms[room_id] = (room_id, name, capacity)
+            if booking_date is not None and room_id in rooms:
+                busy[room_id].setdefault(booking_date, []).append((start_min, end_min))
+
+        held = HoldService.busy_intervals(db, date_from, date_to, room_ids=rooms.keys(), exclude_user_id=viewer_id)
+        for (room_id, held_date), intervals in held.items():
+            busy[room_id][held_date] = sorted(busy[room_id].get(held_date, []) + intervals)
+
+        streams = [
+            SchedulingService._room_options(room, busy[room_id], date_from, date_to, duration, not_before)
+            for room_id, room in rooms.items()
+        ]
+        options = islice(heapq.merge(*streams), limit)
+
+        return [
+            {
+                "room_id": room_id,
+                "room_name": room_name,
+                "capacity": capacity,
+                "date": option_date,
+                "start_time": from_minutes(start_min),
+                "end_time": from_minutes(end_min)
+            }
+            for option_date, start_min, capacity, room_name, room_id, end_min in options
+        ]
+
+    @staticmethod
+    def day_grid(db: Session, day: date, floor: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Approved bookings of one day as a rooms x time grid.
+
+        One outer-join query ordered by (room, start_min) returns every
+        active room with its approved blocks already in order, so rows are
+        grouped in a single pass. Blocks are compact
+        (start_min, end_min, booking_id, title) tuples.
+
+        Args:
+            db: Database session
+            day: Day to show
+            floor: Only rooms on this floor
+
+        Returns:
+            Dictionary shaped like ScheduleGridResponse, rooms ordered by
+            floor and room number
+        """
+        query = db.query(
+            Room.id,
+            Room.name,
+            Room.floor,
+            Room.room_number,
+            Room.capacity,
+            Booking.start_min,
+            Booking.end_min,
+            Booking.id,
+            Booking.title
+        ).outerjoin(
+            Booking,
+            and_(
+                Booking.room_id == Room.id,
+                Booking.date == day,
+                Booking.approved_only()
+            )
+        ).filter(Room.is_active == True)
+        if floor is not None:
+            query = query.filter(Room.floor == floor)
+
+        rooms = []
+        for (room_id, name, room_floor, room_number, capacity), rows in groupby(
+            query.order_by(Room.id, Booking.start_min), key=lambda row: tuple(row[:5])
+        ):
+            rooms.append({
+                "id": room_id,
+                "name": name,
+                "floor": room_floor,
+                "room_number": room_number,
+                "capacity": capacity,
+                "blocks": [tuple(row[5:]) for row in rows if row[7] is not None]
+            })
+        rooms.sort(key=lambda room: (room["floor"], room["room_number"]))
+
+        day_start, day_end = AvailabilityService.business_hours()
+        return {
+            "date": day,
+            "day_start": day_start,
+            "day_end": day_end,
+            "columns": ("start_min", "end_min", "booking_id", "title"),
+            "rooms": rooms
+        }
@@ -0,0 +1,221 @@
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import insert
+from datetime import date, datetime
+from typing import Dict, List, Optional, Tuple
+import random
+import uuid
+
+from app.models.booking import Booking, BookingStatusEnum
+from app.models.user import User
+from app.schemas.booking import BookingSeriesCreate, RecurrenceFrequencyEnum, RecurrenceRule
+from app.services.conflict_index import ConflictIndex
+from app.services.conflict_service import ConflictService
+from app.services.version_service import VersionService
+from app.utils.intervals import to_minutes
+
+
+class SeriesService:
+    """
+    Service for recurring booking series.
+
+    A series is expanded up front into ordinary PENDING bookings that share
+    a series_id, so approval, conflicts and cleanup treat each occurrence
+    like any other booking. Creation costs a fixed number of round trips
+    however many occurrences there are.
+    """
+    
+    @staticmethod
+    def expand(first_date: date, rule: RecurrenceRule, limit: int) -> List[date]:
+        """
+        Occurrence dates of a rule, in order, starting on first_date.
+        
+        Each weekday of a weekly rule (or the single daily start) is an
+        arithmetic progression of day ordinals, generated with range() and
+        merged by one sort. At most limit + 1 dates are produced, so callers
+        can reject over-long series without expanding them in full.
+        """
+        first = first_date.toordinal()
+        if rule.frequency == RecurrenceFrequencyEnum.DAILY:
+            starts, step = [first], rule.interval
+        else:
+            monday = first - first_date.weekday()
+            starts = [monday + weekday for weekday in rule.by_weekday or [first_date.weekday()]]
+            step = 7 * rule.interval
+        
+        wanted = min(rule.count, limit + 1) if rule.count else limit + 1
+        # One extra step per progression covers a weekday before first_date
+        last = rule.until.toordinal() if rule.until else None
+        ordinals = sorted(
+            ordinal
+            for start in starts
+            for ordinal in range(
+                start,
+                start + step * (wanted + 1) if last is None else min(start + step * (wanted + 1), last + 1),
+                step
+            )
+            if ordinal >= first
+        )
+        return [date.fromordinal(ordinal) for ordinal in ordinals[:wanted]]
+    
+    @staticmethod
+    def _new_booking_ids(db: Session, count: int) -> Optional[List[str]]:
+        """
+        Pick `count` unused BK-YYYY-NNNN IDs with one lookup per attempt.
+        
+        Returns:
+            The IDs, or None when the year's ID space is too full
+        """
+        year = datetime.now().year
+        free = list(range(1000, 10000))
+        chosen: List[str] = []
+        for _ in range(3):
+            sample = set(random.sample(free, min(len(free), 2 * (count - len(chosen)) + 16)))
+            candidates = [f"BK-{year}-{number}" for number in sample]
+            taken = {row.id for row in db.query(Booking.id).filter(Booking.id.in_(candidates))}
+            chosen.extend(candidate for candidate in candidates if candidate not in taken)
+            if len(chosen) >= count:
+                return chosen[:count]
+            free = [number for number in free if number not in sample]
+        return None
+    
+    @staticmethod
+    def _approved_conflicts(
+        db: Session,
+        room_id: str,
+        dates: List[date],
+        start_min: int,
+        end_min: int
+    ) -> Dict[date, List[Tuple[str, str]]]:
+        """
+        Approved bookings overlapping the slot on any occurrence date, in one
+        range query over [first, last] date of the series.
+        
+        Returns:
+            (owner name, priority) per conflicting booking, keyed by date
+        """
+        wanted = set(dates)
+        rows = db.query(Booking.date, User.name, Booking.priority).join(User, Booking.user_id == User.id).filter(
+            Booking.room_id == room_id,
+            Booking.date >= dates[0],
+            Booking.date <= dates[-1],
+            Booking.approved_only(),
+            Booking.start_min < end_min,
+            Booking.end_min > start_min
+        ).order_by(Booking.date, Booking.start_min)
+        
+        conflicts: Dict[date, List[Tuple[str, str]]] = {}
+        for booking_date, user_name, priority in rows:
+            if booking_date in wanted:
+                conflicts.setdefault(booking_date, []).append((user_name, priority.value))
+        return conflicts
+    
+    @staticmethod
+    def create(
+        db: Session,
+        user_id: str,
+        series_data: BookingSeriesCreate,
+        dates: List[date]
+    ) -> Tuple[Optional[str], List[Booking], List[date]]:
+        """
+        Create PENDING bookings for every occurrence date.
+        
+        Occurrences that collide with approved bookings get the same
+        override note as a single booking, or are left out when
+        skip_conflicts is set. All rows go in with one INSERT, and conflict
+        counters for the touched room-days are refreshed before commit.
+        
+        Returns:
+            tuple: (series_id, created bookings by date, skipped dates);
+            series_id is None when every date was skipped or no booking
+            IDs could be allocated
+        """
+        start_min, end_min = to_minutes(series_data.start_time), to_minutes(series_data.end_time)
+        conflicts = SeriesService._approved_conflicts(db, series_data.room_id, dates, start_min, end_min)
+        
+        skipped: List[date] = []
+        if series_data.skip_conflicts:
+            skipped = [day for day in dates if day in conflicts]
+            dates = [day for day in dates if day not in conflicts]
+        if not dates:
+            return None, [], skipped
+        
+        booking_ids = SeriesService._new_booking_ids(db, len(dates))
+        if booking_ids is None:
+            return None, [], []
+        
+        series_id = str(uuid.uuid4())
+        # Core-level insert: start_min/end_min are not synced by @validates here
+        rows = [
+            {
+                "id": booking_id,
+                "user_id": user_id,
+                "room_id": series_data.room_id,
+                "date": booking_date,
+                "start_time": series_data.start_time,
+                "end_time": series_data.end_time,
+                "start_min": start_min,
+                "end_min": end_min,
+                "title": series_data.title,
+                "attendees": series_data.attendees,
+                "description": series_data.description,
+                "priority": series_data.priority,
+                "status": BookingStatusEnum.PENDING,
+                "equipment": series_data.equipment,
+                "notes": (
+                    "Override request - Conflicts with: "
+                    + ", ".join(f"{name} ({priority})" for name, priority in conflicts[booking_date])
+                ) if booking_date in conflicts else None,
+                "series_id": series_id,
+                "conflict_count": 0
+            }
+            for booking_id, booking_date in zip(booking_ids, dates)
+        ]
+        db.execute(insert(Booking), rows)
+        ConflictService.refresh_conflict_counts(db, [(series_data.room_id, day) for day in dates])
+        VersionService.bump(db, [(series_data.room_id, day) for day in dates])
+        db.commit()
+        
+        return series_id, SeriesService.get_occurrences(db, series_id), skipped
+    
+    @staticmethod
+    def get_occurrences(db: Session, series_id: str) -> List[Booking]:
+        """Get a series' bookings by date, with user and room loaded."""
+        return db.query(Booking).options(
+            joinedload(Booking.user),
+            joinedload(Booking.room)
+        ).filter(Booking.series_id == series_id).order_by(Booking.date).all()
+    
+    @staticmethod
+    def get_owner_id(db: Session, series_id: str) -> Optional[str]:
+        """User who created a series, or None if it does not exist."""
+        row = db.query(Booking.user_id).filter(Booking.series_id == series_id).first()
+        return row.user_id if row else None
+    
+    @staticmethod
+    def cancel(db: Session, series_id: str, from_date: date, notes: Optional[str] = None) -> int:
+        """
+        Cancel a series' pending and approved occurrences on or after from_date.
+        
+        Returns:
+            Number of bookings cancelled
+        """
+        rows = db.query(Booking.id, Booking.room_id, Booking.date).filter(
+            Booking.series_id == series_id,
+            Booking.date >= from_date,
+            Booking.status.in_([BookingStatusEnum.PENDING, BookingStatusEnum.APPROVED])
+        ).all()
+        if not rows:
+            return 0
+        
+        values = {"status": BookingStatusEnum.CANCELLED}
+        if notes:
+            values["notes"] = notes
+        db.query(Booking).filter(Booking.id.in_([row.id for row in rows])).update(
+            values, synchronize_session=False
+        )
+        ConflictService.refresh_conflict_counts(db, [(row.room_id, row.date) for row in rows])
+        VersionService.bump(db, [(row.room_id, row.date) for row in rows])
+        db.commit()
+        for row in rows:
+            ConflictIndex.discard(row.id)
+        return len(rows)
@@ -1,8 +1,13 @@
-from sqlalchemy.orm import Session
-from typing import Optional
+from sqlalchemy.orm import Session, load_only
+from typing import List, Optional
 from app.models.user import User
+from app.models.booking import Booking
 from app.variables.security import get_password_hash
 from app.schemas.user import UserCreate, UserUpdate
+from app.services.conflict_index import ConflictIndex
+from app.services.conflict_service import ConflictService
+from app.services.version_service import VersionService, USERS
+from app.services.change_service import ChangeService
 
 class UserService:
     @staticmethod
@@ -44,14 +49,18 @@ class UserService:
         for field, value in update_data.items():
             setattr(user, field, value)
         
+        VersionService.bump(db, scopes=[USERS])
         db.commit()
         db.refresh(user)
         return user
 
     @staticmethod
-    def get_all(db: Session, skip: int = 0, limit: int = 100):
-        """Get all users with pagination."""
-        return db.query(User).offset(skip).limit(limit).all()
+    def get_all(db: Session, skip: int = 0, limit: int = 100, fields: Optional[List[str]] = None):
+        """Get all users with pagination; `fields` loads only those columns."""
+        query = db.query(User)
+        if fields is not None:
+            query = query.options(load_only(*(getattr(User, name) for name in fields)))
+        return query.offset(skip).limit(limit).all()
 
     @staticmethod
     def delete(db: Session, user_id: str) -> bool:
@@ -59,8 +68,16 @@ class UserService:
         user = db.query(User).filter(User.id == user_id).first()
         if not user:
             return False
+        touched_days = [
+            tuple(row) for row in db.query(Booking.room_id, Booking.date).filter(Booking.user_id == user_id).distinct()
+        ]
+        ChangeService.record_deletions(db, Booking.user_id == user_id)
         db.delete(user)
+        ConflictService.refresh_conflict_counts(db, touched_days)
+        VersionService.bump(db, touched_days, scopes=[USERS])
         db.commit()
+        # Cascaded booking deletes can touch any room-day
+        ConflictIndex.invalidate()
         return True
 
     # Example of a method that needs AuthService (use local import)
@@ -0,0 +1,106 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import insert as generic_insert, update
+from sqlalchemy.dialects import mysql, postgresql, sqlite
+from datetime import date, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from app.models.version import DataVersion
+
+DayKey = Tuple[str, date]
+
+BOOKINGS = "bookings"
+ROOMS = "rooms"
+USERS = "users"
+
+# Longest room_id + date range whose per-day versions are looked up individually
+MAX_ROOM_DAY_SCOPES = 31
+
+
+class VersionService:
+    """
+    Change counters backing ETags on listing endpoints.
+    
+    Write paths call bump() inside their transaction, before commit, so a
+    version moves exactly when the data it covers becomes visible. Booking
+    writes bump the global "bookings" counter and one counter per touched
+    room-day; room and user writes bump "rooms" and "users" (their names
+    appear in booking responses). Readers fetch the counters they depend
+    on with one primary-key lookup.
+    """
+    
+    @staticmethod
+    def room_day_scope(room_id: str, booking_date: date) -> str:
+        return f"{BOOKINGS}:{room_id}:{booking_date.isoformat()}"
+    
+    @staticmethod
+    def bump(db: Session, keys: Iterable[DayKey] = (), scopes: Iterable[str] = ()):
+        """Increment counters for booking room-days and/or named scopes."""
+        keys = set(keys)
+        targets = set(scopes)
+        if keys:
+            targets.add(BOOKINGS)
+            targets.update(VersionService.room_day_scope(room_id, day) for room_id, day in keys)
+        if not targets:
+            return
+        
+        # Sorted so concurrent writers lock counter rows in the same order
+        rows = [{"scope": scope, "version": 1} for scope in sorted(targets)]
+        dialect = db.get_bind().dialect.name
+        if dialect in ("postgresql", "sqlite"):
+            insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+            statement = insert(DataVersion).values(rows)
+            db.execute(statement.on_conflict_do_update(
+                index_elements=[DataVersion.scope],
+                set_={"version": DataVersion.version + 1}
+            ))
+        elif dialect == "mysql":
+            db.execute(mysql.insert(DataVersion).values(rows).on_duplicate_key_update(
+                version=DataVersion.version + 1
+            ))
+        else:
+            existing = {
+                row.scope for row in db.query(DataVersion.scope).filter(DataVersion.scope.in_(sorted(targets)))
+            }
+            if existing:
+                db.execute(
+                    update(DataVersion).where(DataVersion.scope.in_(sorted(existing))).values(
+                        version=DataVersion.version + 1
+                    )
+                )
+            missing = [row for row in rows if row["scope"] not in existing]
+            if missing:
+                db.execute(generic_insert(DataVersion), missing)
+    
+    @staticmethod
+    def current(db: Session, scopes: Iterable[str]) -> Dict[str, int]:
+        """Current counters for some scopes; never-bumped scopes are 0."""
+        scopes = sorted(set(scopes))
+        versions = dict.fromkeys(scopes, 0)
+        versions.update(
+            (row.scope, row.version)
+            for row in db.query(DataVersion.scope, DataVersion.version).filter(DataVersion.scope.in_(scopes))
+        )
+        return versions
+    
+    @staticmethod
+    def booking_scopes(
+        room_id: Optional[str] = None,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None
+    ) -> List[str]:
+        """
+        Counters a booking listing depends on.
+        
+        One room over a short date range depends only on its room-days, so
+        writes elsewhere do not invalidate it; anything wider uses the
+        global bookings counter.
+        """
+        scopes = [ROOMS, USERS]
+        if room_id and date_from and date_to and 0 <= (date_to - date_from).days < MAX_ROOM_DAY_SCOPES:
+            scopes.extend(
+                VersionService.room_day_scope(room_id, date_from + timedelta(days=offset))
+                for offset in range((date_to - date_from).days + 1)
+            )
+        else:
+            scopes.append(BOOKINGS)
+        return scopes
@@ -0,0 +1,24 @@
+import hashlib
+import json
+from typing import Any, Dict, Optional
+
+
+def make_etag(versions: Dict[str, int], **params: Any) -> str:
+    """
+    Strong ETag for a response determined by data versions and request inputs.
+
+    Callers pass everything that changes the body besides the data: query
+    parameters and, where results depend on it, the viewer.
+    """
+    payload = json.dumps({"versions": versions, "params": params}, sort_keys=True, default=str)
+    return '"' + hashlib.sha256(payload.encode()).hexdigest()[:32] + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header against an ETag (weak comparison, per RFC 9110)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip() for tag in if_none_match.split(","))
+    return any(tag.removeprefix("W/") == etag for tag in candidates)
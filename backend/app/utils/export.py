@@ -0,0 +1,87 @@
+import csv
+import io
+import json
+from datetime import date, datetime, time
+from enum import Enum
+from typing import Any, Iterable, Iterator
+
+# Column order of booking exports; every name is a BOOKING_LIST_COLUMNS label
+EXPORT_COLUMNS = (
+    "id",
+    "date",
+    "start_time",
+    "end_time",
+    "room_id",
+    "room_name",
+    "user_id",
+    "user_name",
+    "title",
+    "attendees",
+    "description",
+    "priority",
+    "status",
+    "equipment",
+    "notes",
+    "conflict_count",
+    "series_id",
+    "created_at",
+    "updated_at",
+)
+
+# Rows buffered per yielded chunk
+ROWS_PER_CHUNK = 500
+
+
+def _plain(value: Any) -> Any:
+    """JSON-compatible form of a column value."""
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (date, time, datetime)):
+        return value.isoformat()
+    return value
+
+
+def csv_chunks(rows: Iterable[Any]) -> Iterator[str]:
+    """
+    CSV text in chunks of ROWS_PER_CHUNK rows, header first.
+
+    Equipment lists are joined with "; ".
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_COLUMNS)
+    yield _drain(buffer)
+
+    buffered = 0
+    for row in rows:
+        record = row._mapping
+        writer.writerow([
+            "; ".join(map(str, record[name] or [])) if name == "equipment" else _plain(record[name])
+            for name in EXPORT_COLUMNS
+        ])
+        buffered += 1
+        if buffered == ROWS_PER_CHUNK:
+            yield _drain(buffer)
+            buffered = 0
+    if buffered:
+        yield _drain(buffer)
+
+
+def ndjson_chunks(rows: Iterable[Any]) -> Iterator[str]:
+    """Newline-delimited JSON objects in chunks of ROWS_PER_CHUNK rows."""
+    lines = []
+    for row in rows:
+        record = row._mapping
+        lines.append(json.dumps({name: _plain(record[name]) for name in EXPORT_COLUMNS}) + "\n")
+        if len(lines) == ROWS_PER_CHUNK:
+            yield "".join(lines)
+            lines = []
+    if lines:
+        yield "".join(lines)
+
+
+def _drain(buffer: io.StringIO) -> str:
+    text = buffer.getvalue()
+    buffer.seek(0)
+    buffer.truncate()
+    return text
@@ -0,0 +1,25 @@
+from typing import List, Optional, Type
+
+from pydantic import BaseModel
+
+
+def parse_fields(fields: Optional[str], schema: Type[BaseModel]) -> Optional[List[str]]:
+    """
+    Parse a comma-separated `fields=` parameter against a response schema.
+
+    Only the schema's fields may be requested and `id` is always included.
+
+    Returns:
+        Field names in schema order, or None when every field is wanted
+
+    Raises:
+        ValueError: Naming any unknown fields
+    """
+    if not fields:
+        return None
+    requested = {name.strip() for name in fields.split(",") if name.strip()}
+    unknown = requested - schema.model_fields.keys()
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))}")
+    requested.add("id")
+    return [name for name in schema.model_fields if name in requested]
@@ -0,0 +1,163 @@
+from bisect import bisect_right
+from datetime import time
+from typing import Hashable, Iterable, Iterator, List, Optional, Tuple
+
+MINUTES_PER_DAY = 24 * 60
+
+
+def to_minutes(value: time) -> int:
+    """Convert a time of day to minutes since midnight."""
+    return value.hour * 60 + value.minute
+
+
+def from_minutes(minutes: int) -> time:
+    """Convert minutes since midnight back to a time of day."""
+    if minutes >= MINUTES_PER_DAY:
+        return time(23, 59)
+    return time(minutes // 60, minutes % 60)
+
+
+def format_minutes(minutes: int) -> str:
+    """Format minutes since midnight as HH:MM (end of day is 24:00)."""
+    return f"{minutes // 60:02d}:{minutes % 60:02d}"
+
+
+def free_gaps(
+    busy: Iterable[Tuple[int, int]],
+    day_start: int,
+    day_end: int,
+    min_length: int = 1
+) -> List[Tuple[int, int]]:
+    """
+    Sweep busy intervals sorted by start and return the free gaps inside
+    [day_start, day_end) that are at least min_length long.
+    """
+    gaps: List[Tuple[int, int]] = []
+    cursor = day_start
+    for start, end in busy:
+        if end <= cursor:
+            continue
+        if start >= day_end:
+            break
+        if start - cursor >= min_length:
+            gaps.append((cursor, start))
+        cursor = max(cursor, end)
+        if cursor >= day_end:
+            return gaps
+    if day_end - cursor >= min_length:
+        gaps.append((cursor, day_end))
+    return gaps
+
+
+def peak_overlap(intervals: Iterable[Tuple[int, int, int]]) -> Tuple[int, Optional[int], Optional[int]]:
+    """
+    Sweep weighted [start, end) intervals and return the peak total weight
+    open at once, with the first [start, end) stretch that reaches it.
+
+    Touching intervals do not overlap: all changes at a minute are applied
+    before the level is compared. Start and end are None without intervals.
+    """
+    events: List[Tuple[int, int]] = []
+    for start, end, weight in intervals:
+        if end > start and weight:
+            events.append((start, weight))
+            events.append((end, -weight))
+    events.sort()
+
+    peak, level = 0, 0
+    peak_start: Optional[int] = None
+    peak_end: Optional[int] = None
+    index = 0
+    while index < len(events):
+        minute = events[index][0]
+        while index < len(events) and events[index][0] == minute:
+            level += events[index][1]
+            index += 1
+        if level > peak:
+            peak, peak_start, peak_end = level, minute, None
+        elif peak_end is None and peak_start is not None and level < peak:
+            peak_end = minute
+    return peak, peak_start, peak_end
+
+
+class IntervalSet:
+    """
+    Half-open [start, end) intervals kept sorted by start.
+
+    Overlap queries walk an implicit balanced tree laid over the sorted
+    array, where every node stores the maximum end of its subtree, so a
+    query visits O(log n + k) nodes. The tree is rebuilt lazily after a
+    mutation, which is O(n) and cheap for the per-room-day sizes we hold.
+    """
+
+    __slots__ = ("_starts", "_items", "_max_end", "_dirty")
+
+    def __init__(self, items: Iterable[Tuple[int, int, Hashable]] = ()):
+        self._items: List[Tuple[int, int, Hashable]] = sorted(items, key=lambda item: (item[0], item[1]))
+        self._starts: List[int] = [item[0] for item in self._items]
+        self._max_end: List[int] = []
+        self._dirty = True
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[Tuple[int, int, Hashable]]:
+        return iter(self._items)
+
+    def add(self, start: int, end: int, key: Hashable) -> None:
+        """Insert an interval identified by key."""
+        position = bisect_right(self._starts, start)
+        self._starts.insert(position, start)
+        self._items.insert(position, (start, end, key))
+        self._dirty = True
+
+    def remove(self, key: Hashable) -> bool:
+        """Remove the interval identified by key. Returns False if absent."""
+        for position, item in enumerate(self._items):
+            if item[2] == key:
+                del self._items[position]
+                del self._starts[position]
+                self._dirty = True
+                return True
+        return False
+
+    def keys(self) -> List[Hashable]:
+        """Return the keys of all stored intervals."""
+        return [item[2] for item in self._items]
+
+    def overlapping(self, start: int, end: int) -> List[Hashable]:
+        """Return keys of intervals overlapping [start, end), ordered by start."""
+        if self._dirty:
+            self._rebuild()
+        found: List[Hashable] = []
+        self._collect(0, len(self._items), start, end, found)
+        return found
+
+    def _rebuild(self) -> None:
+        self._max_end = [0] * len(self._items)
+        self._build(0, len(self._items))
+        self._dirty = False
+
+    def _build(self, lo: int, hi: int) -> int:
+        if lo >= hi:
+            return -1
+        mid = (lo + hi) // 2
+        best = max(self._items[mid][1], self._build(lo, mid), self._build(mid + 1, hi))
+        self._max_end[mid] = best
+        return best
+
+    def _collect(self, lo: int, hi: int, start: int, end: int, found: List[Hashable]) -> None:
+        if lo >= hi:
+            return
+        mid = (lo + hi) // 2
+        # Nothing in this subtree ends after the query starts
+        if self._max_end[mid] <= start:
+            return
+        self._collect(lo, mid, start, end, found)
+        item = self._items[mid]
+        # Everything from here rightwards starts at or after the query ends
+        if item[0] >= end:
+            return
+        if item[1] > start:
+            found.append(item[2])
+        self._collect(mid + 1, hi, start, end, found)
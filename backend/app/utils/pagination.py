@@ -0,0 +1,42 @@
+import base64
+import json
+from datetime import date, datetime, time
+from typing import Tuple
+
+# (date, start_time, id): the GET /bookings sort key, newest first
+BookingCursor = Tuple[date, time, str]
+
+# (database time, rooms version, users version) for GET /bookings/changes
+Watermark = Tuple[datetime, int, int]
+
+
+def encode_cursor(booking_date: date, start_time: time, booking_id: str) -> str:
+    """Encode the sort key of the last row on a page as an opaque cursor."""
+    raw = json.dumps([booking_date.isoformat(), start_time.isoformat(), booking_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> BookingCursor:
+    """Decode a cursor from encode_cursor; raises ValueError if it is malformed."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        booking_date, start_time, booking_id = json.loads(raw)
+        return date.fromisoformat(booking_date), time.fromisoformat(start_time), str(booking_id)
+    except (ValueError, TypeError) as error:
+        raise ValueError("Invalid cursor") from error
+
+
+def encode_watermark(as_of: datetime, rooms_version: int, users_version: int) -> str:
+    """Encode a delta-sync position as an opaque watermark."""
+    raw = json.dumps([as_of.isoformat(), rooms_version, users_version], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_watermark(watermark: str) -> Watermark:
+    """Decode a watermark from encode_watermark; raises ValueError if it is malformed."""
+    try:
+        raw = base64.urlsafe_b64decode(watermark + "=" * (-len(watermark) % 4))
+        as_of, rooms_version, users_version = json.loads(raw)
+        return datetime.fromisoformat(as_of), int(rooms_version), int(users_version)
+    except (ValueError, TypeError) as error:
+        raise ValueError("Invalid watermark") from error
@@ -0,0 +1,52 @@
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional
+
+from fastapi import Response
+from pydantic import TypeAdapter
+
+try:
+    import orjson
+except ImportError:  # Optional speedup; pydantic-core is always available
+    orjson = None
+
+# Fallback encoder: serializes by runtime type, without validation
+_ANY = TypeAdapter(Any)
+
+
+def dump_json(content: Any) -> bytes:
+    """
+    Encode trusted, JSON-ready values (dicts, lists, scalars, dates, enums).
+
+    Output matches response_model serialization: ISO dates and times, UTC
+    datetimes with a Z suffix, enums as their values.
+    """
+    if orjson is not None:
+        return orjson.dumps(content, option=orjson.OPT_UTC_Z)
+    return _ANY.dump_json(content)
+
+
+def rows_response(
+    rows: Iterable[Any],
+    fields: List[str],
+    normalizers: Optional[Dict[str, Callable[[Any], Any]]] = None,
+    headers: Optional[Mapping[str, str]] = None
+) -> Response:
+    """
+    JSON list of database rows (mappings or ORM objects) as a ready Response.
+
+    For list endpoints that read straight from the database: the rows are
+    trusted, so they skip the response_model's validate-then-serialize
+    round trip and go to JSON bytes in one pass. `fields` fixes the keys
+    and their order; `normalizers` reproduce the schema's before-validators
+    for fields that have one (e.g. NULL JSON lists become []).
+    """
+    normalizers = {name: normalize for name, normalize in (normalizers or {}).items() if name in fields}
+    body = []
+    for row in rows:
+        if isinstance(row, Mapping):
+            item = {name: row[name] for name in fields}
+        else:
+            item = {name: getattr(row, name) for name in fields}
+        for name, normalize in normalizers.items():
+            item[name] = normalize(item[name])
+        body.append(item)
+    return Response(content=dump_json(body), media_type="application/json", headers=headers)
@@ -43,5 +43,5 @@ def init_db():
     Create all tables in the database.
     Only use this if you are not using Alembic migrations.
     """
-    from app.models import User, Room, Booking  # import all your models
+    from app.models import User, Room, Booking, BookingConflict, BookingTombstone, BookingHold, EquipmentType, DataVersion  # import all your models
     Base.metadata.create_all(bind=engine)
@@ -0,0 +1,19 @@
+"""
+Conflict-detection benchmarks.
+
+Seeds 10k/100k/1M bookings into SQLite (and PostgreSQL when
+BENCH_POSTGRES_URL is set) and times the conflict checks used by the
+create path, the approve path and GET /bookings/{id}/conflicts against
+each registered conflict engine.
+
+    python -m benchmarks --sizes 10k,100k --out benchmarks/results/latest.json
+    python -m benchmarks --sizes 10k --baseline benchmarks/baseline.json --fail-on-regression
+
+See benchmarks/README.md for details.
+"""
+import os
+
+# app.core.config requires these at import time; the benchmark binds its own engines
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("SECRET_KEY", "benchmark-only-secret")
+os.environ.setdefault("ENABLE_AUTO_CLEANUP", "false")
@@ -0,0 +1,115 @@
+"""
+Command line entry point: python -m benchmarks --help
+"""
+import argparse
+import os
+import random
+import sys
+from typing import Dict, List, Any
+
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+
+from benchmarks import engines, results, scenarios
+from benchmarks import seed as seeding
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), ".data")
+
+
+def _databases(names: str) -> Dict[str, str]:
+    """Map requested database names to URLs, skipping ones that are not configured."""
+    urls = {}
+    for name in (part.strip() for part in names.split(",") if part.strip()):
+        if name == "sqlite":
+            os.makedirs(DATA_DIR, exist_ok=True)
+            urls[name] = "sqlite:///{path}"
+        elif name == "postgres":
+            url = os.environ.get("BENCH_POSTGRES_URL")
+            if not url:
+                print("Skipping postgres: BENCH_POSTGRES_URL is not set", file=sys.stderr)
+                continue
+            urls[name] = url
+        else:
+            raise SystemExit(f"Unknown database: {name} (use sqlite, postgres)")
+    return urls
+
+
+def _engine_for(name: str, url: str, size: int) -> Engine:
+    if name == "sqlite":
+        # One file per size so a reused data set matches the requested size
+        return create_engine(url.format(path=os.path.join(DATA_DIR, f"bookings-{size}.db")))
+    return create_engine(url)
+
+
+def run(args: argparse.Namespace) -> List[Dict[str, Any]]:
+    collected = []
+    for db_name, url in _databases(args.db).items():
+        for size in (seeding.parse_size(value) for value in args.sizes.split(",")):
+            engine = _engine_for(db_name, url, size)
+            try:
+                if args.reuse and seeding.seeded_size(engine) == size:
+                    print(f"[{db_name} {size}] reusing seeded data")
+                else:
+                    print(f"[{db_name} {size}] seeding...", flush=True)
+                    print(f"[{db_name} {size}] {seeding.seed(engine, size, random_seed=args.seed)}")
+
+                for conflict_engine in engines.select(args.engines, engine.dialect.name):
+                    for scenario_name in args.scenarios.split(","):
+                        scenario = scenarios.SCENARIOS[scenario_name]
+                        with conflict_engine.activate():
+                            summary = scenario(engine, args.queries, random.Random(args.seed))
+                        row = {
+                            "db": db_name,
+                            "size": size,
+                            "engine": conflict_engine.name,
+                            "scenario": scenario_name,
+                            "queries": args.queries,
+                            **summary,
+                        }
+                        print(
+                            f"  {conflict_engine.name:<9} {scenario_name:<19} "
+                            f"p50 {row['p50_ms']:.3f} ms  p99 {row['p99_ms']:.3f} ms  {row['qps']:.0f} q/s",
+                            flush=True
+                        )
+                        collected.append(row)
+            finally:
+                engine.dispose()
+    return collected
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__)
+    parser.add_argument("--sizes", default="10k,100k", help="Comma-separated booking counts, e.g. 10k,100k,1m")
+    parser.add_argument("--db", default="sqlite,postgres", help="sqlite and/or postgres (BENCH_POSTGRES_URL)")
+    parser.add_argument("--engines", default="all", help=f"Comma-separated, or all: {', '.join(engines.ENGINES)}")
+    parser.add_argument("--scenarios", default=",".join(scenarios.SCENARIOS), help="Comma-separated scenario names")
+    parser.add_argument("--queries", type=int, default=2000, help="Timed calls per scenario")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed for data and inputs")
+    parser.add_argument("--reuse", action="store_true", help="Keep previously seeded data of the same size")
+    parser.add_argument("--out", help="Write JSON results here")
+    parser.add_argument("--baseline", help="Compare against this JSON result file")
+    parser.add_argument("--tolerance", type=float, default=results.DEFAULT_TOLERANCE, help="Allowed p99 growth")
+    parser.add_argument("--fail-on-regression", action="store_true", help="Exit 1 when the baseline comparison regresses")
+    args = parser.parse_args()
+
+    unknown = [name for name in args.scenarios.split(",") if name not in scenarios.SCENARIOS]
+    if unknown:
+        raise SystemExit(f"Unknown scenario(s): {', '.join(unknown)}. Known: {', '.join(scenarios.SCENARIOS)}")
+
+    report = results.build_report(run(args))
+    if args.out:
+        os.makedirs(os.path.dirname(os.path.abspath(args.out)), exist_ok=True)
+        results.write(args.out, report)
+        print(f"Wrote {args.out}")
+
+    if args.baseline:
+        lines, regressions = results.compare(report, results.load(args.baseline), args.tolerance)
+        print("\n".join(lines))
+        if regressions:
+            print(f"{len(regressions)} regression(s): {'; '.join(regressions)}")
+            if args.fail_on_regression:
+                sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Conflict engines the scenarios can run against.
+
+An engine switches BookingService.get_conflicting_bookings onto one
+implementation for the duration of a run. Register alternatives with
+@register; `supports` limits an engine to the dialects it works on.
+"""
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, Tuple
+
+from app.core.config import settings
+from app.services.conflict_index import ConflictIndex
+
+
+class ConflictEngine:
+    """Base engine: the portable minute-column query on idx_booking_slot_approved."""
+
+    name = "sql"
+    description = "ID-only overlap query on the covering partial index"
+
+    def supports(self, dialect: str) -> bool:
+        return True
+
+    @contextmanager
+    def activate(self) -> Iterator[None]:
+        previous = (ConflictIndex.is_enabled(), settings.POSTGRES_SLOT_RANGE)
+        ConflictIndex.set_enabled(False)
+        settings.POSTGRES_SLOT_RANGE = False
+        try:
+            yield
+        finally:
+            ConflictIndex.set_enabled(previous[0])
+            settings.POSTGRES_SLOT_RANGE = previous[1]
+
+
+ENGINES: Dict[str, ConflictEngine] = {}
+
+
+def register(engine_class: Callable[[], ConflictEngine]) -> Callable[[], ConflictEngine]:
+    """Class decorator adding an engine to ENGINES under its name."""
+    engine = engine_class()
+    ENGINES[engine.name] = engine
+    return engine_class
+
+
+register(ConflictEngine)
+
+
+@register
+class IndexEngine(ConflictEngine):
+    name = "index"
+    description = "Process-local ConflictIndex (interval tree per room-day)"
+
+    @contextmanager
+    def activate(self) -> Iterator[None]:
+        with super().activate():
+            ConflictIndex.set_enabled(True)
+            yield
+
+
+@register
+class SlotRangeEngine(ConflictEngine):
+    name = "pg-range"
+    description = "PostgreSQL tsrange `slot && ...` on the exclusion constraint's GiST index"
+
+    def supports(self, dialect: str) -> bool:
+        return dialect == "postgresql"
+
+    @contextmanager
+    def activate(self) -> Iterator[None]:
+        with super().activate():
+            settings.POSTGRES_SLOT_RANGE = True
+            yield
+
+
+def select(names: str, dialect: str) -> Tuple[ConflictEngine, ...]:
+    """Resolve a comma-separated list ('all' for every engine) for a dialect."""
+    wanted = list(ENGINES) if names == "all" else [name.strip() for name in names.split(",") if name.strip()]
+    unknown = [name for name in wanted if name not in ENGINES]
+    if unknown:
+        raise SystemExit(f"Unknown engine(s): {', '.join(unknown)}. Known: {', '.join(ENGINES)}")
+    return tuple(ENGINES[name] for name in wanted if ENGINES[name].supports(dialect))
@@ -0,0 +1,134 @@
+"""
+GET /bookings page building: ORM hydration vs column projection.
+
+    python -m benchmarks.list_paths --size 10k --page 100 --pages 300 [--out list.json]
+
+- orm:        BookingService.get_all (Booking + joinedload User/Room) and
+              _to_booking_response per row, as the endpoint did before
+- projection: BookingService.get_all_rows (response columns only, user
+              and room names as joined scalars) straight into the response
+
+Both payloads are then validated and dumped to JSON-ready data through the
+same List[BookingResponse] adapter the response_model uses, each page on a
+fresh session. Reports page latency, the build step alone (query to
+response payload) and the peak Python memory traced while building. Data is seeded into benchmarks/.data like the conflict
+benchmarks.
+"""
+import argparse
+import os
+import random
+import time as clock
+import tracemalloc
+from typing import Callable, Dict, List, Any
+
+from pydantic import TypeAdapter
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import sessionmaker
+
+from app.api.v1.bookings import _to_booking_response
+from app.schemas.booking import BookingResponse
+from app.services.booking_service import BookingService
+from benchmarks import results, scenarios
+from benchmarks import seed as seeding
+from benchmarks.__main__ import DATA_DIR
+
+PAYLOAD = TypeAdapter(List[BookingResponse])
+
+
+def orm_page(db, skip: int, limit: int) -> List[BookingResponse]:
+    return [_to_booking_response(booking) for booking in BookingService.get_all(db, skip=skip, limit=limit)]
+
+
+def projection_page(db, skip: int, limit: int) -> List[Dict[str, Any]]:
+    return BookingService.get_all_rows(db, skip=skip, limit=limit)
+
+
+def serialize(payload: List[Any]) -> Any:
+    """What the response_model does with the returned payload."""
+    return PAYLOAD.dump_python(PAYLOAD.validate_python(payload), mode="json")
+
+
+PATHS: Dict[str, Callable[..., Any]] = {"orm": orm_page, "projection": projection_page}
+
+
+def measure(engine: Engine, path: Callable[..., Any], skips: List[int], limit: int) -> Dict[str, float]:
+    """
+    Page latency summary (build + serialize), mean build-only time and
+    mean peak traced KiB while building one page.
+    """
+    factory = sessionmaker(bind=engine)
+
+    for skip in skips[:scenarios.WARMUP_CALLS]:
+        with factory() as db:
+            serialize(path(db, skip, limit))
+
+    latencies, builds = [], []
+    for skip in skips:
+        with factory() as db:
+            started = clock.perf_counter()
+            payload = path(db, skip, limit)
+            built = clock.perf_counter()
+            serialize(payload)
+            latencies.append(clock.perf_counter() - started)
+            builds.append(built - started)
+
+    # Separate pass: tracing slows everything down and would skew latencies
+    peaks = []
+    tracemalloc.start()
+    for skip in skips[:50]:
+        with factory() as db:
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+            path(db, skip, limit)
+            peaks.append(tracemalloc.get_traced_memory()[1] - baseline)
+    tracemalloc.stop()
+
+    return {
+        **scenarios.summarize(latencies),
+        "build_ms": round(sum(builds) / len(builds) * 1000, 4),
+        "peak_kib": round(sum(peaks) / len(peaks) / 1024, 1),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.list_paths", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", default="10k", help="Seeded bookings, e.g. 10k")
+    parser.add_argument("--page", type=int, default=100, help="Rows per page")
+    parser.add_argument("--pages", type=int, default=300, help="Timed pages per path")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--out", help="Write JSON results here (same format as python -m benchmarks)")
+    args = parser.parse_args()
+
+    size = seeding.parse_size(args.size)
+    os.makedirs(DATA_DIR, exist_ok=True)
+    engine = create_engine(f"sqlite:///{os.path.join(DATA_DIR, f'bookings-{size}.db')}")
+    try:
+        if seeding.seeded_size(engine) != size:
+            print(f"Seeding {size} bookings...", flush=True)
+            seeding.seed(engine, size, random_seed=args.seed)
+
+        rng = random.Random(args.seed)
+        skips = [rng.randrange(0, max(1, min(size, 50 * args.page) - args.page)) for _ in range(args.pages)]
+        rows = []
+        for name, path in PATHS.items():
+            summary = measure(engine, path, skips, args.page)
+            print(f"{name:<11} p50 {summary['p50_ms']:.3f} ms  p99 {summary['p99_ms']:.3f} ms  "
+                  f"build {summary['build_ms']:.3f} ms  peak {summary['peak_kib']:.1f} KiB/page", flush=True)
+            rows.append({"db": "sqlite", "size": size, "engine": name, "scenario": f"list-page-{args.page}",
+                         "queries": args.pages, **summary})
+
+        orm, projection = rows
+        print(f"projection vs orm: {orm['mean_ms'] / projection['mean_ms']:.1f}x faster per page, "
+              f"{orm['build_ms'] / projection['build_ms']:.1f}x faster to build, "
+              f"{orm['peak_kib'] / projection['peak_kib']:.1f}x less peak memory while building")
+        if args.out:
+            results.write(args.out, results.build_report(rows))
+            print(f"Wrote {args.out}")
+    finally:
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
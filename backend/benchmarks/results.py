@@ -0,0 +1,95 @@
+"""
+JSON result files and baseline comparison.
+"""
+import json
+import platform
+import subprocess
+from datetime import datetime, timezone
+from typing import Dict, List, Tuple, Any
+
+import sqlalchemy
+
+# A run regresses when p99 grows by more than this fraction...
+DEFAULT_TOLERANCE = 0.25
+# ...and by more than this many milliseconds (sub-0.05 ms jitter is noise)
+MIN_REGRESSION_MS = 0.05
+
+Key = Tuple[str, int, str, str]
+
+
+def _key(result: Dict[str, Any]) -> Key:
+    return result["db"], result["size"], result["engine"], result["scenario"]
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def build_report(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Wrap results with enough metadata to tell runs apart."""
+    return {
+        "meta": {
+            "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "git_commit": _git_commit(),
+            "python": platform.python_version(),
+            "sqlalchemy": sqlalchemy.__version__,
+            "machine": f"{platform.system()} {platform.machine()}",
+        },
+        "results": results,
+    }
+
+
+def write(path: str, report: Dict[str, Any]) -> None:
+    with open(path, "w") as handle:
+        json.dump(report, handle, indent=2)
+        handle.write("\n")
+
+
+def load(path: str) -> Dict[str, Any]:
+    with open(path) as handle:
+        return json.load(handle)
+
+
+def compare(
+    current: Dict[str, Any],
+    baseline: Dict[str, Any],
+    tolerance: float = DEFAULT_TOLERANCE
+) -> Tuple[List[str], List[str]]:
+    """
+    Compare two reports on matching (db, size, engine, scenario) rows.
+
+    Returns:
+        tuple: (printable lines, regressed keys)
+    """
+    previous = {_key(result): result for result in baseline["results"]}
+    lines = [f"{'db':<10} {'size':>8} {'engine':<9} {'scenario':<19} {'p50 ms':>16} {'p99 ms':>16}"]
+    regressions = []
+    for result in current["results"]:
+        key = _key(result)
+        old = previous.get(key)
+        if old is None:
+            lines.append(f"{key[0]:<10} {key[1]:>8} {key[2]:<9} {key[3]:<19} {'(new)':>16}")
+            continue
+        regressed = (
+            result["p99_ms"] > old["p99_ms"] * (1 + tolerance)
+            and result["p99_ms"] - old["p99_ms"] > MIN_REGRESSION_MS
+        )
+        if regressed:
+            regressions.append(" ".join(map(str, key)))
+        lines.append(
+            f"{key[0]:<10} {key[1]:>8} {key[2]:<9} {key[3]:<19} "
+            f"{_change(old['p50_ms'], result['p50_ms']):>16} {_change(old['p99_ms'], result['p99_ms']):>16}"
+            + ("  REGRESSION" if regressed else "")
+        )
+    return lines, regressions
+
+
+def _change(old: float, new: float) -> str:
+    if not old:
+        return f"{new:.3f}"
+    return f"{new:.3f} ({(new - old) / old:+.0%})"
@@ -0,0 +1,137 @@
+"""
+Timed scenarios.
+
+Each scenario draws its inputs up front from a seeded RNG, runs a short
+warm-up, then times every call with perf_counter on a fresh session.
+"""
+import random
+import statistics
+import time as clock
+from datetime import timedelta
+from typing import Callable, Dict, List, Any
+
+from fastapi.testclient import TestClient
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.main import app
+from app.api.deps import get_db
+from app.models.booking import Booking, BookingStatusEnum
+from app.services.booking_service import BookingService
+from app.utils.intervals import from_minutes
+from benchmarks import seed as seeding
+
+WARMUP_CALLS = 50
+
+Call = Callable[[], Any]
+
+
+def summarize(latencies: List[float]) -> Dict[str, float]:
+    """p50/p99/mean in milliseconds and calls per second."""
+    ordered = sorted(latencies)
+    p99_index = max(0, min(len(ordered) - 1, round(len(ordered) * 0.99) - 1))
+    total = sum(ordered)
+    return {
+        "p50_ms": round(statistics.median(ordered) * 1000, 4),
+        "p99_ms": round(ordered[p99_index] * 1000, 4),
+        "mean_ms": round(total / len(ordered) * 1000, 4),
+        "qps": round(len(ordered) / total, 1) if total else 0.0,
+    }
+
+
+def _timed(calls: List[Call]) -> Dict[str, float]:
+    for call in calls[:WARMUP_CALLS]:
+        call()
+    latencies = []
+    for call in calls:
+        started = clock.perf_counter()
+        call()
+        latencies.append(clock.perf_counter() - started)
+    return summarize(latencies)
+
+
+def _pending_ids(db: Session, rng: random.Random, count: int) -> List[str]:
+    """Sample pending booking IDs (with replacement) from the first 50k."""
+    ids = [row.id for row in db.query(Booking.id).filter(Booking.status == BookingStatusEnum.PENDING).limit(50_000)]
+    return [rng.choice(ids) for _ in range(count)]
+
+
+def create_check(engine: Engine, queries: int, rng: random.Random) -> Dict[str, float]:
+    """The informational conflict check in POST /bookings, for random candidate slots."""
+    rooms, days = seeding.layout(seeding.seeded_size(engine))
+    db = sessionmaker(bind=engine)()
+    try:
+        calls = []
+        for _ in range(queries):
+            duration = rng.choice(seeding.DURATIONS)
+            start = rng.randrange(seeding.DAY_START, seeding.DAY_END - duration, 15)
+            args = (
+                f"bench-room-{rng.randrange(rooms)}",
+                seeding.FIRST_DAY + timedelta(days=rng.randrange(days)),
+                from_minutes(start),
+                from_minutes(start + duration),
+            )
+            calls.append(lambda args=args: BookingService.get_conflicting_bookings(db, *args))
+        return _timed(calls)
+    finally:
+        db.close()
+
+
+def approve_check(engine: Engine, queries: int, rng: random.Random) -> Dict[str, float]:
+    """The pre-approval conflict check for existing pending bookings."""
+    db = sessionmaker(bind=engine)()
+    try:
+        sample = _pending_ids(db, rng, queries)
+        rows = {
+            row.id: row for row in db.query(
+                Booking.id, Booking.room_id, Booking.date, Booking.start_time, Booking.end_time
+            ).filter(Booking.id.in_(set(sample)))
+        }
+        calls = [
+            (lambda row=row: BookingService.get_conflicting_bookings(
+                db, row.room_id, row.date, row.start_time, row.end_time, exclude_booking_id=row.id
+            ))
+            for row in (rows[booking_id] for booking_id in sample)
+        ]
+        return _timed(calls)
+    finally:
+        db.close()
+
+
+def conflicts_endpoint(engine: Engine, queries: int, rng: random.Random) -> Dict[str, float]:
+    """GET /api/v1/bookings/{id}/conflicts through the full HTTP stack."""
+    factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    def override_get_db():
+        db = factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    try:
+        client = TestClient(app)
+        token = client.post(
+            "/api/v1/auth/login",
+            json={"email": seeding.ADMIN_EMAIL, "password": seeding.ADMIN_PASSWORD}
+        ).json()["access_token"]
+        headers = {"Authorization": f"Bearer {token}"}
+
+        with factory() as db:
+            sample = _pending_ids(db, rng, queries)
+
+        def call(booking_id):
+            response = client.get(f"/api/v1/bookings/{booking_id}/conflicts", headers=headers)
+            response.raise_for_status()
+
+        return _timed([(lambda booking_id=booking_id: call(booking_id)) for booking_id in sample])
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+
+
+SCENARIOS: Dict[str, Callable[[Engine, int, random.Random], Dict[str, float]]] = {
+    "create-check": create_check,
+    "approve-check": approve_check,
+    "conflicts-endpoint": conflicts_endpoint,
+}
@@ -0,0 +1,163 @@
+"""
+Synthetic booking data with realistic per-room-day density.
+
+Each room-day gets a run of back-to-back APPROVED meetings inside business
+hours plus a few PENDING requests dropped at random times (so some of them
+conflict). Rows are written with Core executemany in batches, bypassing the
+ORM, so start_min/end_min are set explicitly.
+"""
+import math
+import random
+from datetime import date, timedelta
+from typing import Dict, List, Tuple
+
+from sqlalchemy import func, insert, inspect
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.variables.database import Base
+from app.models.user import User, RoleEnum
+from app.models.room import Room
+from app.models.booking import Booking, BookingStatusEnum, PriorityEnum
+from app.variables.security import get_password_hash
+from app.services.conflict_service import ConflictService
+from app.utils.intervals import from_minutes
+
+BOOKINGS_PER_ROOM_DAY = 8  # About 6 approved meetings and 2 pending requests
+PENDING_SHARE = 0.25
+BOOKINGS_PER_ROOM = 5000  # Rooms grow with the data set: 20 rooms at 10k, 200 at 1M
+MIN_ROOMS = 20
+USERS = 200
+FIRST_DAY = date(2025, 1, 6)
+DAY_START, DAY_END = 8 * 60, 20 * 60
+DURATIONS = (30, 45, 60, 90, 120)
+GAPS = (0, 0, 15, 30, 60)
+INSERT_BATCH_SIZE = 5000
+
+ADMIN_ID = "bench-admin"
+ADMIN_EMAIL = "bench.admin@cygnet.one"
+ADMIN_PASSWORD = "bench@admin"
+
+
+def parse_size(value: str) -> int:
+    """Parse 10k / 100k / 1m style sizes."""
+    value = value.strip().lower()
+    multiplier = {"k": 1_000, "m": 1_000_000}.get(value[-1], 1)
+    return int(float(value.rstrip("km")) * multiplier)
+
+
+def layout(size: int) -> Tuple[int, int]:
+    """Return (rooms, days) needed for `size` bookings at the target density."""
+    rooms = max(MIN_ROOMS, size // BOOKINGS_PER_ROOM)
+    days = math.ceil(size / (rooms * BOOKINGS_PER_ROOM_DAY))
+    return rooms, days
+
+
+def _room_day(rng: random.Random) -> List[Tuple[int, int, BookingStatusEnum]]:
+    """Intervals for one room-day: sequential approved meetings plus random pending ones."""
+    slots = []
+    approved = round(BOOKINGS_PER_ROOM_DAY * (1 - PENDING_SHARE))
+    cursor = DAY_START
+    for _ in range(approved):
+        start = cursor + rng.choice(GAPS)
+        end = start + rng.choice(DURATIONS)
+        if end > DAY_END:
+            break
+        slots.append((start, end, BookingStatusEnum.APPROVED))
+        cursor = end
+    while len(slots) < BOOKINGS_PER_ROOM_DAY:
+        duration = rng.choice(DURATIONS)
+        start = rng.randrange(DAY_START, DAY_END - duration, 15)
+        slots.append((start, start + duration, BookingStatusEnum.PENDING))
+    return slots
+
+
+def seed(engine: Engine, size: int, random_seed: int = 42) -> Dict[str, int]:
+    """
+    Drop and recreate the schema, then insert `size` bookings.
+
+    Conflict counters are rebuilt at the end so the /conflicts endpoint
+    reads the same side table it would in production.
+
+    Returns:
+        Dictionary with rooms, days and bookings written
+    """
+    rng = random.Random(random_seed)
+    rooms, days = layout(size)
+
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+    with engine.begin() as connection:
+        connection.execute(insert(User.__table__), [
+            {
+                "id": ADMIN_ID if index == 0 else f"bench-user-{index}",
+                "email": ADMIN_EMAIL if index == 0 else f"bench.user{index}@cygnet.one",
+                "name": f"Bench User {index}",
+                # Only the admin logs in; hashing once per user would dominate small runs
+                "password_hash": get_password_hash(ADMIN_PASSWORD) if index == 0 else "!",
+                "role": RoleEnum.ADMIN if index == 0 else RoleEnum.USER,
+                "is_active": True,
+            }
+            for index in range(USERS)
+        ])
+        connection.execute(insert(Room.__table__), [
+            {
+                "id": f"bench-room-{index}",
+                "name": f"Bench Room {index}",
+                "floor": f"{index % 10}th Floor",
+                "room_number": f"B-{index:04d}",
+                "capacity": rng.choice((4, 6, 8, 12, 20)),
+                "features": [],
+                "is_active": True,
+            }
+            for index in range(rooms)
+        ])
+
+        batch = []
+        written = 0
+        for day in range(days):
+            booking_date = FIRST_DAY + timedelta(days=day)
+            for room in range(rooms):
+                for start, end, status in _room_day(rng):
+                    if written >= size:
+                        break
+                    batch.append({
+                        "id": f"BK-B-{written:07d}",
+                        "user_id": f"bench-user-{rng.randrange(1, USERS)}",
+                        "room_id": f"bench-room-{room}",
+                        "date": booking_date,
+                        "start_time": from_minutes(start),
+                        "end_time": from_minutes(end),
+                        "start_min": start,
+                        "end_min": end,
+                        "title": "Benchmark meeting",
+                        "attendees": rng.randint(2, 12),
+                        "priority": rng.choice(list(PriorityEnum)),
+                        "status": status,
+                        "equipment": [],
+                        "conflict_count": 0,
+                    })
+                    written += 1
+                    if len(batch) >= INSERT_BATCH_SIZE:
+                        connection.execute(insert(Booking.__table__), batch)
+                        batch = []
+        if batch:
+            connection.execute(insert(Booking.__table__), batch)
+
+    with sessionmaker(bind=engine)() as db:
+        ConflictService.rebuild_conflict_counts(db)
+
+    return {"rooms": rooms, "days": days, "bookings": written}
+
+
+def seeded_size(engine: Engine) -> int:
+    """Number of bookings already present, or 0 if the schema is missing or outdated."""
+    try:
+        columns = {column["name"] for column in inspect(engine).get_columns(Booking.__tablename__)}
+        if columns != set(Booking.__table__.columns.keys()):
+            return 0
+        with Session(engine) as db:
+            return db.query(func.count(Booking.id)).scalar() or 0
+    except Exception:
+        return 0
@@ -0,0 +1,125 @@
+"""
+GET /bookings list serialization: response_model round trip vs the fast path.
+
+    python -m benchmarks.serialization --size 10k --rows 100,10000 [--out ser.json]
+
+- response_model: what FastAPI does with returned rows: validate them into
+                  List[BookingResponse] (re-running the schema validators),
+                  dump to JSON-ready data, then json.dumps in JSONResponse
+- fast:           rows_response, which writes the trusted rows straight to
+                  JSON bytes with orjson
+- pydantic-core:  the same fast path when orjson is not installed
+
+Rows come from BookingService.get_all_rows on a seeded SQLite database, so
+only serialization is timed. Every path's output is checked against the
+response_model bytes (as parsed JSON) before timing.
+"""
+import argparse
+import json
+import os
+import time as clock
+from typing import Any, Callable, Dict, List
+
+from pydantic import TypeAdapter
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.api.v1.bookings import BOOKING_RESPONSE_FIELDS
+from app.schemas.booking import BookingBase, BookingResponse
+from app.services.booking_service import BookingService
+from app.utils import serialization
+from benchmarks import results, scenarios
+from benchmarks import seed as seeding
+from benchmarks.__main__ import DATA_DIR
+
+PAYLOAD = TypeAdapter(List[BookingResponse])
+NORMALIZERS = {"equipment": BookingBase.normalize_equipment}
+
+
+def response_model(rows: List[Dict[str, Any]]) -> bytes:
+    content = PAYLOAD.dump_python(PAYLOAD.validate_python(rows), mode="json")
+    # Starlette's JSONResponse.render
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
+
+
+def fast(rows: List[Dict[str, Any]]) -> bytes:
+    return serialization.rows_response(rows, BOOKING_RESPONSE_FIELDS, NORMALIZERS).body
+
+
+def pydantic_core(rows: List[Dict[str, Any]]) -> bytes:
+    encoder, serialization.orjson = serialization.orjson, None
+    try:
+        return fast(rows)
+    finally:
+        serialization.orjson = encoder
+
+
+PATHS: Dict[str, Callable[[List[Dict[str, Any]]], bytes]] = {
+    "response_model": response_model,
+    "fast": fast,
+    "pydantic-core": pydantic_core,
+}
+
+
+def measure(path: Callable[[List[Dict[str, Any]]], bytes], rows: List[Dict[str, Any]], repeat: int) -> Dict[str, float]:
+    for _ in range(min(repeat, scenarios.WARMUP_CALLS)):
+        path(rows)
+    latencies = []
+    for _ in range(repeat):
+        started = clock.perf_counter()
+        path(rows)
+        latencies.append(clock.perf_counter() - started)
+    return scenarios.summarize(latencies)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.serialization", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", default="10k", help="Seeded bookings, e.g. 10k")
+    parser.add_argument("--rows", default="100,10000", help="Comma-separated list lengths")
+    parser.add_argument("--budget", type=int, default=200_000, help="Rows serialized per path and length")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--out", help="Write JSON results here (same format as python -m benchmarks)")
+    args = parser.parse_args()
+
+    size = seeding.parse_size(args.size)
+    lengths = [int(value) for value in args.rows.split(",")]
+    os.makedirs(DATA_DIR, exist_ok=True)
+    engine = create_engine(f"sqlite:///{os.path.join(DATA_DIR, f'bookings-{size}.db')}")
+    try:
+        if seeding.seeded_size(engine) != size:
+            print(f"Seeding {size} bookings...", flush=True)
+            seeding.seed(engine, size, random_seed=args.seed)
+        with sessionmaker(bind=engine)() as db:
+            all_rows = BookingService.get_all_rows(db, limit=max(lengths))
+    finally:
+        engine.dispose()
+
+    report = []
+    for length in lengths:
+        rows = all_rows[:length]
+        expected = json.loads(response_model(rows))
+        for name, path in PATHS.items():
+            if json.loads(path(rows)) != expected:
+                raise SystemExit(f"{name} output differs from response_model for {length} rows")
+
+        repeat = max(5, args.budget // max(1, len(rows)))
+        summaries = {}
+        for name, path in PATHS.items():
+            summaries[name] = measure(path, rows, repeat)
+            summary = summaries[name]
+            print(f"{len(rows):>6} rows  {name:<15} p50 {summary['p50_ms']:.3f} ms  "
+                  f"p99 {summary['p99_ms']:.3f} ms", flush=True)
+            report.append({"db": "sqlite", "size": size, "engine": name, "scenario": f"serialize-{len(rows)}",
+                           "queries": repeat, **summary})
+        baseline = summaries["response_model"]["p50_ms"]
+        print(f"{len(rows):>6} rows  fast vs response_model: {baseline / summaries['fast']['p50_ms']:.1f}x, "
+              f"pydantic-core: {baseline / summaries['pydantic-core']['p50_ms']:.1f}x", flush=True)
+
+    if args.out:
+        results.write(args.out, results.build_report(report))
+        print(f"Wrote {args.out}")
+
+
+if __name__ == "__main__":
+    main()
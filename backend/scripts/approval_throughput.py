@@ -0,0 +1,125 @@
+"""
+Measure locked-approval throughput with and without contention.
+
+Creates the schema on a scratch database, seeds pending bookings and
+approves them from a thread pool through ApprovalService.approve_locked:
+
+- contended:   every request targets the same room-day (one lock)
+- uncontended: every request targets its own room (independent locks)
+
+Usage:
+    python -m scripts.approval_throughput [--url postgresql://...] [--requests 400] [--workers 16]
+
+The database at --url is dropped and recreated. Defaults to a temporary SQLite file.
+"""
+import argparse
+import os
+import statistics
+import tempfile
+import time as clock
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, time
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.variables.database import Base
+from app.models.user import User, RoleEnum
+from app.models.room import Room
+from app.models.booking import Booking, BookingStatusEnum
+from app.services.approval_service import ApprovalService
+
+BOOKING_DATE = date(2030, 1, 7)
+
+
+def seed(factory, requests: int, contended: bool) -> list:
+    """Insert pending bookings and return their IDs."""
+    with factory() as db:
+        db.add(User(id="bench-user", email="bench@cygnet.one", name="Bench User",
+                    password_hash="x", role=RoleEnum.USER, is_active=True))
+        rooms = 1 if contended else requests
+        for index in range(rooms):
+            db.add(Room(id=f"bench-room-{index}", name=f"Bench Room {index}", floor="1st Floor",
+                        room_number=f"B-{index}", capacity=10, features=[], is_active=True))
+        ids = []
+        for index in range(requests):
+            booking_id = f"BK-BENCH-{index:06d}"
+            start = time(8 + index % 10, (index * 7) % 60)
+            db.add(Booking(
+                id=booking_id,
+                user_id="bench-user",
+                room_id="bench-room-0" if contended else f"bench-room-{index}",
+                date=BOOKING_DATE,
+                start_time=start,
+                end_time=time(start.hour + 1, start.minute),
+                title=f"Bench {index}",
+                attendees=2,
+                priority="Medium",
+                status=BookingStatusEnum.PENDING
+            ))
+            ids.append(booking_id)
+        db.commit()
+    return ids
+
+
+def run(engine, requests: int, workers: int, contended: bool) -> dict:
+    """Approve every seeded request in parallel and time it."""
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    ids = seed(factory, requests, contended)
+
+    def approve(booking_id):
+        started = clock.perf_counter()
+        with factory() as db:
+            booking, _, _ = ApprovalService.approve_locked(db, booking_id, cancel_conflicts=True)
+        return booking is not None, clock.perf_counter() - started
+
+    started = clock.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(approve, ids))
+    elapsed = clock.perf_counter() - started
+
+    latencies = sorted(latency for _, latency in results)
+    return {
+        "scenario": "contended" if contended else "uncontended",
+        "requests": requests,
+        "approved": sum(ok for ok, _ in results),
+        "seconds": round(elapsed, 3),
+        "per_second": round(requests / elapsed, 1),
+        "p50_ms": round(statistics.median(latencies) * 1000, 2),
+        "p95_ms": round(latencies[int(len(latencies) * 0.95) - 1] * 1000, 2),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", help="Scratch database URL (dropped and recreated)")
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--workers", type=int, default=16)
+    args = parser.parse_args()
+
+    scratch = None
+    url = args.url
+    if not url:
+        scratch = tempfile.NamedTemporaryFile(suffix=".db", delete=False)
+        scratch.close()
+        url = f"sqlite:///{scratch.name}"
+
+    engine = create_engine(
+        url,
+        pool_size=args.workers,
+        connect_args={"check_same_thread": False, "timeout": 60} if url.startswith("sqlite") else {}
+    )
+    try:
+        for contended in (False, True):
+            print(run(engine, args.requests, args.workers, contended))
+    finally:
+        Base.metadata.drop_all(bind=engine)
+        engine.dispose()
+        if scratch:
+            os.unlink(scratch.name)
+
+
+if __name__ == "__main__":
+    main()
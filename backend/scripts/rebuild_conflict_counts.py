@@ -0,0 +1,36 @@
+"""
+Rebuild or verify the maintained booking conflict counters.
+
+Usage:
+    python -m scripts.rebuild_conflict_counts            # rebuild everything
+    python -m scripts.rebuild_conflict_counts --verify   # report drift only
+    python -m scripts.rebuild_conflict_counts --verify --repair
+"""
+import argparse
+
+from app.variables.database import SessionLocal
+from app.services.conflict_service import ConflictService
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Rebuild or verify booking conflict counters")
+    parser.add_argument("--verify", action="store_true", help="Only compare stored counters with a recomputation")
+    parser.add_argument("--repair", action="store_true", help="With --verify, rebuild drifted room-days")
+    args = parser.parse_args()
+
+    with SessionLocal() as db:
+        if args.verify:
+            result = ConflictService.verify_conflict_counts(db, repair=args.repair)
+            print(
+                f"Checked {result['checked']} bookings on {result['room_days']} room-days: "
+                f"{result['drift_count']} drifted, {result['repaired']} room-days repaired"
+            )
+            for booking_id in result["drifted"]:
+                print(f"  drift: {booking_id}")
+        else:
+            result = ConflictService.rebuild_conflict_counts(db)
+            print(f"Rebuilt {result['room_days']} room-days, {result['updated']} bookings updated")
+
+
+if __name__ == "__main__":
+    main()
@@ -13,6 +13,9 @@ from app.models.user import User, RoleEnum
 from app.models.room import Room
 from app.models.booking import Booking
 from app.variables.security import get_password_hash
+from app.services.hold_service import HoldService
+from app.services.booking_service import BookingService
+from app.services.schedule_cache import ScheduleCache
 
 
 # Test database setup - using in-memory SQLite
@@ -53,6 +56,27 @@ def client(db):
     app.dependency_overrides.clear()
 
 
+@pytest.fixture(autouse=True)
+def clear_holds():
+    """Drop process-local slot holds between tests."""
+    yield
+    HoldService.clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_count_cache():
+    """Drop cached booking totals between tests."""
+    yield
+    BookingService.clear_count_cache()
+
+
+@pytest.fixture(autouse=True)
+def clear_schedule_cache():
+    """Drop cached schedule pages between tests (versions restart at 0)."""
+    yield
+    ScheduleCache.clear()
+
+
 @pytest.fixture
 def test_user(db):
     """Create a test regular user."""
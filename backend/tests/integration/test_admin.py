@@ -0,0 +1,135 @@
+"""
+Admin module endpoint tests.
+Tests for /api/v1/admin endpoints.
+"""
+import pytest
+from fastapi import status
+from datetime import date, time
+
+from app.models.booking import Booking, BookingStatusEnum
+
+
+def _add_booking(db, user, room, booking_id, start, end, status=BookingStatusEnum.PENDING, priority="Medium"):
+    """Insert a booking on 2026-02-10."""
+    booking = Booking(
+        id=booking_id,
+        user_id=user.id,
+        room_id=room.id,
+        date=date(2026, 2, 10),
+        start_time=start,
+        end_time=end,
+        title=f"Meeting {booking_id}",
+        attendees=4,
+        priority=priority,
+        status=status
+    )
+    db.add(booking)
+    db.commit()
+    return booking
+
+
+class TestAdminConflictGraph:
+    """Test cases for GET /api/v1/admin/conflicts/graph endpoint."""
+
+    def test_conflict_graph(self, client, admin_headers, db, test_user, test_room, test_booking):
+        """Test pending requests are linked to overlapping approved and pending bookings."""
+        _add_booking(db, test_user, test_room, "BK-2026-3001", time(9, 30), time(10, 30))
+        _add_booking(db, test_user, test_room, "BK-2026-3002", time(10, 15), time(11, 0))
+        _add_booking(db, test_user, test_room, "BK-2026-3003", time(15, 0), time(16, 0))
+
+        response = client.get(
+            "/api/v1/admin/conflicts/graph?date_from=2026-02-10&date_to=2026-02-10",
+            headers=admin_headers
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["adjacency"] == {
+            test_booking.id: ["BK-2026-3001"],
+            "BK-2026-3001": [test_booking.id, "BK-2026-3002"],
+            "BK-2026-3002": ["BK-2026-3001"],
+            "BK-2026-3003": []
+        }
+        names = {node["id"]: (node["user_name"], node["room_name"]) for node in data["nodes"]}
+        assert names["BK-2026-3003"] == ("John Doe", "Conference Room A")
+
+    def test_conflict_graph_requires_admin(self, client, auth_headers):
+        """Test regular users cannot read the conflict graph."""
+        response = client.get(
+            "/api/v1/admin/conflicts/graph?date_from=2026-02-10&date_to=2026-02-10",
+            headers=auth_headers
+        )
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+class TestAdminBulkApproval:
+    """Test cases for /api/v1/admin/approvals endpoints."""
+
+    def test_plan_prefers_high_priority(self, client, admin_headers, db, test_user, test_room, test_booking):
+        """Test the plan keeps the heaviest non-overlapping set."""
+        _add_booking(db, test_user, test_room, "BK-2026-4001", time(9, 30), time(10, 30))  # Hits approved
+        _add_booking(db, test_user, test_room, "BK-2026-4002", time(11, 0), time(13, 0), priority="Low")
+        _add_booking(db, test_user, test_room, "BK-2026-4003", time(11, 30), time(12, 0), priority="High")
+        _add_booking(db, test_user, test_room, "BK-2026-4004", time(12, 0), time(12, 30), priority="Medium")
+
+        response = client.post(
+            "/api/v1/admin/approvals/plan?date_from=2026-02-10&date_to=2026-02-10",
+            headers=admin_headers
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["approve"] == ["BK-2026-4003", "BK-2026-4004"]
+        assert data["reject"] == ["BK-2026-4001", "BK-2026-4002"]
+        assert db.get(Booking, "BK-2026-4003").status == BookingStatusEnum.PENDING
+
+    def test_apply_plan(self, client, admin_headers, db, test_user, test_room):
+        """Test a plan is applied with bulk updates."""
+        _add_booking(db, test_user, test_room, "BK-2026-4101", time(11, 0), time(12, 0))
+        _add_booking(db, test_user, test_room, "BK-2026-4102", time(11, 30), time(12, 30))
+
+        response = client.post(
+            "/api/v1/admin/approvals/apply",
+            headers=admin_headers,
+            json={"approve": ["BK-2026-4101"], "reject": ["BK-2026-4102"]}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {"approved": 1, "rejected": 1}
+        db.expire_all()
+        assert db.get(Booking, "BK-2026-4101").status == BookingStatusEnum.APPROVED
+        assert db.get(Booking, "BK-2026-4102").status == BookingStatusEnum.REJECTED
+
+    def test_apply_rejects_overlapping_approvals(self, client, admin_headers, db, test_user, test_room, test_booking):
+        """Test a stale plan that would double-book is refused."""
+        _add_booking(db, test_user, test_room, "BK-2026-4201", time(9, 30), time(10, 30))
+
+        response = client.post(
+            "/api/v1/admin/approvals/apply",
+            headers=admin_headers,
+            json={"approve": ["BK-2026-4201"], "reject": []}
+        )
+
+        assert response.status_code == status.HTTP_409_CONFLICT
+        db.expire_all()
+        assert db.get(Booking, "BK-2026-4201").status == BookingStatusEnum.PENDING
+
+
+class TestAdminConflictCounts:
+    """Test cases for /api/v1/admin/conflict-counts endpoints."""
+
+    def test_rebuild_then_verify(self, client, admin_headers, db, test_user, test_room, test_booking):
+        """Test rows inserted outside the services are counted by a rebuild."""
+        _add_booking(db, test_user, test_room, "BK-2026-6001", time(9, 30), time(10, 30))
+
+        drift = client.post("/api/v1/admin/conflict-counts/verify", headers=admin_headers).json()
+        assert drift["drifted"] == ["BK-2026-6001"]
+
+        response = client.post("/api/v1/admin/conflict-counts/rebuild", headers=admin_headers)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {"room_days": 1, "updated": 1}
+
+        assert client.post("/api/v1/admin/conflict-counts/verify", headers=admin_headers).json()["drift_count"] == 0
+        contested = client.get("/api/v1/bookings?contested=true", headers=admin_headers).json()
+        assert [(b["id"], b["conflict_count"]) for b in contested] == [("BK-2026-6001", 1)]
@@ -0,0 +1,178 @@
+"""
+Concurrency tests for the locked approval path.
+Fires parallel approvals at overlapping requests and checks no slot is double-approved.
+
+Uses a file-backed SQLite database so each worker thread gets its own
+connection (the shared in-memory test engine serializes everything).
+"""
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import date, time
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.main import app
+from app.variables.database import Base, get_db
+from app.variables.security import create_access_token
+from app.models.user import User, RoleEnum
+from app.models.room import Room
+from app.models.booking import Booking, BookingStatusEnum
+from app.services.approval_service import ApprovalService
+
+WORKERS = 8
+REQUESTS = 24
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    """Sessions on a scratch SQLite file seeded with one user and room."""
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'approvals.db'}",
+        connect_args={"check_same_thread": False, "timeout": 30}
+    )
+    Base.metadata.create_all(bind=engine)
+    factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    with factory() as db:
+        db.add(User(id="user-1", email="load@cygnet.one", name="Load User",
+                    password_hash="x", role=RoleEnum.USER, is_active=True))
+        db.add(User(id="admin-1", email="admin@cygnet.one", name="Load Admin",
+                    password_hash="x", role=RoleEnum.ADMIN, is_active=True))
+        db.add(Room(id="room-1", name="Room 1", floor="1st Floor", room_number="R-1",
+                    capacity=10, features=[], is_active=True))
+        db.commit()
+    yield factory
+    engine.dispose()
+
+
+def _seed_pending(factory, start_times):
+    """Insert pending one-hour bookings on 2026-03-02 and return their IDs."""
+    ids = []
+    with factory() as db:
+        for index, start in enumerate(start_times):
+            booking_id = f"BK-2026-{index:04d}"
+            db.add(Booking(
+                id=booking_id,
+                user_id="user-1",
+                room_id="room-1",
+                date=date(2026, 3, 2),
+                start_time=start,
+                end_time=time(start.hour + 1, start.minute),
+                title=f"Request {index}",
+                attendees=2,
+                priority="Medium",
+                status=BookingStatusEnum.PENDING
+            ))
+            ids.append(booking_id)
+        db.commit()
+    return ids
+
+
+def _approve_all(factory, booking_ids, cancel_conflicts):
+    def approve(booking_id):
+        with factory() as db:
+            booking, _, _ = ApprovalService.approve_locked(db, booking_id, cancel_conflicts)
+            return booking is not None
+
+    with ThreadPoolExecutor(max_workers=WORKERS) as pool:
+        return list(pool.map(approve, booking_ids))
+
+
+@pytest.fixture
+def admin_client(session_factory):
+    """Test client whose requests each get their own session on the scratch database."""
+    def override_get_db():
+        with session_factory() as db:
+            yield db
+
+    app.dependency_overrides[get_db] = override_get_db
+    token = create_access_token({"sub": "admin-1", "email": "admin@cygnet.one", "role": RoleEnum.ADMIN.value})
+    with TestClient(app) as client:
+        client.headers["Authorization"] = f"Bearer {token}"
+        yield client
+    app.dependency_overrides.clear()
+
+
+def _approved_intervals(factory):
+    with factory() as db:
+        return sorted(
+            (row.start_min, row.end_min)
+            for row in db.query(Booking.start_min, Booking.end_min).filter(
+                Booking.status == BookingStatusEnum.APPROVED
+            )
+        )
+
+
+class TestConcurrentApprovals:
+    """Stress the (room, date) lock with overlapping parallel approvals."""
+
+    def test_identical_slot_approved_once(self, session_factory):
+        """Test only one of many requests for the same slot is approved."""
+        ids = _seed_pending(session_factory, [time(10, 0)] * REQUESTS)
+
+        results = _approve_all(session_factory, ids, cancel_conflicts=False)
+
+        assert sum(results) == 1
+        assert len(_approved_intervals(session_factory)) == 1
+
+    def test_staggered_slots_never_overlap(self, session_factory):
+        """Test approvals with overrides leave no overlapping approved pair."""
+        starts = [time(8 + index % 6, (index * 20) % 60) for index in range(REQUESTS)]
+        ids = _seed_pending(session_factory, starts)
+
+        _approve_all(session_factory, ids, cancel_conflicts=True)
+
+        approved = _approved_intervals(session_factory)
+        assert approved
+        for (_, previous_end), (next_start, _) in zip(approved, approved[1:]):
+            assert previous_end <= next_start
+
+    def test_disjoint_slots_all_approved(self, session_factory):
+        """Test non-overlapping requests do not block each other."""
+        ids = _seed_pending(session_factory, [time(hour, 0) for hour in range(8, 18)])
+
+        results = _approve_all(session_factory, ids, cancel_conflicts=False)
+
+        assert all(results)
+        assert len(_approved_intervals(session_factory)) == len(ids)
+
+    def test_parallel_status_patches_approve_once(self, session_factory, admin_client):
+        """Test PATCH /status approvals of one slot cannot both succeed."""
+        ids = _seed_pending(session_factory, [time(10, 0)] * REQUESTS)
+
+        def approve(booking_id):
+            return admin_client.patch(f"/api/v1/bookings/{booking_id}/status", json={"status": "Approved"}).status_code
+
+        with ThreadPoolExecutor(max_workers=WORKERS) as pool:
+            codes = list(pool.map(approve, ids))
+
+        assert codes.count(200) == 1
+        assert codes.count(409) == REQUESTS - 1
+        assert len(_approved_intervals(session_factory)) == 1
+
+    def test_booking_moved_before_lock_is_not_approved(self, session_factory, monkeypatch):
+        """Test a booking moved while the approval waits for its lock stays pending."""
+        blocker, moved = _seed_pending(session_factory, [time(9, 0), time(14, 0)])
+        with session_factory() as db:
+            db.query(Booking).filter(Booking.id == blocker).update({Booking.status: BookingStatusEnum.APPROVED})
+            db.commit()
+
+        room_day_lock = ApprovalService.room_day_lock
+
+        @contextmanager
+        def move_then_lock(db, room_id, booking_date):
+            # A concurrent PUT lands on the blocker's slot between the read and the lock
+            with session_factory() as other:
+                booking = other.get(Booking, moved)
+                booking.start_time, booking.end_time = time(9, 0), time(10, 0)
+                other.commit()
+            with room_day_lock(db, room_id, booking_date):
+                yield
+
+        monkeypatch.setattr(ApprovalService, "room_day_lock", move_then_lock)
+        with session_factory() as db:
+            booking, conflicts, _ = ApprovalService.approve_locked(db, moved)
+
+        assert booking is None and conflicts == []
+        assert _approved_intervals(session_factory) == [(540, 600)]
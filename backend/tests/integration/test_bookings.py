@@ -117,6 +117,14 @@ class TestBookingsRead:
         data = response.json()
         assert isinstance(data, list)
     
+    def test_list_item_matches_single_booking(self, client, admin_headers, test_booking):
+        """Test the projected list rows carry the same fields as GET /bookings/{id}."""
+        listed = client.get("/api/v1/bookings", headers=admin_headers).json()
+        single = client.get(f"/api/v1/bookings/{test_booking.id}", headers=admin_headers).json()
+        
+        assert listed == [single]
+        assert (single["user_name"], single["room_name"]) == ("John Doe", "Conference Room A")
+    
     def test_filter_bookings_by_status(self, client, admin_headers, test_booking):
         """Test filtering bookings by status."""
         response = client.get(
@@ -360,3 +368,512 @@ class TestBookingConflictDetection:
         )
         
         assert response.status_code == status.HTTP_201_CREATED
+
+
+class TestBookingsApprove:
+    """Test cases for POST /api/v1/bookings/{booking_id}/approve endpoint."""
+    
+    def _add_pending(self, db, test_user, test_room):
+        from datetime import date, time
+        from app.models.booking import Booking
+        
+        booking = Booking(
+            id="BK-2026-5001",
+            user_id=test_user.id,
+            room_id=test_room.id,
+            date=date(2026, 2, 10),
+            start_time=time(9, 30),
+            end_time=time(10, 30),
+            title="Overlapping Request",
+            attendees=4,
+            priority="High",
+            status="Pending"
+        )
+        db.add(booking)
+        db.commit()
+        return booking
+    
+    def test_approve_conflict_returns_409(self, client, admin_headers, db, test_user, test_room, test_booking):
+        """Test approving over an approved booking is refused without override."""
+        self._add_pending(db, test_user, test_room)
+        
+        response = client.post("/api/v1/bookings/BK-2026-5001/approve", headers=admin_headers)
+        
+        assert response.status_code == status.HTTP_409_CONFLICT
+        assert test_booking.id in response.json()["detail"]
+    
+    def test_approve_cancels_conflicts(self, client, admin_headers, db, test_user, test_room, test_booking):
+        """Test cancel_conflicts revokes the overlapping approved booking."""
+        from app.models.booking import Booking
+        
+        self._add_pending(db, test_user, test_room)
+        
+        response = client.post(
+            "/api/v1/bookings/BK-2026-5001/approve?cancel_conflicts=true",
+            headers=admin_headers
+        )
+        
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["status"] == "Approved"
+        db.expire_all()
+        revoked = db.get(Booking, test_booking.id)
+        assert revoked.status.value == "Cancelled"
+        assert revoked.notes == "Revoked by Admin for Priority Override by John Doe"
+
+
+class TestBookingsBatchConflicts:
+    """Test cases for POST /api/v1/bookings/conflicts:batch endpoint."""
+    
+    def test_batch_conflicts(self, client, auth_headers, test_booking):
+        """Test each candidate gets its own conflict IDs."""
+        response = client.post(
+            "/api/v1/bookings/conflicts:batch",
+            headers=auth_headers,
+            json={
+                "candidates": [
+                    {"room_id": test_booking.room_id, "date": "2026-02-10", "start_time": "09:30", "end_time": "10:30"},
+                    {"room_id": test_booking.room_id, "date": "2026-02-10", "start_time": "10:00", "end_time": "11:00"},
+                    {"room_id": test_booking.room_id, "date": "2026-02-11", "start_time": "09:00", "end_time": "10:00"},
+                    {"room_id": "other-room", "date": "2026-02-10", "start_time": "09:00", "end_time": "10:00"}
+                ]
+            }
+        )
+        
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["room_days"] == 3
+        assert [result["conflict_ids"] for result in data["results"]] == [[test_booking.id], [], [], []]
+    
+    def test_batch_conflicts_rejects_empty(self, client, auth_headers):
+        """Test an empty candidate list is rejected."""
+        response = client.post(
+            "/api/v1/bookings/conflicts:batch",
+            headers=auth_headers,
+            json={"candidates": []}
+        )
+        
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+class TestBookingsHolds:
+    """Test cases for /api/v1/bookings/holds endpoints."""
+    
+    HOLD = {"date": "2026-02-10", "start_time": "14:00", "end_time": "15:00"}
+    
+    def _booking(self, room_id, start_time="14:30", end_time="15:30"):
+        return {
+            "room_id": room_id,
+            "date": "2026-02-10",
+            "start_time": start_time,
+            "end_time": end_time,
+            "title": "Planning",
+            "attendees": 3
+        }
+    
+    def test_hold_blocks_other_users(self, client, auth_headers, admin_headers, test_room):
+        """Test another user's overlapping booking request is refused while held."""
+        response = client.post(
+            "/api/v1/bookings/holds",
+            headers=admin_headers,
+            json={"room_id": test_room.id, "seconds": 60, **self.HOLD}
+        )
+        assert response.status_code == status.HTTP_201_CREATED
+        
+        blocked = client.post("/api/v1/bookings", headers=auth_headers, json=self._booking(test_room.id))
+        assert blocked.status_code == status.HTTP_409_CONFLICT
+        
+        held_again = client.post(
+            "/api/v1/bookings/holds",
+            headers=auth_headers,
+            json={"room_id": test_room.id, **self.HOLD}
+        )
+        assert held_again.status_code == status.HTTP_409_CONFLICT
+    
+    def test_hold_owner_can_book_and_hold_is_consumed(self, client, auth_headers, admin_headers, test_room):
+        """Test the holder books through their own hold, which is then released."""
+        hold = client.post(
+            "/api/v1/bookings/holds",
+            headers=admin_headers,
+            json={"room_id": test_room.id, **self.HOLD}
+        ).json()
+        
+        response = client.post("/api/v1/bookings", headers=admin_headers, json=self._booking(test_room.id))
+        assert response.status_code == status.HTTP_201_CREATED
+        
+        release = client.delete(f"/api/v1/bookings/holds/{hold['id']}", headers=admin_headers)
+        assert release.status_code == status.HTTP_404_NOT_FOUND
+    
+    def test_release_hold(self, client, auth_headers, admin_headers, test_room):
+        """Test releasing a hold frees the slot; only the owner can release it."""
+        hold = client.post(
+            "/api/v1/bookings/holds",
+            headers=admin_headers,
+            json={"room_id": test_room.id, **self.HOLD}
+        ).json()
+        
+        assert client.delete(f"/api/v1/bookings/holds/{hold['id']}", headers=auth_headers).status_code == \
+            status.HTTP_404_NOT_FOUND
+        assert client.delete(f"/api/v1/bookings/holds/{hold['id']}", headers=admin_headers).status_code == \
+            status.HTTP_204_NO_CONTENT
+        
+        response = client.post("/api/v1/bookings", headers=auth_headers, json=self._booking(test_room.id))
+        assert response.status_code == status.HTTP_201_CREATED
+    
+    def test_hold_rejects_booked_slot(self, client, auth_headers, test_booking):
+        """Test a slot overlapping an approved booking cannot be held."""
+        response = client.post(
+            "/api/v1/bookings/holds",
+            headers=auth_headers,
+            json={"room_id": test_booking.room_id, "date": "2026-02-10", "start_time": "09:30", "end_time": "10:30"}
+        )
+        
+        assert response.status_code == status.HTTP_409_CONFLICT
+    
+    def test_availability_hides_others_holds(self, client, auth_headers, admin_headers, test_room):
+        """Test held slots show as busy to other users but not to the holder."""
+        client.post("/api/v1/bookings/holds", headers=admin_headers, json={"room_id": test_room.id, **self.HOLD})
+        url = f"/api/v1/rooms/{test_room.id}/availability?from=2026-02-10"
+        
+        assert client.get(url, headers=auth_headers).json()["days"][0]["free"] == [["08:00", "14:00"], ["15:00", "20:00"]]
+        assert client.get(url, headers=admin_headers).json()["days"][0]["free"] == [["08:00", "20:00"]]
+
+
+class TestBookingsSeries:
+    """Test cases for /api/v1/bookings/series endpoints."""
+    
+    SERIES = {
+        "date": "2030-03-04",
+        "start_time": "09:00:00",
+        "end_time": "09:15:00",
+        "title": "Standup",
+        "attendees": 4
+    }
+    
+    def _approve_slot(self, db, user, room, booking_date):
+        from app.models.booking import Booking, BookingStatusEnum
+        db.add(Booking(
+            id="BK-2030-0001",
+            user_id=user.id,
+            room_id=room.id,
+            date=booking_date,
+            start_time=time(9, 0),
+            end_time=time(10, 0),
+            title="Board",
+            attendees=4,
+            priority="High",
+            status=BookingStatusEnum.APPROVED
+        ))
+        db.commit()
+    
+    def test_weekly_series(self, client, auth_headers, test_room):
+        """Test a weekly series creates one pending booking per occurrence."""
+        response = client.post(
+            "/api/v1/bookings/series",
+            headers=auth_headers,
+            json={**self.SERIES, "room_id": test_room.id,
+                  "recurrence": {"frequency": "Weekly", "by_weekday": [0, 3], "count": 5}}
+        )
+        
+        assert response.status_code == status.HTTP_201_CREATED
+        data = response.json()
+        assert [booking["date"] for booking in data["bookings"]] == [
+            "2030-03-04", "2030-03-07", "2030-03-11", "2030-03-14", "2030-03-18"
+        ]
+        assert {booking["series_id"] for booking in data["bookings"]} == {data["series_id"]}
+        assert len({booking["id"] for booking in data["bookings"]}) == 5
+        assert all(booking["status"] == "Pending" for booking in data["bookings"])
+    
+    def test_conflicting_occurrence_noted_or_skipped(self, client, auth_headers, db, test_admin, test_room):
+        """Test approved bookings make occurrences override requests, or skip them."""
+        self._approve_slot(db, test_admin, test_room, date(2030, 3, 11))
+        body = {**self.SERIES, "room_id": test_room.id,
+                "recurrence": {"frequency": "Weekly", "until": "2030-03-18"}}
+        
+        noted = client.post("/api/v1/bookings/series", headers=auth_headers, json=body).json()
+        skipped = client.post("/api/v1/bookings/series", headers=auth_headers,
+                              json={**body, "skip_conflicts": True}).json()
+        
+        conflicted = [b for b in noted["bookings"] if b["date"] == "2030-03-11"]
+        assert conflicted[0]["notes"] == "Override request - Conflicts with: Admin User (High)"
+        assert conflicted[0]["conflict_count"] == 1
+        assert [b["date"] for b in skipped["bookings"]] == ["2030-03-04", "2030-03-18"]
+        assert skipped["skipped"] == ["2030-03-11"]
+    
+    def test_invalid_recurrence(self, client, auth_headers, test_room):
+        """Test rules need exactly one end and stay under the occurrence limit."""
+        both = client.post("/api/v1/bookings/series", headers=auth_headers, json={
+            **self.SERIES, "room_id": test_room.id,
+            "recurrence": {"frequency": "Daily", "count": 3, "until": "2030-03-10"}
+        })
+        too_long = client.post("/api/v1/bookings/series", headers=auth_headers, json={
+            **self.SERIES, "room_id": test_room.id,
+            "recurrence": {"frequency": "Daily", "until": "2031-03-04"}
+        })
+        
+        assert both.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        assert too_long.status_code == status.HTTP_400_BAD_REQUEST
+    
+    def test_cancel_series(self, client, auth_headers, admin_headers, test_room):
+        """Test the rest of a series is cancelled from a date onwards."""
+        series = client.post(
+            "/api/v1/bookings/series",
+            headers=auth_headers,
+            json={**self.SERIES, "room_id": test_room.id, "recurrence": {"frequency": "Daily", "count": 4}}
+        ).json()
+        
+        response = client.patch(
+            f"/api/v1/bookings/series/{series['series_id']}/cancel?from_date=2030-03-06",
+            headers=auth_headers
+        )
+        
+        assert response.json() == {"series_id": series["series_id"], "cancelled": 2}
+        remaining = client.get(f"/api/v1/bookings?series_id={series['series_id']}&status=Pending", headers=admin_headers)
+        assert sorted(b["date"] for b in remaining.json()) == ["2030-03-04", "2030-03-05"]
+
+
+class TestBookingsCursorPagination:
+    """Test cases for keyset pagination of GET /api/v1/bookings."""
+    
+    def _add_bookings(self, db, user, room, count, day=1):
+        from app.models.booking import Booking
+        for index in range(count):
+            db.add(Booking(
+                id=f"BK-2030-{day:02d}{index:02d}",
+                user_id=user.id,
+                room_id=room.id,
+                date=date(2030, 1, day + index // 3),
+                start_time=time(9 + index % 3, 0),
+                end_time=time(10 + index % 3, 0),
+                title=f"Meeting {index}",
+                attendees=2,
+                priority="Medium",
+                status="Pending"
+            ))
+        db.commit()
+    
+    def _walk(self, client, headers, url):
+        ids, cursor = [], None
+        while True:
+            response = client.get(url + (f"&cursor={cursor}" if cursor else ""), headers=headers)
+            ids.extend(booking["id"] for booking in response.json())
+            cursor = response.headers.get("X-Next-Cursor")
+            if not cursor:
+                return ids
+    
+    def test_cursor_pages_match_offset_order(self, client, admin_headers, db, test_user, test_room):
+        """Test walking cursors visits every booking once, newest first."""
+        self._add_bookings(db, test_user, test_room, 7)
+        
+        everything = client.get("/api/v1/bookings?limit=100", headers=admin_headers).json()
+        
+        assert self._walk(client, admin_headers, "/api/v1/bookings?limit=2") == [b["id"] for b in everything]
+    
+    def test_pages_stable_under_inserts(self, client, admin_headers, db, test_user, test_room):
+        """Test rows added on earlier pages do not shift the next page."""
+        self._add_bookings(db, test_user, test_room, 6)
+        first = client.get("/api/v1/bookings?limit=3", headers=admin_headers)
+        second_before = client.get(
+            f"/api/v1/bookings?limit=3&cursor={first.headers['X-Next-Cursor']}", headers=admin_headers
+        ).json()
+        
+        self._add_bookings(db, test_user, test_room, 3, day=20)  # Newer than everything
+        second_after = client.get(
+            f"/api/v1/bookings?limit=3&cursor={first.headers['X-Next-Cursor']}", headers=admin_headers
+        ).json()
+        
+        assert [b["id"] for b in second_after] == [b["id"] for b in second_before]
+    
+    def test_total_count_and_invalid_cursor(self, client, admin_headers, db, test_user, test_room):
+        """Test X-Total-Count is sent on request and bad cursors are rejected."""
+        self._add_bookings(db, test_user, test_room, 4)
+        
+        response = client.get("/api/v1/bookings?limit=2&include_total=true", headers=admin_headers)
+        invalid = client.get("/api/v1/bookings?cursor=not-a-cursor", headers=admin_headers)
+        
+        assert response.headers["X-Total-Count"] == "4"
+        assert invalid.status_code == status.HTTP_400_BAD_REQUEST
+
+
+class TestBookingsExport:
+    """Test cases for GET /api/v1/bookings/export."""
+    
+    def test_export_csv(self, client, admin_headers, test_booking):
+        """Test CSV export has a header row and one line per booking."""
+        import csv
+        response = client.get("/api/v1/bookings/export?format=csv", headers=admin_headers)
+        
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"].startswith("text/csv")
+        assert "attachment" in response.headers["content-disposition"]
+        rows = list(csv.DictReader(response.text.splitlines()))
+        assert [(row["id"], row["user_name"], row["status"]) for row in rows] == [
+            (test_booking.id, "John Doe", "Approved")
+        ]
+    
+    def test_export_ndjson_with_filters(self, client, admin_headers, test_booking):
+        """Test NDJSON export applies the list filters."""
+        import json
+        matching = client.get("/api/v1/bookings/export?format=ndjson&status=Approved", headers=admin_headers)
+        empty = client.get("/api/v1/bookings/export?format=ndjson&status=Pending", headers=admin_headers)
+        
+        records = [json.loads(line) for line in matching.text.splitlines()]
+        assert [(r["id"], r["date"], r["start_time"]) for r in records] == [
+            (test_booking.id, "2026-02-10", "09:00:00")
+        ]
+        assert empty.text == ""
+    
+    def test_export_requires_admin(self, client, auth_headers):
+        """Test regular users cannot export."""
+        response = client.get("/api/v1/bookings/export", headers=auth_headers)
+        
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+class TestBookingsConditionalGet:
+    """Test cases for ETag / If-None-Match on GET /api/v1/bookings."""
+    
+    def _create(self, client, headers, room_id, day):
+        response = client.post(
+            "/api/v1/bookings",
+            headers=headers,
+            json={
+                "room_id": room_id,
+                "date": day.isoformat(),
+                "start_time": "10:00",
+                "end_time": "11:00",
+                "title": "Planning",
+                "attendees": 3,
+                "priority": "Medium"
+            }
+        )
+        assert response.status_code == status.HTTP_201_CREATED
+    
+    def test_not_modified_until_write(self, client, admin_headers, test_booking):
+        """Test a matching If-None-Match gets 304 until a booking changes."""
+        first = client.get("/api/v1/bookings", headers=admin_headers)
+        etag = first.headers["ETag"]
+        
+        repeat = client.get("/api/v1/bookings", headers={**admin_headers, "If-None-Match": etag})
+        other_params = client.get("/api/v1/bookings?limit=5", headers={**admin_headers, "If-None-Match": etag})
+        client.patch(f"/api/v1/bookings/{test_booking.id}/cancel", headers=admin_headers)
+        after_write = client.get("/api/v1/bookings", headers={**admin_headers, "If-None-Match": etag})
+        
+        assert repeat.status_code == status.HTTP_304_NOT_MODIFIED
+        assert repeat.headers["ETag"] == etag
+        assert other_params.status_code == status.HTTP_200_OK
+        assert after_write.status_code == status.HTTP_200_OK
+        assert after_write.headers["ETag"] != etag
+    
+    def test_room_day_etag_ignores_other_rooms(self, client, auth_headers, db, test_room):
+        """Test a room and date range listing is unaffected by writes to another room."""
+        from app.models.room import Room
+        db.add(Room(id="other-room", name="Other", floor="2nd Floor", room_number="CR-201",
+                    capacity=4, features=[], is_active=True))
+        db.commit()
+        day = date.today() + timedelta(days=7)
+        url = f"/api/v1/bookings?room_id={test_room.id}&date_from={day}&date_to={day}"
+        etag = client.get(url, headers=auth_headers).headers["ETag"]
+        
+        self._create(client, auth_headers, "other-room", day)
+        unaffected = client.get(url, headers={**auth_headers, "If-None-Match": etag})
+        self._create(client, auth_headers, test_room.id, day)
+        affected = client.get(url, headers={**auth_headers, "If-None-Match": etag})
+        
+        assert unaffected.status_code == status.HTTP_304_NOT_MODIFIED
+        assert affected.status_code == status.HTTP_200_OK
+    
+    def test_schedule_cache_follows_writes(self, client, auth_headers, admin_headers, test_booking):
+        """Test regular users share cached schedule pages until a booking changes."""
+        from app.services.schedule_cache import ScheduleCache
+        first = client.get("/api/v1/bookings", headers=auth_headers).json()
+        client.get("/api/v1/bookings", headers=auth_headers)
+        client.patch(f"/api/v1/bookings/{test_booking.id}/cancel", headers=admin_headers)
+        after_cancel = client.get("/api/v1/bookings", headers=auth_headers).json()
+        
+        assert [b["id"] for b in first] == [test_booking.id]
+        assert after_cancel == []
+        assert ScheduleCache.stats()["hits"] == 1
+
+
+class TestBookingsChanges:
+    """Test cases for GET /api/v1/bookings/changes."""
+    
+    def test_changes_since_watermark(self, client, admin_headers, test_booking, test_room):
+        """Test created rows and deleted IDs are returned after a watermark."""
+        start = client.get("/api/v1/bookings/changes", headers=admin_headers).json()
+        created = client.post(
+            "/api/v1/bookings",
+            headers=admin_headers,
+            json={
+                "room_id": test_room.id,
+                "date": (date.today() + timedelta(days=3)).isoformat(),
+                "start_time": "14:00",
+                "end_time": "15:00",
+                "title": "Sync check",
+                "attendees": 2,
+                "priority": "Low"
+            }
+        ).json()
+        client.delete(f"/api/v1/bookings/{test_booking.id}", headers=admin_headers)
+        
+        response = client.get(f"/api/v1/bookings/changes?since={start['watermark']}", headers=admin_headers)
+        
+        assert start["reset"] is True
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["reset"] is False
+        assert created["id"] in [b["id"] for b in data["changed"]]
+        assert data["deleted"] == [test_booking.id]
+        assert data["watermark"]
+    
+    def test_hidden_bookings_reported_as_deleted(self, client, auth_headers, admin_headers, db, test_admin, test_room):
+        """Test a regular user is told to drop approved bookings that leave the schedule."""
+        from app.models.booking import Booking
+        db.add(Booking(id="BK-2030-7001", user_id=test_admin.id, room_id=test_room.id, date=date(2030, 1, 8),
+                       start_time=time(9, 0), end_time=time(10, 0), title="Board", attendees=3,
+                       priority="High", status="Approved"))
+        db.commit()
+        start = client.get("/api/v1/bookings/changes", headers=auth_headers).json()
+        client.patch("/api/v1/bookings/BK-2030-7001/cancel", headers=admin_headers)
+        
+        data = client.get(f"/api/v1/bookings/changes?since={start['watermark']}", headers=auth_headers).json()
+        
+        assert "BK-2030-7001" in data["deleted"]
+        assert "BK-2030-7001" not in [b["id"] for b in data["changed"]]
+    
+    def test_room_change_and_invalid_watermark(self, client, admin_headers, test_room):
+        """Test a room edit forces a reload and malformed watermarks are rejected."""
+        start = client.get("/api/v1/bookings/changes", headers=admin_headers).json()
+        client.put(f"/api/v1/rooms/{test_room.id}", headers=admin_headers, json={"name": "Renamed"})
+        
+        after = client.get(f"/api/v1/bookings/changes?since={start['watermark']}", headers=admin_headers).json()
+        invalid = client.get("/api/v1/bookings/changes?since=nope", headers=admin_headers)
+        
+        assert after["reset"] is True
+        assert invalid.status_code == status.HTTP_400_BAD_REQUEST
+
+
+class TestBookingsSparseFields:
+    """Test cases for fields= on GET /api/v1/bookings."""
+    
+    def test_calendar_fields(self, client, auth_headers, test_booking):
+        """Test only the requested fields are returned, with id added."""
+        full = client.get("/api/v1/bookings", headers=auth_headers)
+        sparse = client.get(
+            "/api/v1/bookings?fields=room_id,date,start_time,end_time,title,room_name",
+            headers=auth_headers
+        )
+        
+        assert sparse.status_code == status.HTTP_200_OK
+        assert sparse.json() == [{
+            key: full.json()[0][key]
+            for key in ("room_id", "date", "start_time", "end_time", "title", "id", "room_name")
+        }]
+        assert sparse.headers["ETag"] != full.headers["ETag"]
+        assert len(sparse.content) < len(full.content) / 2
+    
+    def test_unknown_field_rejected(self, client, auth_headers):
+        """Test fields outside BookingResponse are refused."""
+        response = client.get("/api/v1/bookings?fields=id,password_hash", headers=auth_headers)
+        
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -0,0 +1,77 @@
+"""
+Query-plan tests for the conflict check.
+Asserts the overlap query is answered from idx_booking_slot_approved alone.
+
+SQLite always runs. PostgreSQL and MySQL run when TEST_POSTGRES_URL /
+TEST_MYSQL_URL point at a scratch database (tables are created and dropped).
+"""
+import os
+import pytest
+from datetime import date, time
+from sqlalchemy import create_engine, select
+
+from app.variables.database import Base
+from app.models.booking import Booking
+from app.utils.intervals import to_minutes
+
+
+def _conflict_query():
+    """The ID-only overlap query issued by BookingService.get_conflicting_bookings."""
+    return select(Booking.id).where(
+        Booking.room_id == "test-room-id-789",
+        Booking.date == date(2026, 2, 10),
+        Booking.approved_only(),
+        Booking.start_min < to_minutes(time(10, 30)),
+        Booking.end_min > to_minutes(time(9, 30))
+    )
+
+
+def _explain(connection, prefix: str) -> str:
+    compiled = _conflict_query().compile(connection)
+    params = compiled.construct_params()
+    positional = tuple(params[name] for name in compiled.positiontup) if compiled.positional else params
+    rows = connection.exec_driver_sql(f"{prefix} {compiled}", positional).fetchall()
+    return "\n".join(" ".join(str(column) for column in row) for row in rows)
+
+
+@pytest.fixture
+def external_engine(request):
+    """Create the schema on an external database named by an env var."""
+    url = os.environ.get(request.param)
+    if not url:
+        pytest.skip(f"{request.param} not set")
+    engine = create_engine(url)
+    Base.metadata.create_all(bind=engine)
+    try:
+        yield engine
+    finally:
+        Base.metadata.drop_all(bind=engine)
+        engine.dispose()
+
+
+class TestConflictQueryPlans:
+    """Test the conflict check uses an index-only plan on each dialect."""
+
+    def test_sqlite_uses_covering_index(self, db, test_booking):
+        """Test SQLite searches the partial covering index."""
+        plan = _explain(db.connection(), "EXPLAIN QUERY PLAN")
+
+        assert "COVERING INDEX idx_booking_slot_approved" in plan
+
+    @pytest.mark.parametrize("external_engine", ["TEST_POSTGRES_URL"], indirect=True)
+    def test_postgres_uses_index_only_scan(self, external_engine):
+        """Test PostgreSQL plans an index-only scan on the partial index."""
+        with external_engine.connect() as connection:
+            connection.exec_driver_sql("SET enable_seqscan = off")
+            plan = _explain(connection, "EXPLAIN")
+
+        assert "Index Only Scan using idx_booking_slot_approved" in plan
+
+    @pytest.mark.parametrize("external_engine", ["TEST_MYSQL_URL"], indirect=True)
+    def test_mysql_uses_index_only_access(self, external_engine):
+        """Test MySQL reads only idx_booking_slot_status ('Using index')."""
+        with external_engine.connect() as connection:
+            plan = _explain(connection, "EXPLAIN")
+
+        assert "idx_booking_slot_status" in plan
+        assert "Using index" in plan
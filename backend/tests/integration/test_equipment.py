@@ -0,0 +1,69 @@
+"""
+Equipment module endpoint tests.
+Tests for /api/v1/equipment endpoints and equipment checks on bookings.
+"""
+import pytest
+from fastapi import status
+
+BOOKING = {"date": "2030-03-04", "start_time": "10:00:00", "end_time": "11:00:00", "attendees": 2}
+
+
+@pytest.fixture
+def projector(client, admin_headers):
+    """One projector in stock."""
+    return client.post(
+        "/api/v1/equipment",
+        headers=admin_headers,
+        json={"name": "Projector", "quantity": 1}
+    ).json()
+
+
+class TestEquipmentInventory:
+    """Test cases for equipment inventory endpoints."""
+    
+    def test_create_and_list(self, client, admin_headers, auth_headers, projector):
+        """Test admins add equipment and users can list it."""
+        response = client.get("/api/v1/equipment", headers=auth_headers)
+        
+        assert response.status_code == status.HTTP_200_OK
+        assert [(item["name"], item["quantity"]) for item in response.json()] == [("Projector", 1)]
+    
+    def test_duplicate_name_rejected(self, client, admin_headers, projector):
+        """Test names are unique regardless of case."""
+        response = client.post("/api/v1/equipment", headers=admin_headers, json={"name": "projector", "quantity": 3})
+        
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+    
+    def test_create_requires_admin(self, client, auth_headers):
+        """Test regular users cannot change the inventory."""
+        response = client.post("/api/v1/equipment", headers=auth_headers, json={"name": "Speaker", "quantity": 1})
+        
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+class TestEquipmentOnBookings:
+    """Test cases for equipment availability on booking create and utilization."""
+    
+    def test_booking_rejected_when_equipment_in_use(self, client, admin_headers, auth_headers, test_room, projector):
+        """Test the last projector cannot be requested twice for the same time."""
+        first = client.post(
+            "/api/v1/bookings",
+            headers=admin_headers,
+            json={**BOOKING, "room_id": test_room.id, "title": "Demo", "equipment": ["Projector"]}
+        ).json()
+        client.post(f"/api/v1/bookings/{first['id']}/approve", headers=admin_headers)
+        
+        response = client.post(
+            "/api/v1/bookings",
+            headers=auth_headers,
+            json={**BOOKING, "room_id": test_room.id, "title": "Review", "equipment": ["projector"],
+                  "start_time": "10:30:00", "end_time": "11:30:00"}
+        )
+        
+        assert response.status_code == status.HTTP_409_CONFLICT
+        assert "Projector (1 of 1 in use at 10:30" in response.json()["detail"]
+        
+        utilization = client.get("/api/v1/equipment/utilization?date=2030-03-04", headers=auth_headers).json()
+        assert [(item["name"], item["peak_in_use"], item["overcommitted"]) for item in utilization["equipment"]] == [
+            ("Projector", 1, False)
+        ]
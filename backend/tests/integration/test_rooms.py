@@ -3,6 +3,7 @@ Rooms module CRUD endpoint tests.
 Tests for /api/v1/rooms endpoints.
 """
 import pytest
+from datetime import date, time
 from fastapi import status
 
 
@@ -116,6 +117,29 @@ class TestRoomsRead:
         assert response.status_code == status.HTTP_200_OK
         data = response.json()
         assert isinstance(data, list)
+    
+    def test_list_rooms_not_modified(self, client, auth_headers, admin_headers, test_room):
+        """Test room listing answers If-None-Match with 304 until a room changes."""
+        etag = client.get("/api/v1/rooms", headers=auth_headers).headers["ETag"]
+        
+        cached = client.get("/api/v1/rooms", headers={**auth_headers, "If-None-Match": etag})
+        client.put(f"/api/v1/rooms/{test_room.id}", headers=admin_headers, json={"capacity": 12})
+        changed = client.get("/api/v1/rooms", headers={**auth_headers, "If-None-Match": etag})
+        
+        assert cached.status_code == status.HTTP_304_NOT_MODIFIED
+        assert changed.status_code == status.HTTP_200_OK
+        assert changed.json()[0]["capacity"] == 12
+    
+    def test_list_rooms_sparse_fields(self, client, auth_headers, test_room):
+        """Test fields= returns only the requested room fields."""
+        response = client.get("/api/v1/rooms?fields=name,features", headers=auth_headers)
+        
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == [{
+            "name": "Conference Room A",
+            "features": ["Projector", "Whiteboard", "Video Conference"],
+            "id": test_room.id
+        }]
 
 
 class TestRoomsUpdate:
@@ -228,3 +252,199 @@ class TestRoomsAvailability:
         
         # Availability endpoint might not exist yet, so we just check structure
         assert response.status_code in [status.HTTP_200_OK, status.HTTP_404_NOT_FOUND]
+    
+    def test_availability_free_intervals(self, client, auth_headers, test_booking):
+        """Test free intervals are split around an approved booking."""
+        response = client.get(
+            f"/api/v1/rooms/{test_booking.room_id}/availability?from=2026-02-10&to=2026-02-11&min_duration=30",
+            headers=auth_headers
+        )
+        
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["business_hours"] == ["08:00", "20:00"]
+        assert data["days"][0] == {
+            "date": "2026-02-10",
+            "free": [["08:00", "09:00"], ["10:00", "20:00"]]
+        }
+        assert data["days"][1]["free"] == [["08:00", "20:00"]]
+    
+    def test_availability_min_duration_filters_short_gaps(self, client, auth_headers, test_booking):
+        """Test gaps shorter than min_duration are omitted."""
+        response = client.get(
+            f"/api/v1/rooms/{test_booking.room_id}/availability?from=2026-02-10&min_duration=61",
+            headers=auth_headers
+        )
+        
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["days"][0]["free"] == [["10:00", "20:00"]]
+    
+    def test_availability_rejects_long_range(self, client, auth_headers, test_room):
+        """Test date ranges above the configured maximum are rejected."""
+        response = client.get(
+            f"/api/v1/rooms/{test_room.id}/availability?from=2026-01-01&to=2026-06-01",
+            headers=auth_headers
+        )
+        
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+class TestRoomsSearch:
+    """Test cases for GET /api/v1/rooms/search endpoint."""
+    
+    def _add_room(self, db, room_id, room_number, capacity, features):
+        from app.models.room import Room
+        
+        room = Room(
+            id=room_id,
+            name=f"Room {room_number}",
+            floor="2nd Floor",
+            room_number=room_number,
+            capacity=capacity,
+            features=features,
+            is_active=True
+        )
+        db.add(room)
+        db.commit()
+        return room
+    
+    def test_search_excludes_booked_rooms(self, client, auth_headers, db, test_booking):
+        """Test rooms with an overlapping approved booking are excluded."""
+        self._add_room(db, "free-room-1", "CR-201", 12, ["Projector"])
+        
+        response = client.get(
+            "/api/v1/rooms/search?date=2026-02-10&start_time=09:30&end_time=10:30",
+            headers=auth_headers
+        )
+        
+        assert response.status_code == status.HTTP_200_OK
+        assert [room["id"] for room in response.json()] == ["free-room-1"]
+    
+    def test_search_ranks_by_capacity_fit(self, client, auth_headers, db, test_room):
+        """Test smallest sufficient room is returned first."""
+        self._add_room(db, "big-room", "CR-202", 40, ["Projector", "Whiteboard"])
+        self._add_room(db, "small-room", "CR-203", 4, ["Projector"])
+        
+        response = client.get(
+            "/api/v1/rooms/search?date=2026-02-10&start_time=11:00&end_time=12:00"
+            "&min_capacity=8&features=projector",
+            headers=auth_headers
+        )
+        
+        assert response.status_code == status.HTTP_200_OK
+        assert [room["id"] for room in response.json()] == [test_room.id, "big-room"]
+    
+    def test_search_requires_all_features(self, client, auth_headers, db, test_room):
+        """Test every requested feature must be present."""
+        self._add_room(db, "plain-room", "CR-204", 10, ["Whiteboard"])
+        
+        response = client.get(
+            "/api/v1/rooms/search?date=2026-02-10&start_time=11:00&end_time=12:00"
+            "&features=Whiteboard&features=Video Conference",
+            headers=auth_headers
+        )
+        
+        assert response.status_code == status.HTTP_200_OK
+        assert [room["id"] for room in response.json()] == [test_room.id]
+
+
+class TestRoomsOccupancy:
+    """Test cases for GET /api/v1/rooms/occupancy endpoint."""
+    
+    def test_month_occupancy_bitset(self, client, auth_headers, test_booking):
+        """Test an approved 09:00-10:00 booking sets slots 36-39 on its day."""
+        import base64
+        
+        response = client.get(
+            "/api/v1/rooms/occupancy?month=2026-02&granularity=15",
+            headers=auth_headers
+        )
+        
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["days"] == 28
+        assert data["slots_per_day"] == 96
+        assert data["bytes_per_day"] == 12
+        
+        packed = base64.b64decode(data["rooms"][0]["occupancy"])
+        assert len(packed) == 28 * 12
+        day = int.from_bytes(packed[9 * 12:10 * 12], "little")  # 2026-02-10
+        assert day == 0b1111 << 36
+        assert int.from_bytes(packed[:9 * 12], "little") == 0
+    
+    def test_month_occupancy_rejects_bad_granularity(self, client, auth_headers):
+        """Test granularities that do not divide a day are rejected."""
+        response = client.get(
+            "/api/v1/rooms/occupancy?month=2026-02&granularity=7",
+            headers=auth_headers
+        )
+        
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+class TestRoomsEarliestAvailable:
+    """Test cases for GET /api/v1/rooms/earliest-available endpoint."""
+    
+    def _add_booking(self, db, test_user, room, booking_id, start, end):
+        from app.models.booking import Booking
+        
+        db.add(Booking(
+            id=booking_id,
+            user_id=test_user.id,
+            room_id=room.id,
+            date=date(2030, 3, 4),
+            start_time=start,
+            end_time=end,
+            title="Busy",
+            attendees=4,
+            priority="Medium",
+            status="Approved"
+        ))
+        db.commit()
+    
+    def test_earliest_across_rooms(self, client, auth_headers, db, test_user, test_room):
+        """Test options are merged across rooms in start order."""
+        from app.models.room import Room
+        
+        other = Room(id="other-room", name="Room CR-301", floor="3rd Floor", room_number="CR-301",
+                     capacity=20, features=["Whiteboard"], is_active=True)
+        db.add(other)
+        db.commit()
+        self._add_booking(db, test_user, test_room, "BK-2030-0001", time(8, 0), time(9, 0))
+        self._add_booking(db, test_user, other, "BK-2030-0002", time(8, 0), time(8, 30))
+        self._add_booking(db, test_user, other, "BK-2030-0003", time(9, 0), time(12, 0))
+        
+        response = client.get(
+            "/api/v1/rooms/earliest-available?duration=60&min_capacity=8&features=whiteboard"
+            "&from=2030-03-04&to=2030-03-04&limit=3",
+            headers=auth_headers
+        )
+        
+        assert response.status_code == status.HTTP_200_OK
+        options = [(item["room_id"], item["start_time"]) for item in response.json()]
+        assert options == [
+            (test_room.id, "09:00:00"),
+            ("other-room", "12:00:00")
+        ]
+    
+    def test_earliest_respects_capacity(self, client, auth_headers, test_room):
+        """Test rooms that are too small are never offered."""
+        response = client.get(
+            "/api/v1/rooms/earliest-available?duration=30&min_capacity=11&from=2030-03-04",
+            headers=auth_headers
+        )
+        
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == []
+    
+    def test_earliest_spills_into_next_day(self, client, auth_headers, db, test_user, test_room):
+        """Test a fully booked day moves the search to the next day."""
+        self._add_booking(db, test_user, test_room, "BK-2030-0004", time(8, 0), time(20, 0))
+        
+        response = client.get(
+            "/api/v1/rooms/earliest-available?duration=30&from=2030-03-04&limit=1",
+            headers=auth_headers
+        )
+        
+        assert response.status_code == status.HTTP_200_OK
+        assert [(item["date"], item["start_time"]) for item in response.json()] == [("2030-03-05", "08:00:00")]
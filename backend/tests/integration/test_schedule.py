@@ -0,0 +1,70 @@
+"""
+Schedule module endpoint tests.
+Tests for /api/v1/schedule endpoints.
+"""
+import pytest
+from fastapi import status
+from datetime import date, time
+
+from app.models.booking import Booking, BookingStatusEnum
+from app.models.room import Room
+
+DAY = date(2026, 2, 10)
+
+
+def _add_booking(db, user, room, booking_id, start, end, status=BookingStatusEnum.APPROVED):
+    db.add(Booking(
+        id=booking_id,
+        user_id=user.id,
+        room_id=room.id,
+        date=DAY,
+        start_time=start,
+        end_time=end,
+        title=f"Meeting {booking_id}",
+        attendees=2,
+        priority="Medium",
+        status=status
+    ))
+    db.commit()
+
+
+class TestScheduleGrid:
+    """Test cases for GET /api/v1/schedule/grid."""
+
+    def test_grid_rows_and_blocks(self, client, auth_headers, db, test_user, test_room, test_booking):
+        """Test each active room is a row with its approved blocks in start order."""
+        _add_booking(db, test_user, test_room, "BK-2026-5002", time(14, 0), time(15, 30))
+        _add_booking(db, test_user, test_room, "BK-2026-5003", time(11, 0), time(12, 0), BookingStatusEnum.PENDING)
+        db.add(Room(id="room-2", name="Huddle", floor="2nd Floor", room_number="HD-201",
+                    capacity=4, features=[], is_active=True))
+        db.commit()
+
+        response = client.get(f"/api/v1/schedule/grid?date={DAY}", headers=auth_headers)
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["columns"] == ["start_min", "end_min", "booking_id", "title"]
+        assert [(room["id"], room["blocks"]) for room in data["rooms"]] == [
+            (test_room.id, [[540, 600, test_booking.id, "Team Meeting"], [840, 930, "BK-2026-5002", "Meeting BK-2026-5002"]]),
+            ("room-2", [])
+        ]
+
+    def test_floor_filter_and_not_modified(self, client, auth_headers, test_room, test_booking):
+        """Test floor narrows the rows and If-None-Match answers 304."""
+        url = f"/api/v1/schedule/grid?date={DAY}&floor=2nd%20Floor"
+        first = client.get(url, headers=auth_headers)
+        repeat = client.get(url, headers={**auth_headers, "If-None-Match": first.headers["ETag"]})
+
+        assert first.json()["rooms"] == []
+        assert repeat.status_code == status.HTTP_304_NOT_MODIFIED
+
+    def test_grid_much_smaller_than_bookings(self, client, auth_headers, db, test_user, test_room):
+        """Test the grid payload is a fraction of the equivalent /bookings page."""
+        for hour in range(8, 20):
+            _add_booking(db, test_user, test_room, f"BK-2026-6{hour:03d}", time(hour, 0), time(hour, 45))
+
+        grid = client.get(f"/api/v1/schedule/grid?date={DAY}", headers=auth_headers)
+        bookings = client.get(f"/api/v1/bookings?date_from={DAY}&date_to={DAY}&limit=100", headers=auth_headers)
+
+        assert len(bookings.json()) == 12
+        assert len(grid.content) * 5 < len(bookings.content)
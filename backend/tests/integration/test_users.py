@@ -148,6 +148,16 @@ class TestUsersAdmin:
         assert isinstance(data, list)
         assert len(data) >= 1
     
+    def test_list_users_sparse_fields(self, client, admin_headers, test_user):
+        """Test fields= limits users to the requested fields."""
+        response = client.get("/api/v1/users/?fields=name,role", headers=admin_headers)
+        bad = client.get("/api/v1/users/?fields=password_hash", headers=admin_headers)
+        
+        assert response.status_code == status.HTTP_200_OK
+        assert all(set(user) == {"id", "name", "role"} for user in response.json())
+        assert {"id": test_user.id, "name": test_user.name, "role": "USER"} in response.json()
+        assert bad.status_code == status.HTTP_400_BAD_REQUEST
+    
     def test_list_all_users_as_regular_user(self, client, auth_headers):
         """Test regular user cannot list all users."""
         response = client.get(
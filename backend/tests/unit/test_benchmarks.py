@@ -0,0 +1,41 @@
+"""
+Smoke tests for the benchmark suite: seeding, one scenario and regression checks.
+"""
+import random
+
+from sqlalchemy import create_engine
+
+from benchmarks import engines, results, scenarios
+from benchmarks import seed as seeding
+
+
+def _row(p99_ms, engine="sql"):
+    return {"db": "sqlite", "size": 500, "engine": engine, "scenario": "create-check",
+            "queries": 10, "p50_ms": p99_ms / 2, "p99_ms": p99_ms, "mean_ms": p99_ms / 2, "qps": 100.0}
+
+
+class TestBenchmarks:
+    """Test cases for the benchmarks package."""
+
+    def test_seed_and_run_scenario(self, tmp_path):
+        """Test a small data set is seeded and every engine times a scenario."""
+        engine = create_engine(f"sqlite:///{tmp_path / 'bench.db'}")
+        try:
+            seeding.seed(engine, 500, random_seed=1)
+            assert seeding.seeded_size(engine) == 500
+
+            for conflict_engine in engines.select("all", "sqlite"):
+                with conflict_engine.activate():
+                    summary = scenarios.SCENARIOS["approve-check"](engine, 10, random.Random(1))
+                assert summary["p99_ms"] >= summary["p50_ms"] > 0
+        finally:
+            engine.dispose()
+
+    def test_compare_flags_p99_regressions(self):
+        """Test only rows slower than the tolerance are reported."""
+        baseline = {"results": [_row(1.0), _row(1.0, engine="index")]}
+        current = {"results": [_row(1.1), _row(2.0, engine="index")]}
+
+        _, regressions = results.compare(current, baseline, tolerance=0.25)
+
+        assert regressions == ["sqlite 500 index create-check"]
@@ -6,7 +6,7 @@ import pytest
 from datetime import date, time, timedelta
 from app.services.booking_service import BookingService
 from app.models.booking import Booking, BookingStatusEnum
-from app.schemas.booking import BookingCreate, BookingUpdate
+from app.schemas.booking import BookingCreate, BookingUpdate, BookingStatusUpdate
 
 
 class TestBookingServiceCreate:
@@ -175,3 +175,108 @@ class TestBookingServiceFilters:
         
         for booking in bookings:
             assert date_from <= booking.date <= date_to
+
+
+class TestBookingServiceSlotRange:
+    """Test the PostgreSQL slot range conflict expression."""
+    
+    def test_slot_overlaps_compiles_to_range_operator(self):
+        """Test the overlap expression uses tsrange and &&."""
+        from sqlalchemy.dialects import postgresql
+        
+        expression = Booking.slot_overlaps(date(2026, 2, 10), time(9, 0), time(10, 0))
+        sql = str(expression.compile(dialect=postgresql.dialect()))
+        
+        assert "bookings.slot &&" in sql
+        assert "tsrange(" in sql
+    
+    def test_slot_range_disabled_off_postgres(self, db):
+        """Test SQLite sessions never use the slot range path."""
+        assert BookingService._uses_slot_range(db) is False
+
+
+class TestApprovalOptimizer:
+    """Test weighted interval scheduling for bulk approval."""
+    
+    def test_select_max_weight_beats_greedy(self):
+        """Test the optimum can skip the heaviest single interval."""
+        from app.services.approval_service import ApprovalService
+        
+        chosen = ApprovalService.select_max_weight([
+            (0, 100, 5.0, "long"),
+            (0, 50, 3.0, "first-half"),
+            (50, 100, 3.0, "second-half"),
+        ])
+        
+        assert chosen == ["first-half", "second-half"]
+    
+    def test_select_max_weight_empty(self):
+        """Test no intervals yields no selection."""
+        from app.services.approval_service import ApprovalService
+        
+        assert ApprovalService.select_max_weight([]) == []
+
+
+class TestConflictCounters:
+    """Test maintained conflict_count and booking_conflicts."""
+    
+    def _request(self, db, test_user, test_booking, start=time(9, 30), end=time(10, 30)):
+        return BookingService.create(db, test_user.id, BookingCreate(
+            room_id=test_booking.room_id,
+            date=test_booking.date,
+            start_time=start,
+            end_time=end,
+            title="Overlapping Request",
+            attendees=3
+        ))
+    
+    def test_create_counts_conflicts(self, db, test_user, test_booking):
+        """Test a new pending request records the approved booking it overlaps."""
+        from app.services.conflict_service import ConflictService
+        
+        pending = self._request(db, test_user, test_booking)
+        
+        assert pending.conflict_count == 1
+        assert [b.id for b in ConflictService.get_recorded_conflicts(db, pending.id)] == [test_booking.id]
+    
+    def test_cancel_and_update_clear_conflicts(self, db, test_user, test_booking):
+        """Test counters follow changes to either side of the overlap."""
+        pending = self._request(db, test_user, test_booking)
+        
+        BookingService.cancel(db, test_booking.id)
+        db.refresh(pending)
+        assert pending.conflict_count == 0
+        
+        BookingService.update_status(db, test_booking.id, BookingStatusUpdate(status="Approved"))
+        db.refresh(pending)
+        assert pending.conflict_count == 1
+        
+        BookingService.update(db, pending.id, BookingUpdate(start_time=time(11, 0), end_time=time(12, 0)))
+        db.refresh(pending)
+        assert pending.conflict_count == 0
+    
+    def test_contested_filter(self, db, test_user, test_booking):
+        """Test the pending queue splits on conflict_count."""
+        contested = self._request(db, test_user, test_booking)
+        clean = self._request(db, test_user, test_booking, start=time(15, 0), end=time(16, 0))
+        
+        assert [b.id for b in BookingService.get_all(db, contested=True)] == [contested.id]
+        assert [b.id for b in BookingService.get_all(db, contested=False)] == [clean.id]
+    
+    def test_verify_detects_and_repairs_drift(self, db, test_user, test_booking):
+        """Test writes that bypass the services are reported and repaired."""
+        from app.services.conflict_service import ConflictService
+        
+        pending = self._request(db, test_user, test_booking)
+        db.query(Booking).filter(Booking.id == test_booking.id).update(
+            {Booking.status: BookingStatusEnum.REJECTED}, synchronize_session=False
+        )
+        db.commit()
+        
+        result = ConflictService.verify_conflict_counts(db, repair=True)
+        
+        assert result["drifted"] == [pending.id]
+        assert result["repaired"] == 1
+        db.refresh(pending)
+        assert pending.conflict_count == 0
+        assert ConflictService.verify_conflict_counts(db)["drift_count"] == 0
@@ -0,0 +1,140 @@
+"""
+Unit tests for the in-memory conflict index.
+"""
+import random
+import pytest
+from datetime import date, time
+
+from app.services.booking_service import BookingService
+from app.services.conflict_index import ConflictIndex
+from app.models.booking import Booking, BookingStatusEnum
+from app.schemas.booking import BookingStatusUpdate
+from app.utils.intervals import IntervalSet
+
+
+BOOKING_DATE = date(2026, 2, 10)
+
+
+@pytest.fixture
+def conflict_index():
+    """Enable the conflict index for a single test."""
+    ConflictIndex.set_enabled(True)
+    yield ConflictIndex
+    ConflictIndex.set_enabled(False)
+
+
+def _add_booking(db, room, user, booking_id, start, end, status=BookingStatusEnum.APPROVED):
+    booking = Booking(
+        id=booking_id,
+        user_id=user.id,
+        room_id=room.id,
+        date=BOOKING_DATE,
+        start_time=start,
+        end_time=end,
+        title="Sync",
+        attendees=2,
+        priority="Medium",
+        status=status
+    )
+    db.add(booking)
+    db.commit()
+    return booking
+
+
+class TestIntervalSet:
+    """Test the augmented interval structure."""
+
+    def test_overlapping_matches_brute_force(self):
+        """Test overlap queries against a linear scan."""
+        rng = random.Random(7)
+        items = []
+        for key in range(200):
+            start = rng.randrange(0, 1400)
+            items.append((start, start + rng.randrange(1, 120), key))
+        intervals = IntervalSet(items)
+
+        for _ in range(300):
+            start = rng.randrange(0, 1400)
+            end = start + rng.randrange(1, 180)
+            expected = {key for s, e, key in items if s < end and e > start}
+            assert set(intervals.overlapping(start, end)) == expected
+
+    def test_touching_intervals_do_not_overlap(self):
+        """Test half-open semantics at the boundaries."""
+        intervals = IntervalSet([(540, 600, "a")])
+
+        assert intervals.overlapping(600, 660) == []
+        assert intervals.overlapping(480, 540) == []
+        assert intervals.overlapping(599, 601) == ["a"]
+
+    def test_add_and_remove(self):
+        """Test mutations are reflected in later queries."""
+        intervals = IntervalSet()
+        intervals.add(540, 600, "a")
+        intervals.add(560, 620, "b")
+
+        assert set(intervals.overlapping(590, 595)) == {"a", "b"}
+        assert intervals.remove("a") is True
+        assert intervals.remove("a") is False
+        assert intervals.overlapping(590, 595) == ["b"]
+
+
+class TestConflictIndex:
+    """Test index-backed conflict detection."""
+
+    def test_lookup_matches_sql_path(self, db, test_booking, conflict_index):
+        """Test indexed conflicts equal the SQL results."""
+        indexed = BookingService.get_conflicting_bookings(
+            db, test_booking.room_id, test_booking.date, time(9, 30), time(10, 30)
+        )
+
+        assert [b.id for b in indexed] == [test_booking.id]
+        assert conflict_index.stats()["room_days"] == 1
+
+    def test_disabled_index_falls_back(self, db, test_booking):
+        """Test lookup returns None when the index is disabled."""
+        assert ConflictIndex.lookup(
+            db, test_booking.room_id, test_booking.date, time(9, 0), time(10, 0)
+        ) is None
+
+    def test_cancel_removes_interval(self, db, test_booking, conflict_index):
+        """Test cancelling an approved booking updates a warm room-day."""
+        BookingService.get_conflicting_bookings(
+            db, test_booking.room_id, test_booking.date, time(9, 0), time(10, 0)
+        )
+
+        BookingService.cancel(db, test_booking.id)
+
+        assert BookingService.get_conflicting_bookings(
+            db, test_booking.room_id, test_booking.date, time(9, 0), time(10, 0)
+        ) == []
+
+    def test_approval_adds_interval(self, db, test_user, test_room, conflict_index):
+        """Test approving a pending booking updates a warm room-day."""
+        pending = _add_booking(
+            db, test_room, test_user, "BK-2026-2001", time(13, 0), time(14, 0),
+            status=BookingStatusEnum.PENDING
+        )
+        assert BookingService.get_conflicting_bookings(
+            db, test_room.id, BOOKING_DATE, time(13, 30), time(15, 0)
+        ) == []
+
+        BookingService.update_status(
+            db, pending.id, BookingStatusUpdate(status=BookingStatusEnum.APPROVED)
+        )
+
+        conflicts = BookingService.get_conflicting_bookings(
+            db, test_room.id, BOOKING_DATE, time(13, 30), time(15, 0)
+        )
+        assert [b.id for b in conflicts] == [pending.id]
+
+    def test_verify_detects_and_repairs_drift(self, db, test_user, test_room, conflict_index):
+        """Test the self-check flags writes the index did not see."""
+        BookingService.get_conflicting_bookings(db, test_room.id, BOOKING_DATE, time(8, 0), time(9, 0))
+        _add_booking(db, test_room, test_user, "BK-2026-2002", time(8, 0), time(9, 0))
+
+        report = conflict_index.verify(db, repair=True)
+
+        assert report["consistent"] is False
+        assert report["mismatches"][0]["missing"] == ["BK-2026-2002"]
+        assert conflict_index.verify(db)["consistent"] is True
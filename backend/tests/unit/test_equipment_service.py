@@ -0,0 +1,94 @@
+"""
+Unit tests for EquipmentService and the sweep-line peak counter.
+"""
+import pytest
+from datetime import date, time
+
+from app.models.booking import Booking, BookingStatusEnum
+from app.models.equipment import EquipmentType
+from app.services.equipment_service import EquipmentService
+from app.utils.intervals import peak_overlap
+
+DAY = date(2026, 2, 10)
+
+
+@pytest.fixture
+def projectors(db):
+    """Two projectors in stock."""
+    equipment = EquipmentType(name="Projector", quantity=2)
+    db.add(equipment)
+    db.commit()
+    return equipment
+
+
+def _add_booking(db, user, room, booking_id, start, end, equipment, status=BookingStatusEnum.APPROVED):
+    db.add(Booking(
+        id=booking_id,
+        user_id=user.id,
+        room_id=room.id,
+        date=DAY,
+        start_time=start,
+        end_time=end,
+        title=booking_id,
+        attendees=2,
+        priority="Medium",
+        status=status,
+        equipment=equipment
+    ))
+    db.commit()
+
+
+class TestPeakOverlap:
+    """Test cases for peak_overlap."""
+    
+    def test_peak_and_window(self):
+        """Test the peak level and the first stretch that reaches it."""
+        assert peak_overlap([(540, 600, 1), (570, 660, 1), (590, 620, 2)]) == (4, 590, 600)
+    
+    def test_touching_intervals_do_not_overlap(self):
+        """Test back-to-back uses never count as concurrent."""
+        assert peak_overlap([(540, 600, 1), (600, 660, 1)]) == (1, 540, 660)
+    
+    def test_empty(self):
+        """Test no intervals means no peak."""
+        assert peak_overlap([]) == (0, None, None)
+
+
+class TestEquipmentAvailability:
+    """Test cases for EquipmentService availability checks."""
+    
+    def test_shortage_when_stock_in_use(self, db, test_user, test_room, projectors):
+        """Test a request fails only where both projectors are already out."""
+        _add_booking(db, test_user, test_room, "BK-2026-7001", time(9, 0), time(11, 0), ["Projector"])
+        _add_booking(db, test_user, test_room, "BK-2026-7002", time(10, 0), time(12, 0), ["projector"])
+        _add_booking(db, test_user, test_room, "BK-2026-7003", time(9, 0), time(12, 0), ["Projector"],
+                     status=BookingStatusEnum.PENDING)
+        
+        shortages = EquipmentService.check_availability(db, DAY, time(10, 30), time(11, 30), ["Projector"])
+        free = EquipmentService.check_availability(db, DAY, time(11, 0), time(12, 0), ["Projector", "Whiteboard"])
+        
+        assert shortages == [{
+            "name": "Projector", "quantity": 2, "requested": 1, "in_use": 2, "at": time(10, 30)
+        }]
+        assert free == []
+    
+    def test_excluded_booking_not_counted(self, db, test_user, test_room, projectors):
+        """Test an edited booking does not compete with itself."""
+        _add_booking(db, test_user, test_room, "BK-2026-7101", time(9, 0), time(10, 0), ["Projector", "Projector"])
+        
+        assert EquipmentService.check_availability(db, DAY, time(9, 0), time(10, 0), ["Projector"])
+        assert not EquipmentService.check_availability(
+            db, DAY, time(9, 0), time(10, 0), ["Projector", "Projector"], exclude_booking_id="BK-2026-7101"
+        )
+    
+    def test_utilization(self, db, test_user, test_room, projectors):
+        """Test the daily report gives peaks, overcommitment and untracked items."""
+        _add_booking(db, test_user, test_room, "BK-2026-7201", time(9, 0), time(11, 0), ["Projector", "Projector"])
+        _add_booking(db, test_user, test_room, "BK-2026-7202", time(10, 0), time(10, 30), ["Projector", "Speaker"])
+        
+        report = EquipmentService.get_utilization(db, DAY)
+        
+        [usage] = report["equipment"]
+        assert (usage["bookings"], usage["peak_in_use"], usage["overcommitted"]) == (2, 3, True)
+        assert (usage["peak_start"], usage["peak_end"]) == (time(10, 0), time(10, 30))
+        assert report["untracked"] == ["speaker"]
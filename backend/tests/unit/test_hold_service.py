@@ -0,0 +1,59 @@
+"""
+Unit tests for HoldService.
+"""
+import pytest
+from datetime import date, time, timedelta
+
+from app.core.config import settings
+from app.services.hold_service import HoldService
+
+DAY = date(2026, 2, 10)
+
+
+@pytest.fixture(params=["memory", "database"])
+def backend(request, monkeypatch, db, test_user, test_admin, test_room):
+    """Run each test against both hold backends."""
+    monkeypatch.setattr(settings, "HOLD_BACKEND", request.param)
+    return request.param
+
+
+class TestHoldService:
+    """Test cases for slot holds."""
+    
+    def test_overlapping_hold_blocked(self, backend, db, test_user, test_admin, test_room):
+        """Test a second user cannot hold an overlapping slot."""
+        hold, _ = HoldService.place(db, test_admin.id, test_room.id, DAY, time(14, 0), time(15, 0), 60)
+        other, blocking = HoldService.place(db, test_user.id, test_room.id, DAY, time(14, 30), time(16, 0), 60)
+        
+        assert hold is not None
+        assert other is None
+        assert [item.id for item in blocking] == [hold.id]
+    
+    def test_adjacent_and_own_holds_allowed(self, backend, db, test_user, test_admin, test_room):
+        """Test back-to-back holds and a user's own overlapping holds do not block."""
+        HoldService.place(db, test_admin.id, test_room.id, DAY, time(14, 0), time(15, 0), 60)
+        
+        adjacent, _ = HoldService.place(db, test_user.id, test_room.id, DAY, time(15, 0), time(16, 0), 60)
+        own, _ = HoldService.place(db, test_admin.id, test_room.id, DAY, time(14, 30), time(15, 0), 60)
+        
+        assert adjacent is not None
+        assert own is not None
+    
+    def test_expired_hold_ignored(self, backend, db, test_user, test_admin, test_room, monkeypatch):
+        """Test holds stop blocking once they expire."""
+        HoldService.place(db, test_admin.id, test_room.id, DAY, time(14, 0), time(15, 0), 30)
+        
+        later = HoldService._now() + timedelta(seconds=31)
+        monkeypatch.setattr(HoldService, "_now", staticmethod(lambda: later))
+        
+        assert HoldService.blocking(db, test_room.id, DAY, time(14, 0), time(15, 0), test_user.id) == []
+        assert HoldService.count_for_user(db, test_admin.id) == 0
+    
+    def test_busy_intervals_excludes_viewer(self, backend, db, test_user, test_admin, test_room):
+        """Test busy intervals skip the viewer's own holds."""
+        HoldService.place(db, test_admin.id, test_room.id, DAY, time(14, 0), time(15, 0), 60)
+        
+        assert HoldService.busy_intervals(db, DAY, DAY, exclude_user_id=test_user.id) == {
+            (test_room.id, DAY): [(14 * 60, 15 * 60)]
+        }
+        assert HoldService.busy_intervals(db, DAY, DAY, exclude_user_id=test_admin.id) == {}
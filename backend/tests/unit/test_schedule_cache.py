@@ -0,0 +1,77 @@
+"""
+Unit tests for the single-flight approved-schedule cache.
+"""
+import threading
+import time
+
+import pytest
+
+from app.core.config import settings
+from app.services.schedule_cache import ScheduleCache
+
+
+def test_hit_until_versions_change():
+    """Test an entry is served while its versions match and reloaded after."""
+    loads = []
+    load = lambda: loads.append(1) or [{"id": len(loads)}]
+    key = ScheduleCache.make_key(room_id="r1", date_from=None, limit=20)
+
+    first = ScheduleCache.get_or_load(key, {"bookings": 1}, load)
+    second = ScheduleCache.get_or_load(ScheduleCache.make_key(limit=20, room_id="r1"), {"bookings": 1}, load)
+    third = ScheduleCache.get_or_load(key, {"bookings": 2}, load)
+
+    assert first is second
+    assert third == [{"id": 2}]
+    assert ScheduleCache.stats()["hits"] == 1
+    assert ScheduleCache.stats()["misses"] == 2
+
+
+def test_concurrent_misses_share_one_load():
+    """Test parallel misses for one key wait on a single load."""
+    calls = []
+
+    def load():
+        calls.append(1)
+        time.sleep(0.05)
+        return [{"id": "BK-1"}]
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(ScheduleCache.get_or_load("k", {"bookings": 1}, load)))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert len(results) == 8 and all(rows is results[0] for rows in results)
+    assert ScheduleCache.stats()["coalesced"] == 7
+
+
+def test_failed_load_is_not_cached():
+    """Test an error reaches the caller and the next request retries."""
+    def broken():
+        raise RuntimeError("database down")
+
+    with pytest.raises(RuntimeError):
+        ScheduleCache.get_or_load("k", {}, broken)
+
+    assert ScheduleCache.get_or_load("k", {}, lambda: []) == []
+    assert ScheduleCache.stats()["in_flight"] == 0
+
+
+def test_lru_eviction(monkeypatch):
+    """Test the least recently used page is evicted past the bound."""
+    monkeypatch.setattr(settings, "SCHEDULE_CACHE_MAX_ENTRIES", 2)
+    for key in ("a", "b"):
+        ScheduleCache.get_or_load(key, {}, lambda: [])
+    ScheduleCache.get_or_load("a", {}, lambda: [])  # Touch "a"
+    ScheduleCache.get_or_load("c", {}, lambda: [])
+
+    reloaded = []
+    ScheduleCache.get_or_load("b", {}, lambda: reloaded.append(1) or [])
+
+    assert reloaded == [1]
+    assert ScheduleCache.stats()["evictions"] == 2
@@ -0,0 +1,53 @@
+"""
+Unit tests for the fast list serialization path.
+"""
+import json
+from datetime import date, datetime, time, timezone
+from typing import List
+
+import pytest
+from pydantic import TypeAdapter
+
+from app.api.v1.bookings import BOOKING_RESPONSE_FIELDS
+from app.models.booking import BookingStatusEnum, PriorityEnum
+from app.schemas.booking import BookingBase, BookingResponse
+from app.utils import serialization
+
+ROW = {
+    "id": "BK-2026-0001",
+    "user_id": "user-1",
+    "room_id": "room-1",
+    "date": date(2026, 2, 10),
+    "start_time": time(9, 30),
+    "end_time": time(10, 0),
+    "title": "Standup",
+    "attendees": 4,
+    "description": None,
+    "priority": PriorityEnum.HIGH,
+    "equipment": None,
+    "status": BookingStatusEnum.APPROVED,
+    "notes": None,
+    "conflict_count": 0,
+    "series_id": None,
+    "created_at": datetime(2026, 2, 1, 8, 0, 0, 123456, tzinfo=timezone.utc),
+    "updated_at": datetime(2026, 2, 1, 8, 0),
+    "user_name": "John Doe",
+    "room_name": "Conference Room A",
+}
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_matches_response_model(monkeypatch, use_orjson):
+    """Test fast output equals validated BookingResponse output, with and without orjson."""
+    if not use_orjson:
+        monkeypatch.setattr(serialization, "orjson", None)
+    elif serialization.orjson is None:
+        pytest.skip("orjson is not installed")
+    adapter = TypeAdapter(List[BookingResponse])
+
+    response = serialization.rows_response(
+        [ROW], BOOKING_RESPONSE_FIELDS, normalizers={"equipment": BookingBase.normalize_equipment}
+    )
+
+    assert response.body == adapter.dump_json(adapter.validate_python([ROW]))
+    assert json.loads(response.body)[0]["equipment"] == []